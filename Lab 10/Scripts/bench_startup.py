@@ -0,0 +1,59 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+HERE = Path(__file__).parent
+
+# Usage: wall-clock of one fresh interpreter running `cmd` (includes interpreter startup + imports)
+def _time_once(cmd: List[str]) -> float:
+    t0 = time.perf_counter()
+    subprocess.run(cmd, cwd=HERE, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+# Usage: median/min over `repeat` fresh processes
+def _measure(cmd: List[str], repeat: int) -> Dict[str, float]:
+    _time_once(cmd)  # warm the OS page cache and __pycache__
+    samples = [_time_once(cmd) for _ in range(repeat)]
+    return {"median_s": statistics.median(samples), "min_s": min(samples)}
+
+# Usage: compare bare interpreter, CLI import cost, and end-to-end runs with/without plots
+def run_benchmark(data: str, generations: int, repeat: int) -> Dict[str, Dict[str, float]]:
+    py = sys.executable
+    with tempfile.TemporaryDirectory() as tmp:
+        common = ["main.py", "--data", data, "--generations", str(generations),
+                  "--outdir", tmp, "--store", ""]
+        return {
+            "interpreter": _measure([py, "-c", "pass"], repeat),
+            "import_main": _measure([py, "-c", "import main"], repeat),
+            "import_main_with_plotting": _measure([py, "-c", "import main, visualize"], repeat),
+            "run_no_plots": _measure([py] + common + ["--no-plots"], repeat),
+            "run_with_plots": _measure([py] + common, repeat),
+        }
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Startup-latency benchmark for the Lab 10 CLI")
+    p.add_argument("--data", type=str, default=str(HERE.parent / "Dataset" / "berlin52.tsp"))
+    p.add_argument("--generations", type=int, default=0,
+                   help="GA generations per run (0 isolates startup + parse + plotting)")
+    p.add_argument("--repeat", type=int, default=10)
+    p.add_argument("--json", action="store_true", help="Print raw JSON instead of a table")
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    results = run_benchmark(args.data, args.generations, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'case':<28}{'median (ms)':>14}{'min (ms)':>12}")
+    for case, r in results.items():
+        print(f"{case:<28}{r['median_s'] * 1e3:>14.1f}{r['min_s'] * 1e3:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
-from typing import List, Tuple, Dict
+from typing import Callable, List, Tuple, Dict, Optional
 from tsp_parser import TSPProblem
 from individual import Individual
 from selection import TournamentSelection, RouletteSelection
 from crossover import OrderCrossover
 from mutation import Mutator
+from utils import perturb_tour
 
 # Usage: wire selection/crossover/mutation; run evolution with elitism & patience
 class GeneticAlgorithm:
@@ -17,13 +18,17 @@ class GeneticAlgorithm:
         mutation_rate: float = 0.15,
         elitism: int = 2,
         max_generations: int = 800,
-        patience: int = 80
+        patience: int = 80,
+        seed_tours: Optional[List[List[int]]] = None,
+        warm_fraction: float = 0.5
     ):
         self.problem = problem
         self.pop_size = pop_size
         self.elitism = max(0, elitism)
         self.max_generations = max_generations
         self.patience = patience
+        self.seed_tours = [t[:] for t in (seed_tours or []) if sorted(t) == list(range(problem.n_cities))]
+        self.warm_fraction = min(max(warm_fraction, 0.0), 1.0)
 
         if selection_method == "tournament":
             self.selector = TournamentSelection(k=tournament_k)
@@ -32,9 +37,20 @@ class GeneticAlgorithm:
         self.crosser = OrderCrossover(rate=crossover_rate)
         self.mutator = Mutator(rate=mutation_rate)
 
-    # Usage: create initial random population of size pop_size
+    # Usage: create initial population; warm start = stored tours + their perturbations, rest random
     def _init_population(self) -> List[Individual]:
-        return [Individual.random(self.problem) for _ in range(self.pop_size)]
+        population: List[Individual] = []
+        if self.seed_tours:
+            n_warm = max(len(self.seed_tours), int(self.pop_size * self.warm_fraction))
+            n_warm = min(n_warm, self.pop_size)
+            population = [Individual(t, self.problem) for t in self.seed_tours[:n_warm]]
+            i = 0
+            while len(population) < n_warm:
+                base = self.seed_tours[i % len(self.seed_tours)]
+                population.append(Individual(perturb_tour(base, kicks=1 + i % 3), self.problem))
+                i += 1
+        population += [Individual.random(self.problem) for _ in range(self.pop_size - len(population))]
+        return population
     
     # Usage: elitism carry-over, then breed via select→crossover→mutation to refill
     def _next_generation(self, population: List[Individual]) -> List[Individual]:
@@ -54,8 +70,16 @@ class GeneticAlgorithm:
         return new_pop
 
     # Usage: main loop; track best/avg and stop on max_generations or no-improvement
-    def run(self) -> Tuple[Individual, Dict[str, List[float]]]:
-        population = self._init_population()
+    #        (pass population/max_generations to continue evolving an existing population;
+    #        on_generation(gen, best, improved) is called every generation and may return True to stop)
+    def run(self, population: Optional[List[Individual]] = None,
+            max_generations: Optional[int] = None,
+            on_generation: Optional[Callable[[int, Individual, bool], bool]] = None
+            ) -> Tuple[Individual, Dict[str, List[float]]]:
+        if population is None:
+            population = self._init_population()
+        if max_generations is None:
+            max_generations = self.max_generations
         best = min(population, key=lambda ind: ind.fitness).copy()
 
         fitnesses = [ind.fitness for ind in population]
@@ -68,10 +92,11 @@ class GeneticAlgorithm:
         }
 
         best_streak = 0
-        for _ in range(1, self.max_generations + 1):
+        for gen in range(1, max_generations + 1):
             fitnesses = [ind.fitness for ind in population]
             gen_best = min(population, key=lambda ind: ind.fitness)
-            if gen_best.fitness < best.fitness:
+            improved = gen_best.fitness < best.fitness
+            if improved:
                 best = gen_best.copy()
                 best_streak = 0
             else:
@@ -82,8 +107,57 @@ class GeneticAlgorithm:
 
             if self.patience and best_streak >= self.patience:
                 break
+            if on_generation is not None and on_generation(gen, best, improved):
+                break
 
             population = self._next_generation(population)
 
+        self.population = population
         return best, history
 
+    # Usage: add a city to the problem, repair every tour by cheapest insertion, keep evolving
+    def insert_city(self, x: float, y: float, generations: int = 50) -> Tuple[Individual, Dict[str, List[float]]]:
+        population = self._require_population()
+        new = self.problem.add_city(x, y)
+        dmat = self.problem.dist
+        drow = dmat[new]
+        repaired: List[Individual] = []
+        for ind in population:
+            g = ind.genes
+            best_pos, best_delta = 0, float("inf")
+            for i in range(len(g)):
+                a, b = g[i - 1], g[i]
+                delta = drow[a] + drow[b] - dmat[a][b]
+                if delta < best_delta:
+                    best_pos, best_delta = i, delta
+            genes = g[:best_pos] + [new] + g[best_pos:]
+            repaired.append(Individual.with_fitness(genes, self.problem, ind.fitness + best_delta))
+        return self.run(population=repaired, max_generations=generations)
+
+    # Usage: delete a city from the problem, splice it out of every tour, keep evolving
+    def remove_city(self, idx: int, generations: int = 50) -> Tuple[Individual, Dict[str, List[float]]]:
+        population = self._require_population()
+        dmat = self.problem.dist
+        repaired_genes: List[Tuple[List[int], float]] = []
+        for ind in population:
+            g = ind.genes[:]
+            pos = g.index(idx)
+            a, b = g[pos - 1], g[(pos + 1) % len(g)]
+            delta = dmat[a][b] - dmat[a][idx] - dmat[idx][b]
+            del g[pos]
+            repaired_genes.append((g, ind.fitness + delta))
+        moved = self.problem.remove_city(idx)
+        repaired: List[Individual] = []
+        for g, fitness in repaired_genes:
+            if moved != idx:
+                g[g.index(moved)] = idx
+            repaired.append(Individual.with_fitness(g, self.problem, fitness))
+        return self.run(population=repaired, max_generations=generations)
+
+    # Usage: incremental updates need the population left behind by a previous run()
+    def _require_population(self) -> List[Individual]:
+        population = getattr(self, "population", None)
+        if not population:
+            raise RuntimeError("call run() before inserting or removing cities")
+        return population
+
@@ -26,6 +26,15 @@ class Individual:
         clone.fitness = self.fitness
         return clone
     
+    # Usage: wrap genes whose tour length is already known (e.g. updated by an O(1) delta)
+    @staticmethod
+    def with_fitness(genes: List[int], problem: TSPProblem, fitness: float) -> "Individual":
+        ind = Individual.__new__(Individual)
+        ind.genes = genes
+        ind.problem = problem
+        ind.fitness = fitness
+        return ind
+
     # Usage: create a random valid permutation over all cities
     @staticmethod
     def random(problem: TSPProblem) -> "Individual":
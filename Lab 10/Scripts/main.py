@@ -2,7 +2,6 @@ import argparse
 from pathlib import Path
 from tsp_parser import TSPLIBParser
 from genetics import GeneticAlgorithm
-from visualize import Visualizer
 from utils import set_seed
 
 # Usage: expose CLI flags for data/hyperparams/paths suitable for berlin52 defaults
@@ -20,6 +19,15 @@ def parse_args():
     p.add_argument("--patience", type=int, default=80, help="Early stop if no improvement for N generations")
     p.add_argument("--seed", type=int, default=42)
     p.add_argument("--outdir", type=str, default=str(Path(__file__).parent / "outputs"))
+    p.add_argument("--no-plots", dest="plots", action="store_false",
+                   help="Skip SVG plots (matplotlib is then never imported)")
+    p.add_argument("--store", type=str, default=str(Path(__file__).parent / "outputs" / "solutions.sqlite"),
+                   help="SQLite best-known-solution store (empty string disables)")
+    p.add_argument("--warm_start", action="store_true",
+                   help="Seed the initial population with stored tours and perturbations of them")
+    p.add_argument("--warm_k", type=int, default=5, help="Number of stored tours to seed from")
+    p.add_argument("--warm_fraction", type=float, default=0.5,
+                   help="Fraction of the initial population derived from stored tours")
     return p.parse_args()
 
 # Usage: end-to-end run: seed → parse data → GA → SVG plots → print summary
@@ -28,10 +36,18 @@ def main():
     set_seed(args.seed)
 
     outdir = Path(args.outdir)
-    outdir.mkdir(parents=True, exist_ok=True)
 
     problem = TSPLIBParser.from_file(args.data)
 
+    store = None
+    if args.store:
+        from solution_store import SolutionStore  # sqlite3 is only loaded when a store is used
+        store = SolutionStore(args.store)
+    seed_tours = []
+    if store and args.warm_start:
+        seed_tours = [tour for _, tour in store.best(problem, k=args.warm_k)]
+        print(f"Warm start: {len(seed_tours)} stored tour(s) for {problem.name}")
+
     # Runningt Genetic ALgorithm
     ga = GeneticAlgorithm(
         problem=problem,
@@ -42,11 +58,38 @@ def main():
         mutation_rate=args.mutation_rate,
         elitism=args.elitism,
         max_generations=args.generations,
-        patience=args.patience
+        patience=args.patience,
+        seed_tours=seed_tours,
+        warm_fraction=args.warm_fraction
     )
 
     best, history = ga.run()
 
+    if store:
+        store.record(problem, best.genes, best.fitness, meta={
+            "pop_size": args.pop_size, "generations_run": len(history["best"]),
+            "selection": args.selection, "tournament_k": args.tournament_k,
+            "crossover_rate": args.crossover_rate, "mutation_rate": args.mutation_rate,
+            "elitism": args.elitism, "patience": args.patience, "seed": args.seed,
+            "warm_start": bool(seed_tours),
+        })
+        store.close()
+
+    if args.plots:
+        save_plots(problem, best, history, outdir)
+
+    print("\nRESULTS:")
+    print(f"Best tour length: {best.fitness:.4f}")
+    print(f"Best route (0-based city indices): {best.genes}")
+    if args.plots:
+        print(f"Convergence plot saved to: {outdir / 'convergence.svg'}")
+        print(f"Best route plot saved to: {outdir / 'best_route.svg'}")
+
+# Usage: write the SVG plots; visualize (and matplotlib) is imported only here
+def save_plots(problem, best, history, outdir: Path):
+    from visualize import Visualizer
+
+    outdir.mkdir(parents=True, exist_ok=True)
     viz = Visualizer(problem)
     # NEW: save initial state (generation 0)
     if "init_route" in history:
@@ -55,11 +98,5 @@ def main():
     viz.plot_convergence(history, outdir / "convergence.svg")
     viz.plot_route(best.genes, outdir / "best_route.svg")
 
-    print("\nRESULTS:")
-    print(f"Best tour length: {best.fitness:.4f}")
-    print(f"Best route (0-based city indices): {best.genes}")
-    print(f"Convergence plot saved to: {outdir / 'convergence.svg'}")
-    print(f"Best route plot saved to: {outdir / 'best_route.svg'}")
-
 if __name__ == "__main__":
     main()
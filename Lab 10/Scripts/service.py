@@ -0,0 +1,319 @@
+import argparse
+import asyncio
+import inspect
+import itertools
+import json
+import math
+import multiprocessing as mp
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, Optional, Tuple
+from tsp_parser import TSPLIBParser, TSPProblem
+from genetics import GeneticAlgorithm
+
+# GA keyword arguments a client may override per job, with the JSON types each accepts
+_GA_PARAMS = {"pop_size": (int,), "selection_method": (str,), "tournament_k": (int,),
+              "crossover_rate": (int, float), "mutation_rate": (int, float), "elitism": (int,),
+              "max_generations": (int,), "patience": (int,)}
+_GA_DEFAULTS = {k: p.default for k, p in inspect.signature(GeneticAlgorithm).parameters.items() if k in _GA_PARAMS}
+
+_cancel_flags = None  # per-slot cancel bytes in shared memory, set in each worker by _init_worker
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v)
+
+# Usage: O(n) shape check of a request payload on the event loop; returns a normalized
+# {"name", "coords", ...} payload so the worker builds the O(n^2) dist matrix exactly once
+def validate_payload(payload: Any) -> Dict[str, Any]:
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be a JSON object")
+    name = str(payload.get("name", "instance"))
+    if "tsplib" in payload:
+        if not isinstance(payload["tsplib"], str):
+            raise ValueError("'tsplib' must be a string")
+        name, coords = TSPLIBParser.coords_from_lines(payload["tsplib"].splitlines(), default_name=name)
+    elif "coords" in payload:
+        raw = payload["coords"]
+        if not isinstance(raw, list):
+            raise ValueError("'coords' must be a list of [x, y] pairs")
+        coords = []
+        for i, pair in enumerate(raw):
+            if not (isinstance(pair, (list, tuple)) and len(pair) == 2 and all(_is_number(v) for v in pair)):
+                raise ValueError(f"coords[{i}] must be a pair of finite numbers")
+            coords.append((float(pair[0]), float(pair[1])))
+    else:
+        raise ValueError("payload needs 'tsplib' or 'coords'")
+    if len(coords) < 3:
+        raise ValueError("need at least 3 cities")
+    params = payload.get("params", {})
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object")
+    for key, value in params.items():
+        if key in _GA_PARAMS and (isinstance(value, bool) or not isinstance(value, _GA_PARAMS[key])):
+            raise ValueError(f"params.{key} has the wrong type")
+    _check_ranges({**_GA_DEFAULTS, **params})
+    budget = payload.get("time_budget")
+    if budget is not None and not (_is_number(budget) and budget > 0):
+        raise ValueError("'time_budget' must be a positive number")
+    seed = payload.get("seed", 42)
+    if isinstance(seed, bool) or not isinstance(seed, int):
+        raise ValueError("'seed' must be an integer")
+    return {"name": name, "coords": coords, "params": params, "time_budget": budget, "seed": seed}
+
+# Usage: reject GA settings the worker would only fail on (e.g. a tournament larger than the population)
+def _check_ranges(p: Dict[str, Any]) -> None:
+    if p["selection_method"] not in ("tournament", "roulette"):
+        raise ValueError("params.selection_method must be 'tournament' or 'roulette'")
+    if p["pop_size"] < 2:
+        raise ValueError("params.pop_size must be at least 2")
+    if p["selection_method"] == "tournament" and not 1 <= p["tournament_k"] <= p["pop_size"]:
+        raise ValueError("params.tournament_k must be between 1 and pop_size")
+    if not 0 <= p["elitism"] <= p["pop_size"]:
+        raise ValueError("params.elitism must be between 0 and pop_size")
+    for key in ("crossover_rate", "mutation_rate"):
+        if not (math.isfinite(p[key]) and 0 <= p[key] <= 1):
+            raise ValueError(f"params.{key} must be between 0 and 1")
+    if p["max_generations"] < 1:
+        raise ValueError("params.max_generations must be at least 1")
+    if p["patience"] < 0:
+        raise ValueError("params.patience must be non-negative")
+
+# Usage: build the problem from a request payload: {"tsplib": "..."} or {"coords": [[x, y], ...]}
+def problem_from_payload(payload: Dict[str, Any]) -> TSPProblem:
+    payload = validate_payload(payload)
+    return TSPLIBParser.from_coords(payload["coords"], name=payload["name"])
+
+# Usage: pool initializer; the shared cancel flags reach each worker once, at process start
+def _init_worker(flags) -> None:
+    global _cancel_flags
+    _cancel_flags = flags
+
+# Usage: pool warm-up task; every worker blocks on the barrier, so all `workers` processes must exist
+def _warm_up(barrier) -> None:
+    barrier.wait(timeout=120)
+
+# Usage: worker-process entry point; streams improvements and then the final done/error event
+# through `events`, so the terminal event can never overtake an improvement
+def _solve_job(job_id: int, slot: int, payload: Dict[str, Any], events) -> None:
+    try:
+        result = _run_job(job_id, slot, payload, events)
+    except Exception as e:
+        result = {"event": "error", "message": str(e)}
+    events.put((job_id, result))
+
+def _run_job(job_id: int, slot: int, payload: Dict[str, Any], events) -> Dict[str, Any]:
+    random.seed(payload["seed"])
+    problem = TSPLIBParser.from_coords(payload["coords"], name=payload["name"])
+    params = {k: v for k, v in payload["params"].items() if k in _GA_PARAMS}
+    ga = GeneticAlgorithm(problem=problem, **params)
+    budget = payload["time_budget"]
+    deadline = time.monotonic() + float(budget) if budget else None
+    t0 = time.monotonic()
+    stop_reason = {"value": "converged"}
+
+    def on_generation(gen, best, improved):
+        if improved:
+            events.put((job_id, {"event": "improved", "generation": gen, "length": best.fitness,
+                                 "tour": best.genes, "elapsed": time.monotonic() - t0}))
+        if _cancel_flags[slot]:  # plain shared-memory read, no IPC per generation
+            stop_reason["value"] = "cancelled"
+            return True
+        if deadline is not None and time.monotonic() >= deadline:
+            stop_reason["value"] = "time_budget"
+            return True
+        return False
+
+    best, history = ga.run(on_generation=on_generation)
+    return {"event": "done", "reason": stop_reason["value"], "length": best.fitness, "tour": best.genes,
+            "generations": len(history["best"]), "elapsed": time.monotonic() - t0}
+
+# Usage: asyncio front end; bounded process pool + job queue, NDJSON streaming over HTTP
+class SolverService:
+    def __init__(self, workers: int = 2, max_queue: int = 16):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._ids = itertools.count(1)
+        self._streams: Dict[int, asyncio.Queue] = {}
+        self._futures: Dict[int, Future] = {}   # jobs whose terminal event has not been sent yet
+        self._slots: Dict[int, int] = {}        # job -> cancel flag slot, held until its future is done
+        self._free_slots = list(range(workers + max_queue))
+        self._flags = mp.RawArray("b", workers + max_queue)
+        self._manager = mp.Manager()
+        self._events = self._manager.Queue()
+        # Workers are spawned once; interpreter startup and GA imports are paid at boot, not per request
+        self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self._flags,))
+        barrier = self._manager.Barrier(workers)
+        for fut in [self._pool.submit(_warm_up, barrier) for _ in range(workers)]:
+            fut.result()
+
+    # Usage: forward worker events (blocking manager queue) onto per-job asyncio queues
+    async def _pump_events(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await loop.run_in_executor(None, self._events.get)
+            if item is None:
+                return
+            job_id, event = item
+            if event["event"] in ("done", "error"):
+                self._futures.pop(job_id, None)
+            stream = self._streams.get(job_id)
+            if stream is not None:
+                stream.put_nowait(event)
+
+    # Usage: queue a solve; returns (job_id, event stream) or raises RuntimeError when the queue is full
+    def submit(self, payload: Dict[str, Any]) -> Tuple[int, asyncio.Queue]:
+        if not self._free_slots:
+            raise RuntimeError("job queue full")
+        payload = validate_payload(payload)  # O(n): reject malformed payloads before they take a slot
+        job_id = next(self._ids)
+        slot = self._free_slots.pop()
+        self._flags[slot] = 0
+        self._slots[job_id] = slot
+        stream: asyncio.Queue = asyncio.Queue()
+        self._streams[job_id] = stream
+        loop = asyncio.get_running_loop()
+        fut = self._pool.submit(_solve_job, job_id, slot, payload, self._events)
+        self._futures[job_id] = fut
+
+        # A job that ran posts its own terminal event through the pump; only jobs that never
+        # started, or whose worker process died, are finished from here. Touches no Manager
+        # state, so it is safe to run after shutdown.
+        def finished(f: Future):
+            self._free_slots.append(self._slots.pop(job_id))
+            if self._futures.pop(job_id, None) is None:
+                return
+            if f.cancelled():
+                stream.put_nowait({"event": "done", "reason": "cancelled"})
+            elif f.exception() is not None:
+                stream.put_nowait({"event": "error", "message": str(f.exception())})
+        fut.add_done_callback(lambda f: loop.call_soon_threadsafe(finished, f))
+        return job_id, stream
+
+    # Usage: cancel a queued job outright, or ask a running one to stop at its next generation
+    def cancel(self, job_id: int) -> bool:
+        fut = self._futures.get(job_id)
+        if fut is None:
+            return False
+        if not fut.cancel():
+            self._flags[self._slots[job_id]] = 1
+        return True
+
+    # Usage: minimal HTTP/1.1 handler: POST /solve streams NDJSON, DELETE /jobs/<id> cancels
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            method, target, body = await self._read_request(reader)
+            if method == "POST" and target == "/solve":
+                await self._handle_solve(body, writer)
+            elif method == "DELETE" and target.startswith("/jobs/"):
+                ok = self.cancel(int(target.rsplit("/", 1)[1]))
+                await self._respond(writer, 200 if ok else 404, {"cancelled": ok})
+            elif method == "GET" and target == "/health":
+                await self._respond(writer, 200, {"running_or_queued": len(self._futures)})
+            else:
+                await self._respond(writer, 404, {"error": "not found"})
+        except (ValueError, KeyError, TypeError) as e:
+            await self._respond(writer, 400, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_solve(self, body: bytes, writer: asyncio.StreamWriter):
+        payload = json.loads(body or b"{}")
+        try:
+            job_id, stream = self.submit(payload)
+        except RuntimeError as e:
+            await self._respond(writer, 503, {"error": str(e)})
+            return
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nConnection: close\r\n\r\n")
+        try:
+            await self._send_line(writer, {"event": "accepted", "job": job_id})
+            while True:
+                event = await stream.get()
+                await self._send_line(writer, event)
+                if event["event"] in ("done", "error"):
+                    break
+        except ConnectionError:
+            self.cancel(job_id)  # client went away: stop burning a worker on it
+        finally:
+            self._streams.pop(job_id, None)
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if len(request_line) < 2:
+            raise ValueError("malformed request line")
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            key, _, value = line.partition(":")
+            headers[key.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        return request_line[0].upper(), request_line[1], body
+
+    @staticmethod
+    async def _send_line(writer: asyncio.StreamWriter, obj: Dict[str, Any]):
+        writer.write(json.dumps(obj).encode() + b"\n")
+        await writer.drain()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, obj: Dict[str, Any]):
+        body = json.dumps(obj).encode()
+        writer.write(f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                     f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+
+    # Usage: serve on TCP host:port, or on a Unix socket when `unix_path` is given
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix_path: Optional[str] = None):
+        pump = asyncio.create_task(self._pump_events())
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle, path=unix_path)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # Workers first (they still post to the Manager queue), then the pump, then the Manager
+            await asyncio.get_running_loop().run_in_executor(None, self._stop_workers)
+            self._events.put(None)
+            await pump
+            await asyncio.sleep(0)  # let done-callbacks the pool queued on the loop run
+            self._manager.shutdown()
+
+    # Usage: drop queued jobs, stop running ones at their next generation and wait for the workers
+    def _stop_workers(self):
+        self._flags[:] = b"\x01" * len(self._flags)
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def shutdown(self):
+        self._stop_workers()
+        self._manager.shutdown()
+
+# Usage: CLI flags for the long-running solver service
+def parse_args():
+    p = argparse.ArgumentParser(description="Asyncio GA-TSP solver service (Lab 10)")
+    p.add_argument("--host", type=str, default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8765)
+    p.add_argument("--unix", type=str, default=None, help="Serve on this Unix socket instead of TCP")
+    p.add_argument("--workers", type=int, default=max(1, (mp.cpu_count() or 2) - 1))
+    p.add_argument("--max_queue", type=int, default=16, help="Jobs allowed to wait for a free worker")
+    return p.parse_args()
+
+def main():
+    args = parse_args()
+    service = SolverService(workers=args.workers, max_queue=args.max_queue)
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Solver service on {where} ({args.workers} workers)")
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from tsp_parser import TSPProblem
+
+# Usage: stable content hash of an instance (coords only, so renamed copies share results)
+def instance_hash(problem: TSPProblem) -> str:
+    h = hashlib.sha256()
+    for x, y in problem.coords:
+        h.update(f"{x!r},{y!r};".encode("ascii"))
+    return h.hexdigest()
+
+# Usage: SQLite-backed best-known-solution store keyed by instance content hash
+class SolutionStore:
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS solutions (
+            id            INTEGER PRIMARY KEY AUTOINCREMENT,
+            instance_hash TEXT    NOT NULL,
+            name          TEXT    NOT NULL,
+            n_cities      INTEGER NOT NULL,
+            length        REAL    NOT NULL,
+            tour          TEXT    NOT NULL,
+            meta          TEXT    NOT NULL,
+            created_at    REAL    NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_solutions_hash_len ON solutions (instance_hash, length);
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript(self._SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "SolutionStore":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Usage: persist one tour with its length and run metadata (params, generations, seed...)
+    def record(self, problem: TSPProblem, tour: List[int], length: float,
+               meta: Optional[Dict[str, Any]] = None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO solutions (instance_hash, name, n_cities, length, tour, meta, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (instance_hash(problem), problem.name, problem.n_cities, float(length),
+                 json.dumps(list(tour)), json.dumps(meta or {}), time.time()),
+            )
+
+    # Usage: k shortest distinct stored tours for this instance, best first
+    def best(self, problem: TSPProblem, k: int = 1) -> List[Tuple[float, List[int]]]:
+        rows = self.conn.execute(
+            "SELECT length, tour FROM solutions WHERE instance_hash = ? AND n_cities = ? "
+            "ORDER BY length ASC",
+            (instance_hash(problem), problem.n_cities),
+        )
+        out: List[Tuple[float, List[int]]] = []
+        seen = set()
+        for length, tour_json in rows:
+            tour = json.loads(tour_json)
+            key = tuple(tour)
+            if key in seen or sorted(tour) != list(range(problem.n_cities)):
+                continue
+            seen.add(key)
+            out.append((length, tour))
+            if len(out) >= k:
+                break
+        return out
+
+    # Usage: run history for an instance (length + metadata), newest first
+    def history(self, problem: TSPProblem) -> List[Dict[str, Any]]:
+        rows = self.conn.execute(
+            "SELECT length, meta, created_at FROM solutions WHERE instance_hash = ? "
+            "ORDER BY created_at DESC",
+            (instance_hash(problem),),
+        )
+        return [{"length": length, "meta": json.loads(meta), "created_at": ts}
+                for length, meta, ts in rows]
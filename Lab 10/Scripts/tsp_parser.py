@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import math
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, List, Sequence, Tuple
 
 # Usage: container for problem data (coords, dist matrix) consumed by GA and plotting
 @dataclass
@@ -12,6 +12,35 @@ class TSPProblem:
     @property
     def n_cities(self) -> int:
         return len(self.coords)
+
+    # Usage: append a city; only the new row/column of dist is computed (O(n))
+    def add_city(self, x: float, y: float) -> int:
+        new = (float(x), float(y))
+        row = [_euclidean(new, c) for c in self.coords]
+        for r, d in zip(self.dist, row):
+            r.append(d)
+        row.append(0.0)
+        self.coords.append(new)
+        self.dist.append(row)
+        return len(self.coords) - 1
+
+    # Usage: delete city idx by moving the last city into its slot (O(n)); returns the moved city's old index
+    def remove_city(self, idx: int) -> int:
+        last = len(self.coords) - 1
+        if not 0 <= idx <= last:
+            raise IndexError(f"city index {idx} out of range for {last + 1} cities")
+        if idx != last:
+            last_row = self.dist[last]
+            self.coords[idx] = self.coords[last]
+            for j in range(last):
+                self.dist[j][idx] = last_row[j]
+            last_row[idx] = 0.0
+            self.dist[idx] = last_row
+        self.coords.pop()
+        self.dist.pop()
+        for r in self.dist:
+            r.pop()
+        return last
     
 # Usage: helper to compute straight-line distance for the dist matrix
 def _euclidean(a: Tuple[float, float], b: Tuple[float, float]) -> float:
@@ -23,28 +52,50 @@ class TSPLIBParser:
     @staticmethod
     def from_file(path: str) -> TSPProblem:
         path = Path(path)
-        name = path.stem
-        coords: List[Tuple[float, float]] = []
         with path.open("r", encoding="utf-8", errors="ignore") as f:
-            in_section = False
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith("NAME"):
-                    parts = line.split(":")
-                    if len(parts) >= 2:
-                        name = parts[1].strip()
-                if "NODE_COORD_SECTION" in line:
-                    in_section = True
-                    continue
-                if "EOF" in line:
-                    break
-                if in_section:
-                    parts = line.split()
-                    if len(parts) >= 3:
-                        x, y = float(parts[1]), float(parts[2])
-                        coords.append((x, y))
+            return TSPLIBParser.from_lines(f, default_name=path.stem)
+
+    # Usage: same as from_file for TSPLIB content already in memory (e.g. a service payload)
+    @staticmethod
+    def from_text(text: str, default_name: str = "instance") -> TSPProblem:
+        return TSPLIBParser.from_lines(text.splitlines(), default_name=default_name)
+
+    # Usage: parse TSPLIB lines from any iterable (open file, list of strings)
+    @staticmethod
+    def from_lines(lines: Iterable[str], default_name: str = "instance") -> TSPProblem:
+        name, coords = TSPLIBParser.coords_from_lines(lines, default_name=default_name)
+        return TSPLIBParser.from_coords(coords, name=name)
+
+    # Usage: O(n) pass over TSPLIB lines -> (name, coords), without building the dist matrix
+    @staticmethod
+    def coords_from_lines(lines: Iterable[str], default_name: str = "instance") -> Tuple[str, List[Tuple[float, float]]]:
+        name = default_name
+        coords: List[Tuple[float, float]] = []
+        in_section = False
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("NAME"):
+                parts = line.split(":")
+                if len(parts) >= 2:
+                    name = parts[1].strip()
+            if "NODE_COORD_SECTION" in line:
+                in_section = True
+                continue
+            if "EOF" in line:
+                break
+            if in_section:
+                parts = line.split()
+                if len(parts) >= 3:
+                    x, y = float(parts[1]), float(parts[2])
+                    coords.append((x, y))
+        return name, coords
+
+    # Usage: build a TSPProblem straight from (x, y) pairs
+    @staticmethod
+    def from_coords(coords: Sequence[Sequence[float]], name: str = "instance") -> TSPProblem:
+        coords = [(float(x), float(y)) for x, y in coords]
         n = len(coords)
         dist = [[0.0]*n for _ in range(n)]
         for i in range(n):
@@ -1,10 +1,23 @@
 import random
-import numpy as np
+import sys
+from typing import List
 
 # Usage: set Python/NumPy RNGs for reproducible runs
+#        (NumPy is seeded only if something already imported it; the GA itself never uses it)
 def set_seed(seed: int = 42):
     random.seed(seed)
-    try:
-        np.random.seed(seed)
-    except Exception:
-        pass
+    if "numpy" in sys.modules:
+        sys.modules["numpy"].random.seed(seed)
+
+# Usage: double-bridge kick; keeps most edges of a good tour while escaping its 2-opt basin
+def perturb_tour(tour: List[int], kicks: int = 1) -> List[int]:
+    genes = tour[:]
+    n = len(genes)
+    if n < 8:
+        i, j = sorted(random.sample(range(n), 2)) if n >= 2 else (0, 0)
+        genes[i:j+1] = reversed(genes[i:j+1])
+        return genes
+    for _ in range(kicks):
+        a, b, c = sorted(random.sample(range(1, n), 3))
+        genes = genes[:a] + genes[b:c] + genes[a:b] + genes[c:]
+    return genes
@@ -1,30 +1,31 @@
 from pathlib import Path
 from typing import Dict, List
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from tsp_parser import TSPProblem
 
 # Usage: plot convergence and routes for report-quality SVGs
+#        (bare Figure objects render straight to SVG, so no pyplot backend is chosen or changed)
 class Visualizer:
     def __init__(self, problem: TSPProblem):
         self.problem = problem
 
     # Usage: line plot of best vs avg fitness across generations (SVG)
     def plot_convergence(self, history: Dict[str, List[float]], outpath: Path):
-        plt.figure()
+        fig = Figure()
+        ax = fig.subplots()
         best = history.get("best", [])
         avg = history.get("avg", [])
         if "init_best" in history and "init_avg" in history:
             best = [history["init_best"]] + best
             avg = [history["init_avg"]] + avg
-        plt.plot(best, label="Best")
-        plt.plot(avg, label="Average")
-        plt.title(f"GA Convergence — {self.problem.name}")
-        plt.xlabel("Generation (0 = initial)")
-        plt.ylabel("Tour Length")
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(outpath, format="svg")
-        plt.close()
+        ax.plot(best, label="Best")
+        ax.plot(avg, label="Average")
+        ax.set_title(f"GA Convergence — {self.problem.name}")
+        ax.set_xlabel("Generation (0 = initial)")
+        ax.set_ylabel("Tour Length")
+        ax.legend()
+        fig.tight_layout()
+        fig.savefig(outpath, format="svg")
 
     # Usage: draw the initial route with markers/step numbers (SVG)
     def plot_initial_route(self, route: List[int], outpath: Path):
@@ -39,21 +40,21 @@ class Visualizer:
         coords = self.problem.coords
         xs = [coords[i][0] for i in route] + [coords[route[0]][0]]
         ys = [coords[i][1] for i in route] + [coords[route[0]][1]]
-        plt.figure()
-        plt.plot(xs, ys, marker="o", linewidth=1.2)
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot(xs, ys, marker="o", linewidth=1.2)
         for step, city in enumerate(route, start=1):
             x, y = coords[city]
-            plt.annotate(str(step), (x, y), textcoords="offset points", xytext=(6, 6), fontsize=8)
+            ax.annotate(str(step), (x, y), textcoords="offset points", xytext=(6, 6), fontsize=8)
         start_city = route[0]
         end_city = route[-1]
         sx, sy = coords[start_city]
         ex, ey = coords[end_city]
-        plt.scatter([sx], [sy], marker="*", s=150, label=f"START (city {start_city})")
-        plt.scatter([ex], [ey], marker="s",  s=80,  label=f"END (city {end_city})")
-        plt.title(title)
-        plt.xlabel("X")
-        plt.ylabel("Y")
-        plt.legend()
-        plt.tight_layout()
-        plt.savefig(outpath, format="svg")
-        plt.close()
+        ax.scatter([sx], [sy], marker="*", s=150, label=f"START (city {start_city})")
+        ax.scatter([ex], [ey], marker="s",  s=80,  label=f"END (city {end_city})")
+        ax.set_title(title)
+        ax.set_xlabel("X")
+        ax.set_ylabel("Y")
+        ax.legend()
+        fig.tight_layout()
+        fig.savefig(outpath, format="svg")
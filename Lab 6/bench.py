@@ -0,0 +1,207 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+import numpy as np
+from search import solve_maze
+
+LAB7 = str(Path(__file__).resolve().parent.parent / "Lab 7")
+
+# The Lab 7 engines and generators are imported where they are used. main() puts Lab 7 on
+# sys.path and imports them up front, so no timed run pays for an import; other callers
+# need Lab 7 on sys.path before using those engines or generators.
+def load_lab7():
+    if LAB7 not in sys.path:
+        sys.path.append(LAB7)
+    import bucket_astar, hpa, jps, lab7, maze_gen  # noqa: F401
+
+# Seeded random occupancy grid; start/goal in opposite corners are always open
+def random_grid(size, density, seed):
+    rng = np.random.default_rng(seed)
+    grid = (rng.random((size, size)) < density).astype(np.uint8)
+    start, goal = (0, 0), (size - 1, size - 1)
+    grid[start] = 2
+    grid[goal] = 3
+    return grid, start, goal
+
+# Seeded perfect maze from Lab 7's generators (density is ignored: walls are ~50% by construction)
+def perfect_maze(algorithm):
+    def generate(size, density, seed):
+        from maze_gen import make_maze
+        grid = make_maze(size, size, algorithm, seed)
+        rows, cols = grid.shape
+        start, goal = (1, 1), (rows - 2, cols - 2)
+        grid[start] = 2
+        grid[goal] = 3
+        return grid, start, goal
+    return generate
+
+# Grid generators by name: 'random' plus one per Lab 7 maze algorithm
+def generators():
+    from maze_gen import ALGORITHMS
+    gens = {'random': random_grid}
+    gens.update({name: perfect_maze(name) for name in ALGORITHMS})
+    return gens
+
+# Generators that use density; the others are built and timed once per size, reported with density None
+DENSITY_AWARE = {'random'}
+
+# Engine adapters: (grid, start, goal) -> (path or None, nodes expanded)
+def _lab6(algorithm, engine='flat'):
+    def run(grid, start, goal):
+        path, visit_order, _, _ = solve_maze(grid, algorithm, engine)
+        return path or None, len(visit_order)
+    return run
+
+def _astar(grid, start, goal):
+    import lab7
+    path, visited = lab7.astar(grid, start, goal)
+    return path, len(visited)
+
+def _jps(grid, start, goal):
+    from jps import jps
+    path, visited = jps(grid, start, goal)
+    return path, len(visited)
+
+def _bucket_astar(grid, start, goal):
+    from bucket_astar import bucket_astar
+    path, visited = bucket_astar(grid, start, goal)
+    return path, len(visited)
+
+# Cold HPA* query: the timing includes building the abstract graph for this grid
+def _hpa(grid, start, goal):
+    from hpa import HPAStar
+    path, visited = HPAStar(grid).search(start, goal)
+    return path, len(visited)
+
+ENGINES = {
+    'bfs': _lab6('bfs'),
+    'dfs': _lab6('dfs'),
+    'bibfs': _lab6('bibfs'),
+    'bfs-python': _lab6('bfs', 'python'),
+    'astar': _astar,
+    'jps': _jps,
+    'bucket-astar': _bucket_astar,
+    'hpa': _hpa,
+}
+
+# What each engine's nodes_expanded counts. The units differ, so nodes_expanded and nodes_per_s
+# compare runs of one engine (sizes, densities, versions), not engines against each other
+EXPANDED_UNITS = {
+    'bfs': 'cells enqueued',
+    'dfs': 'cells enqueued',
+    'bibfs': 'cells enqueued',
+    'bfs-python': 'cells enqueued',
+    'astar': 'cells closed',
+    'bucket-astar': 'cells closed',
+    'jps': 'jump points closed',
+    'hpa': 'abstract nodes closed',
+}
+
+# Engines that must return shortest paths (hpa is near-optimal); --check compares their lengths with plain A*
+OPTIMAL = {'bfs', 'bibfs', 'bfs-python', 'astar', 'jps', 'bucket-astar'}
+
+# Time one engine on one grid: perf_counter over `repeat` runs, plus one tracemalloc run for peak memory
+def bench_case(engine, grid, start, goal, repeat):
+    if repeat < 1:
+        raise ValueError("repeat must be >= 1")
+    run = ENGINES[engine]
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        path, expanded = run(grid, start, goal)
+        times.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    run(grid, start, goal)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    median = statistics.median(times)
+    return {
+        'engine': engine,
+        'nodes_expanded': expanded,
+        'expanded_unit': EXPANDED_UNITS[engine],
+        'path_length': len(path) if path else None,
+        'time_median_s': median,
+        'time_min_s': min(times),
+        'peak_mem_bytes': peak,
+        'nodes_per_s': expanded / median if median > 0 else None,
+    }
+
+# Raise if any optimal engine disagrees with plain A* on this grid
+def check_optimal(engines, grid, start, goal):
+    expected, _ = _astar(grid, start, goal)
+    for engine in engines:
+        if engine not in OPTIMAL:
+            continue
+        path, _ = ENGINES[engine](grid, start, goal)
+        if (path is None) != (expected is None) or (path and len(path) != len(expected)):
+            raise AssertionError(f"{engine}: path length {path and len(path)} != A* {expected and len(expected)}")
+
+def run_suite(engines, sizes, densities, generator, seed, repeat, check=False):
+    generate = generators()[generator]
+    results = []
+    for size in sizes:
+        for density in (densities if generator in DENSITY_AWARE else [None]):
+            grid, start, goal = generate(size, density, seed)
+            if check:
+                check_optimal(engines, grid, start, goal)
+            for engine in engines:
+                case = bench_case(engine, grid, start, goal, repeat)
+                case.update({'size': size, 'density': density, 'generator': generator, 'seed': seed})
+                results.append(case)
+                print(f"{engine:<11} size={size:<6} density={str(density):<5} "
+                      f"expanded={case['nodes_expanded']:<9} ({case['expanded_unit']}) path={case['path_length']} "
+                      f"t={case['time_median_s'] * 1e3:.2f}ms peak={case['peak_mem_bytes'] / 2**20:.1f}MiB",
+                      file=sys.stderr)
+    return results
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {value}")
+    return value
+
+def parse_args():
+    p = argparse.ArgumentParser(description="Benchmark grid search engines (Lab 6 BFS/DFS, Lab 7 A*)")
+    p.add_argument("--engines", nargs="+", default=['bfs', 'dfs', 'astar'], choices=sorted(ENGINES))
+    p.add_argument("--sizes", nargs="+", type=int, default=[51, 101, 201])
+    p.add_argument("--densities", nargs="+", type=float, default=[0.1, 0.25])
+    p.add_argument("--generator", choices=sorted(generators()), default='random')
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--repeat", type=positive_int, default=5)
+    p.add_argument("--check", action="store_true",
+                   help="Verify optimal engines match plain A* path lengths before timing")
+    p.add_argument("--out", help="Write JSON results here (default: stdout)")
+    return p.parse_args()
+
+def main():
+    load_lab7()
+    args = parse_args()
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': args.repeat,
+            'expanded_units': {engine: EXPANDED_UNITS[engine] for engine in args.engines},
+        },
+        'results': run_suite(args.engines, args.sizes, args.densities, args.generator, args.seed, args.repeat,
+                             args.check),
+    }
+    text = json.dumps(report, indent=2)
+    if args.out:
+        Path(args.out).write_text(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    # search and lab7 import pyplot; stay headless unless MPLBACKEND asks for a backend
+    if "MPLBACKEND" not in os.environ:
+        import matplotlib
+        matplotlib.use("Agg")
+    main()
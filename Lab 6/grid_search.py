@@ -0,0 +1,182 @@
+import time
+from array import array
+from collections.abc import Sequence
+import numpy as np
+from maze_io import MazeGrid, find_endpoints
+
+# Neighbour bits, in the same order as search.get_neighbors: right, down, left, up
+RIGHT, DOWN, LEFT, UP = 1, 2, 4, 8
+
+# Precompute, for every cell, a bitmask of which of its 4 neighbours are passable (not walls)
+def neighbor_masks(grid):
+    passable = np.asarray(grid) != 1
+    mask = np.zeros(passable.shape, dtype=np.uint8)
+    mask[:, :-1] |= passable[:, 1:] * np.uint8(RIGHT)
+    mask[:-1, :] |= passable[1:, :] * np.uint8(DOWN)
+    mask[:, 1:] |= passable[:, :-1] * np.uint8(LEFT)
+    mask[1:, :] |= passable[:-1, :] * np.uint8(UP)
+    mask[~passable] = 0
+    return mask
+
+# Read-only sequence of (row, col) tuples backed by flat int indices (4 bytes per cell, not a tuple)
+class FlatCells(Sequence):
+    def __init__(self, flat, cols):
+        self.flat = flat
+        self.cols = cols
+
+    def __len__(self):
+        return len(self.flat)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return FlatCells(self.flat[i], self.cols)
+        return divmod(self.flat[i], self.cols)
+
+    def __iter__(self):
+        cols = self.cols
+        for f in self.flat:
+            yield divmod(f, cols)
+
+# Walk the int32 parent array back from goal to start
+def _reconstruct(parent, start, goal, cols):
+    path = []
+    node = goal
+    while node != start:
+        path.append(divmod(node, cols))
+        node = parent[node]
+    path.append(divmod(start, cols))
+    path.reverse()
+    return path
+
+# BFS/DFS over flat indices: bytearray visited, int32 parents, precomputed neighbour masks and a
+# preallocated frontier. Same results and return shape as search.solve_maze.
+def solve_maze_flat(grid, algorithm, start=None, goal=None, masks=None):
+    if (start is None or goal is None) and isinstance(grid, MazeGrid):
+        start, goal = grid.endpoints()
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    if start is None or goal is None:
+        start, goal = find_endpoints(grid)
+    if not start or not goal:
+        return None, None, 0, 0
+
+    n = rows * cols
+    if masks is None:
+        masks = neighbor_masks(grid)
+    nbr = masks.tobytes()  # bytes indexing returns plain ints, much cheaper than NumPy scalars
+    visited = bytearray(n)
+    parent = array('i', [-1]) * n
+    # Cells are marked visited when pushed, so each enters the frontier at most once and a
+    # buffer of n slots is enough for both the BFS queue (never wraps) and the DFS stack.
+    frontier = array('i', bytes(4 * n))
+    bfs = algorithm == 'bfs'
+    order = frontier if bfs else array('i', bytes(4 * n))
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    visited[s] = 1
+    frontier[0] = s
+    order[0] = s
+    head, tail, count = 0, 1, 1
+
+    start_time = time.perf_counter()
+    path_found = False
+    while head < tail:
+        if bfs:
+            cur = frontier[head]
+            head += 1
+        else:
+            tail -= 1
+            cur = frontier[tail]
+        if cur == g:
+            path_found = True
+            break
+
+        m = nbr[cur]
+        if not m:
+            continue
+        for bit, step in ((RIGHT, 1), (DOWN, cols), (LEFT, -1), (UP, -cols)):
+            if m & bit:
+                nxt = cur + step
+                if not visited[nxt]:
+                    visited[nxt] = 1
+                    parent[nxt] = cur
+                    frontier[tail] = nxt
+                    tail += 1
+                    if not bfs:
+                        order[count] = nxt
+                    count += 1
+    exec_time = time.perf_counter() - start_time
+
+    path = _reconstruct(parent, s, g, cols) if path_found else []
+    visit_order = FlatCells(order[:count], cols)
+    return path, visit_order, len(path), exec_time
+
+# Bidirectional BFS: grow whole levels from start and goal, always the smaller frontier first.
+# After the level where the two searches touch, the cheapest contact edge gives a shortest path.
+def solve_maze_bidirectional(grid, start=None, goal=None, masks=None):
+    if (start is None or goal is None) and isinstance(grid, MazeGrid):
+        start, goal = grid.endpoints()
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    if start is None or goal is None:
+        start, goal = find_endpoints(grid)
+    if not start or not goal:
+        return None, None, 0, 0
+
+    n = rows * cols
+    if masks is None:
+        masks = neighbor_masks(grid)
+    nbr = masks.tobytes()
+    side = bytearray(n)  # 0 unseen, 1 reached from start, 2 reached from goal
+    parent = array('i', [-1]) * n
+    dist = array('i', bytes(4 * n))
+    order = array('i', bytes(4 * n))
+
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    start_time = time.perf_counter()
+    if s == g:
+        return [start], FlatCells(array('i', [s]), cols), 1, time.perf_counter() - start_time
+
+    side[s], side[g] = 1, 2
+    order[0], order[1] = s, g
+    count = 2
+    frontiers = {1: [s], 2: [g]}
+    meet = None
+    steps = ((RIGHT, 1), (DOWN, cols), (LEFT, -1), (UP, -cols))
+
+    while frontiers[1] and frontiers[2]:
+        me = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+        nxt = []
+        for cur in frontiers[me]:
+            m = nbr[cur]
+            d = dist[cur] + 1
+            for bit, step in steps:
+                if m & bit:
+                    v = cur + step
+                    owner = side[v]
+                    if not owner:
+                        side[v] = me
+                        parent[v] = cur
+                        dist[v] = d
+                        nxt.append(v)
+                        order[count] = v
+                        count += 1
+                    elif owner != me and (meet is None or d + dist[v] < meet[0]):
+                        meet = (d + dist[v], cur, v) if me == 1 else (d + dist[v], v, cur)
+        if meet is not None:
+            break
+        frontiers[me] = nxt
+    exec_time = time.perf_counter() - start_time
+
+    path = []
+    if meet is not None:
+        _, a, b = meet  # a is on the start side, b on the goal side
+        path = _reconstruct(parent, s, a, cols)
+        node = b
+        while node != g:
+            path.append(divmod(node, cols))
+            node = parent[node]
+        path.append(goal)
+    return path, FlatCells(order[:count], cols), len(path), exec_time
@@ -0,0 +1,288 @@
+import zlib
+from array import array
+from collections import OrderedDict, deque
+import numpy as np
+from grid_search import DOWN, LEFT, RIGHT, UP, neighbor_masks, solve_maze_bidirectional
+from maze_io import MazeGrid
+
+try:
+    from scipy import ndimage
+except ImportError:  # optional: pure-Python flood fill below is used instead
+    ndimage = None
+
+# update_cells() batches larger than this rebuild the whole index instead of patching it
+PATCH_LIMIT = 256
+
+
+# Component id per cell (0 = wall, 1..k = 4-connected passable regions)
+def label_components(grid, masks=None):
+    passable = np.asarray(grid) != 1
+    if ndimage is not None:
+        labels, _ = ndimage.label(passable)
+        return labels.astype(np.int32)
+
+    rows, cols = passable.shape
+    if masks is None:
+        masks = neighbor_masks(grid)
+    nbr = masks.tobytes()
+    labels = array('i', bytes(4 * rows * cols))
+    stack = array('i')
+    steps = ((RIGHT, 1), (DOWN, cols), (LEFT, -1), (UP, -cols))
+    current = 0
+    for seed in np.flatnonzero(passable.ravel()).tolist():
+        if labels[seed]:
+            continue
+        current += 1
+        labels[seed] = current
+        stack.append(seed)
+        while stack:
+            cur = stack.pop()
+            m = nbr[cur]
+            for bit, step in steps:
+                if m & bit:
+                    nxt = cur + step
+                    if not labels[nxt]:
+                        labels[nxt] = current
+                        stack.append(nxt)
+    return np.frombuffer(labels, dtype=np.int32).reshape(rows, cols)
+
+
+# BFS distance field towards `target`: dist (-1 = unreachable) and next-step-to-target per cell
+def distance_field(masks, target):
+    rows, cols = masks.shape
+    n = rows * cols
+    nbr = masks.tobytes()
+    dist = array('i', [-1]) * n
+    toward = array('i', [-1]) * n
+    queue = array('i', bytes(4 * n))
+    steps = ((RIGHT, 1), (DOWN, cols), (LEFT, -1), (UP, -cols))
+    dist[target] = 0
+    queue[0] = target
+    head, tail = 0, 1
+    while head < tail:
+        cur = queue[head]
+        head += 1
+        d = dist[cur] + 1
+        m = nbr[cur]
+        for bit, step in steps:
+            if m & bit:
+                nxt = cur + step
+                if dist[nxt] < 0:
+                    dist[nxt] = d
+                    toward[nxt] = cur
+                    queue[tail] = nxt
+                    tail += 1
+    return dist, toward
+
+
+# Per-maze precomputation for many (start, goal) queries on a mostly static grid:
+# component labels answer unreachable queries in O(1), and goals asked for at least
+# `field_after` times get a cached BFS field so later paths are a walk of O(path length).
+# A MazeGrid is checked for edits by its version counter on every query. A plain ndarray edited
+# in place needs update_cells() or invalidate(), or checksum=True to compare a CRC of its bytes
+# per query (about 0.5 ms per million cells).
+class MazeIndex:
+    def __init__(self, grid, max_fields=8, field_after=2, max_goals=4096, checksum=False):
+        self.grid = grid
+        self.max_fields = max_fields
+        self.field_after = field_after
+        self.max_goals = max_goals
+        self.checksum = checksum
+        self._build()
+
+    def _build(self):
+        self.cols = self.grid.shape[1]
+        self.masks = neighbor_masks(self.grid)
+        self.labels = label_components(self.grid, self.masks)
+        self._next_label = int(self.labels.max(initial=0)) + 1
+        self._fields = OrderedDict()     # target flat index -> (dist, toward), LRU order
+        self._goal_hits = OrderedDict()  # goal flat index -> query count, LRU order, max_goals long
+        self._version = self._fingerprint()
+
+    def _fingerprint(self):
+        if isinstance(self.grid, MazeGrid):
+            return self.grid.version
+        if self.checksum and self.grid.flags.writeable:
+            return zlib.crc32(np.ascontiguousarray(self.grid))
+        return None
+
+    # Drop everything derived from the grid (call after editing a plain ndarray in place)
+    def invalidate(self):
+        self._build()
+
+    # Write cells and repair the index around them; values use the usual codes (0 passage, 1 wall).
+    # Masks are patched locally, labels are merged or re-split only for the touched components,
+    # and only fields whose target lies in one of those are dropped. Big batches rebuild instead.
+    def update_cells(self, cells, values):
+        self._check_fresh()
+        values = np.broadcast_to(values, (len(cells),))
+        if len(cells) > PATCH_LIMIT:
+            for (r, c), v in zip(cells, values):
+                self.grid[r, c] = v
+            self._build()
+            return
+        for (r, c), v in zip(cells, values):
+            was_open = self.grid[r, c] != 1
+            self.grid[r, c] = v
+            if (v != 1) != was_open:
+                self._patch_masks(r, c)
+                touched = self._open_cell(r, c) if v != 1 else self._close_cell(r, c)
+                for key in [k for k in self._fields if int(self.labels.flat[k]) in touched]:
+                    del self._fields[key]
+        self._version = self._fingerprint()
+
+    # Recompute the masks of (r, c) and its 4 neighbours from a window one cell wider
+    def _patch_masks(self, r, c):
+        r0, c0 = max(r - 2, 0), max(c - 2, 0)
+        r1, c1 = max(r - 1, 0), max(c - 1, 0)
+        window = neighbor_masks(self.grid[r0:r + 3, c0:c + 3])
+        self.masks[r1:r + 2, c1:c + 2] = window[r1 - r0:r + 2 - r0, c1 - c0:c + 2 - c0]
+
+    # Flat indices of the open 4-neighbours of (r, c)
+    def _open_neighbors(self, r, c):
+        rows, cols = self.grid.shape
+        return [nr * cols + nc for nr, nc in ((r, c + 1), (r + 1, c), (r, c - 1), (r - 1, c))
+                if 0 <= nr < rows and 0 <= nc < cols and self.grid[nr, nc] != 1]
+
+    # A wall became a passage: it joins (and merges) the components around it
+    def _open_cell(self, r, c):
+        labels = self.labels
+        around = {int(labels.flat[n]) for n in self._open_neighbors(r, c)}
+        if not around:
+            labels[r, c] = self._next_label
+            self._next_label += 1
+            return set()
+        keep = around.pop()
+        for other in around:
+            labels[labels == other] = keep
+        labels[r, c] = keep
+        return {keep}
+
+    # A passage became a wall: its component may fall apart. Flood from each open neighbour
+    # in turn, merging floods that meet; a flood that runs dry before the others is a split-off
+    # part and gets a new label. Stops as soon as one flood is left, so the work is about the
+    # size of the smaller parts, not of the component.
+    def _close_cell(self, r, c):
+        labels = self.labels
+        old = int(labels[r, c])
+        labels[r, c] = 0
+        seeds = self._open_neighbors(r, c)
+        touched = {0, old}
+        nbr = memoryview(self.masks).cast('B')
+        cols = self.cols
+        steps = ((RIGHT, 1), (DOWN, cols), (LEFT, -1), (UP, -cols))
+        owner = {s: i for i, s in enumerate(seeds)}
+        root = list(range(len(seeds)))
+        queues = [deque([s]) for s in seeds]
+        members = [[s] for s in seeds]
+        active = set(root)
+
+        def find(i):
+            while root[i] != i:
+                i = root[i]
+            return i
+
+        while len(active) > 1:
+            for i in list(active):
+                if i not in active or len(active) == 1:
+                    continue
+                if not queues[i]:
+                    active.discard(i)
+                    labels.flat[members[i]] = self._next_label
+                    touched.add(self._next_label)
+                    self._next_label += 1
+                    continue
+                cur = queues[i].popleft()
+                m = nbr[cur]
+                for bit, step in steps:
+                    if m & bit:
+                        nxt = cur + step
+                        j = owner.get(nxt)
+                        if j is None:
+                            owner[nxt] = i
+                            queues[i].append(nxt)
+                            members[i].append(nxt)
+                            continue
+                        j = find(j)
+                        if j != i:  # floods met: fold the smaller one into the larger
+                            if len(members[j]) > len(members[i]):
+                                i, j = j, i
+                            root[j] = i
+                            queues[i].extend(queues[j])
+                            members[i].extend(members[j])
+                            queues[j], members[j] = None, None
+                            active.discard(j)
+        return touched
+
+    def _check_fresh(self):
+        if self._fingerprint() != self._version:
+            self._build()
+
+    def reachable(self, a, b):
+        self._check_fresh()
+        la = self.labels[a]
+        return bool(la) and la == self.labels[b]
+
+    # Cached field for target (built on demand), refreshing its LRU position
+    def field(self, target):
+        self._check_fresh()
+        key = target[0] * self.cols + target[1]
+        if key in self._fields:
+            self._fields.move_to_end(key)
+        else:
+            self._fields[key] = distance_field(self.masks, key)
+            if len(self._fields) > self.max_fields:
+                self._fields.popitem(last=False)
+        return self._fields[key]
+
+    # Field for goal once it is cached or has been asked for field_after times, else None
+    def _goal_field(self, goal):
+        g = goal[0] * self.cols + goal[1]
+        if g not in self._fields:
+            hits = self._goal_hits
+            count = hits.pop(g, 0) + 1
+            hits[g] = count
+            if len(hits) > self.max_goals:
+                hits.popitem(last=False)
+            if count < self.field_after:
+                return None
+        return self.field(goal)
+
+    def distance(self, start, goal):
+        if not self.reachable(start, goal):
+            return None
+        cols = self.cols
+        s = start[0] * cols + start[1]
+        g = goal[0] * cols + goal[1]
+        found = self._goal_field(goal)
+        if found is not None:
+            return found[0][s]
+        if s in self._fields:
+            return self.field(start)[0][g]
+        path, _, _, _ = solve_maze_bidirectional(self.grid, start, goal, masks=self.masks)
+        return len(path) - 1
+
+    # Shortest path from start to goal as a list of (row, col), or None when unreachable
+    def path(self, start, goal):
+        if not self.reachable(start, goal):
+            return None
+        cols = self.cols
+        s = start[0] * cols + start[1]
+        g = goal[0] * cols + goal[1]
+        found = self._goal_field(goal)
+        if found is not None:
+            return self._walk(found[1], s, g)
+        if s in self._fields:  # undirected grid: walk start's field from the goal, then reverse
+            _, toward = self.field(start)
+            return self._walk(toward, g, s)[::-1]
+        path, _, _, _ = solve_maze_bidirectional(self.grid, start, goal, masks=self.masks)
+        return path
+
+    def _walk(self, toward, src, dst):
+        cols = self.cols
+        path = [divmod(src, cols)]
+        node = src
+        while node != dst:
+            node = toward[node]
+            path.append(divmod(node, cols))
+        return path
@@ -0,0 +1,130 @@
+from pathlib import Path
+import numpy as np
+
+# Cell codes shared with search.py: 0 passage, 1 wall, 2 start, 3 goal
+PASSAGE, WALL, START, GOAL = 0, 1, 2, 3
+
+# Byte -> cell code lookup for text mazes ('#'/'1' wall, '.'/'0' passage, 'S' start, 'G' goal)
+_TEXT_LUT = np.full(256, 255, dtype=np.uint8)
+for _chars, _code in ((b"0.", PASSAGE), (b"1#", WALL), (b"Ss", START), (b"Gg", GOAL)):
+    for _ch in _chars:
+        _TEXT_LUT[_ch] = _code
+
+
+# numpy grid that remembers where its start/goal are (works for in-memory and memmapped data).
+# Item assignment and fill() invalidate the cache, also when made through a slice of the grid;
+# other in-place writes (np.copyto, ufuncs with out=, a plain ndarray view) need invalidate().
+class MazeGrid(np.ndarray):
+    def __array_finalize__(self, obj):
+        self._endpoints = None
+        self.version = 0
+        # Views share memory with the grid they came from, so their writes must reach its cache
+        self._owner = obj if isinstance(obj, MazeGrid) and np.may_share_memory(self, obj) else None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.invalidate()
+
+    def fill(self, value):
+        super().fill(value)
+        self.invalidate()
+
+    # (start, goal) found by one vectorized pass, cached until invalidate()
+    def endpoints(self):
+        if self._endpoints is None:
+            self._endpoints = find_endpoints(self.view(np.ndarray))
+        return self._endpoints
+
+    # Call after writing to the grid so cached lookups (here and in MazeIndex) are recomputed
+    def invalidate(self):
+        grid = self
+        while grid is not None:
+            grid._endpoints = None
+            grid.version += 1
+            grid = grid._owner
+
+
+# Locate start (2) and goal (3) in a single scan; row blocks keep memory bounded on memmaps
+def find_endpoints(grid, chunk_rows=1024):
+    grid = np.asarray(grid)
+    rows, cols = grid.shape
+    start = goal = None
+    for r0 in range(0, rows, chunk_rows):
+        block = grid[r0:r0 + chunk_rows]
+        hits = np.flatnonzero(block.ravel() >= START)
+        for f in hits:
+            value = block.flat[f]
+            r, c = divmod(int(f), cols)
+            if value == START and start is None:
+                start = (r0 + r, c)
+            elif value == GOAL and goal is None:
+                goal = (r0 + r, c)
+        if start is not None and goal is not None:
+            break
+    return start, goal
+
+
+# Vectorized version of the lab's nested-list maze ('S', 'G', 0, 1) -> MazeGrid
+def grid_from_rows(rows):
+    cells = np.asarray(rows, dtype=str)
+    grid = np.zeros(cells.shape, dtype=np.uint8)
+    grid[cells == '1'] = WALL
+    grid[cells == 'S'] = START
+    grid[cells == 'G'] = GOAL
+    return grid.view(MazeGrid)
+
+
+# Text maze: one row per line; commas/whitespace between cells are ignored
+def load_text(path):
+    data = Path(path).read_bytes().translate(None, b" ,\t\r")
+    lines = [ln for ln in data.split(b"\n") if ln]
+    width = len(lines[0])
+    if any(len(ln) != width for ln in lines):
+        raise ValueError(f"{path}: rows have different lengths")
+    raw = np.frombuffer(b"".join(lines), dtype=np.uint8).reshape(len(lines), width)
+    grid = _TEXT_LUT[raw]
+    if (grid == 255).any():
+        bad = chr(int(raw[grid == 255][0]))
+        raise ValueError(f"{path}: unknown maze character {bad!r}")
+    return grid.view(MazeGrid)
+
+
+# PNG maze: dark pixels are walls; pure green marks the start and pure red the goal
+def load_png(path, threshold=0.5):
+    import matplotlib.image as mpimg
+
+    img = mpimg.imread(str(path))
+    if img.dtype == np.uint8:
+        img = img / 255.0
+    if img.ndim == 2:
+        img = np.stack([img] * 3, axis=-1)
+    rgb = img[..., :3]
+    grid = (rgb.mean(axis=-1) < threshold).astype(np.uint8)
+    red, green, blue = rgb[..., 0], rgb[..., 1], rgb[..., 2]
+    grid[(green > 0.9) & (red < 0.1) & (blue < 0.1)] = START
+    grid[(red > 0.9) & (green < 0.1) & (blue < 0.1)] = GOAL
+    return grid.view(MazeGrid)
+
+
+# .npy maze; mmap=True maps the file read-only instead of loading it. The grid itself then stays
+# on disk, but a search still allocates about 15-20 bytes of working arrays per cell.
+def load_npy(path, mmap=False):
+    arr = np.load(path, mmap_mode='r' if mmap else None)
+    if arr.ndim != 2:
+        raise ValueError(f"{path}: expected a 2-D grid, got shape {arr.shape}")
+    return arr.view(MazeGrid)
+
+
+# Dispatch on file extension
+def load_maze(path, mmap=False):
+    suffix = Path(path).suffix.lower()
+    if suffix == '.npy':
+        return load_npy(path, mmap=mmap)
+    if suffix == '.png':
+        return load_png(path)
+    return load_text(path)
+
+
+# Store a grid as compact uint8 .npy so later runs can memory-map it
+def save_npy(grid, path):
+    np.save(path, np.asarray(grid, dtype=np.uint8))
@@ -0,0 +1,88 @@
+import multiprocessing as mp
+from pathlib import Path
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib import animation, colors
+
+# Default cell codes/colours used by search.py (Lab 7 passes its own)
+LAB6_CODES = {'start': 2, 'goal': 3, 'visited': 4, 'path': 5}
+LAB6_CMAP = colors.ListedColormap(['white', 'black', 'orange', 'red', 'green', 'blue'])
+LAB6_NORM = colors.BoundaryNorm([-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5], LAB6_CMAP.N)
+
+# Cells as a flat int array: FlatCells / (row, col) sequences / already-flat arrays
+def to_flat(cells, cols):
+    flat = getattr(cells, 'flat', None)
+    if flat is not None and not isinstance(cells, np.ndarray):
+        return np.asarray(flat, dtype=np.int64)
+    arr = np.asarray(list(cells) if not isinstance(cells, np.ndarray) else cells, dtype=np.int64)
+    if arr.ndim == 2:
+        return arr[:, 0] * cols + arr[:, 1]
+    return arr.reshape(-1)
+
+# Split n items into `frames` contiguous batches (frame k applies items[bounds[k]:bounds[k+1]])
+def _batch_bounds(n, frames):
+    frames = max(1, min(frames, n)) if n else 0
+    return np.linspace(0, n, frames + 1).astype(np.int64)
+
+# Pick a writer from the file extension (MP4 needs ffmpeg on PATH, GIF uses Pillow)
+def _writer_for(outpath, fps):
+    suffix = Path(outpath).suffix.lower()
+    if suffix == '.gif':
+        return animation.PillowWriter(fps=fps)
+    if suffix in ('.mp4', '.m4v', '.mov'):
+        if not animation.FFMpegWriter.isAvailable():
+            raise RuntimeError("ffmpeg not found; write a .gif instead or install ffmpeg")
+        return animation.FFMpegWriter(fps=fps)
+    raise ValueError(f"unsupported animation format: {suffix}")
+
+# Headless export: visited cells then the path, each spread over a fixed number of frames,
+# applied as vectorized batch writes. No display or pyplot needed.
+def render_search(grid, start, goal, visit_order, path, outpath, duration=10.0, fps=30,
+                  frames=None, hold=1.0, title="Maze Search", codes=None, cmap=LAB6_CMAP,
+                  norm=LAB6_NORM, dpi=100):
+    codes = codes or LAB6_CODES
+    grid = np.asarray(grid)
+    cols = grid.shape[1]
+    visit_flat = to_flat(visit_order, cols)
+    path_flat = to_flat(path or [], cols)
+
+    total = frames if frames is not None else max(1, int(round(duration * fps)))
+    path_frames = min(len(path_flat), max(1, total // 5)) if len(path_flat) else 0
+    visit_bounds = _batch_bounds(len(visit_flat), max(1, total - path_frames))
+    path_bounds = _batch_bounds(len(path_flat), path_frames)
+    hold_frames = int(round(hold * fps))
+
+    vis = np.array(grid, dtype=np.uint8)
+    flat_vis = vis.reshape(-1)
+    s = start[0] * cols + start[1]
+    g = goal[0] * cols + goal[1]
+    flat_vis[s] = codes['start']
+    flat_vis[g] = codes['goal']
+
+    fig = Figure(figsize=(8, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    img = ax.imshow(vis, cmap=cmap, norm=norm, interpolation='nearest')
+    ax.set_title(title)
+    ax.axis('off')
+
+    writer = _writer_for(outpath, fps)
+    with writer.saving(fig, str(outpath), dpi):
+        phases = ((visit_flat, visit_bounds, codes['visited']), (path_flat, path_bounds, codes['path']))
+        for cells, bounds, code in phases:
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                flat_vis[cells[lo:hi]] = code
+                flat_vis[s] = codes['start']
+                flat_vis[g] = codes['goal']
+                img.set_data(vis)
+                writer.grab_frame()
+        for _ in range(hold_frames):
+            writer.grab_frame()
+    return Path(outpath)
+
+# Same as render_search but in a separate process, so the caller can keep solving
+def render_in_background(*args, **kwargs):
+    proc = mp.Process(target=render_search, args=args, kwargs=kwargs, daemon=False)
+    proc.start()
+    return proc
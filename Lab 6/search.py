@@ -4,6 +4,8 @@ from matplotlib.animation import FuncAnimation
 from matplotlib import colors
 from collections import deque
 import time
+from grid_search import solve_maze_flat, solve_maze_bidirectional
+from maze_io import MazeGrid, find_endpoints, grid_from_rows, load_maze
 
 # Define the maze from the lab
 maze = [
@@ -29,28 +31,22 @@ maze = [
     [1, 1, 0, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 'G'],
 ]
 
-# Convert maze to numerical grid
+# Convert maze to numerical grid (vectorized; result caches its start/goal)
 def to_numeric_grid(maze):
-    grid = np.zeros((len(maze), len(maze[0])), dtype=int)
-    for r, row in enumerate(maze):
-        for c, cell in enumerate(row):
-            if cell == 'S':
-                grid[r, c] = 2
-            elif cell == 'G':
-                grid[r, c] = 3
-            elif cell == 0:
-                grid[r, c] = 0
-            elif cell == 1:
-                grid[r, c] = 1
-    return grid
+    return grid_from_rows(maze)
 
 # Find position of a specific value in grid
 def find_pos(grid, value):
-    for r, row in enumerate(grid):
-        for c, cell in enumerate(row):
-            if cell == value:
-                return (r, c)
-    return None
+    hits = np.flatnonzero(np.asarray(grid).ravel() == value)
+    if hits.size == 0:
+        return None
+    return divmod(int(hits[0]), grid.shape[1])
+
+# Start and goal in one vectorized pass, cached when grid is a MazeGrid
+def get_endpoints(grid):
+    if isinstance(grid, MazeGrid):
+        return grid.endpoints()
+    return find_endpoints(grid)
 
 # Get valid neighbors for a cell
 def get_neighbors(grid, r, c):
@@ -65,10 +61,18 @@ def get_neighbors(grid, r, c):
                 neighbors.append((nr, nc))
     return neighbors
 
-# Solve maze with BFS or DFS
-def solve_maze(grid, algorithm):
-    start = find_pos(grid, 2)
-    goal = find_pos(grid, 3)
+# Solve maze with BFS, DFS or bidirectional BFS ('bibfs')
+# ('flat' engine scales to very large grids, 'python' is the original BFS/DFS loop; bibfs is flat-only)
+def solve_maze(grid, algorithm, engine='flat'):
+    if engine not in ('flat', 'python'):
+        raise ValueError(f"unknown engine {engine!r}; expected 'flat' or 'python'")
+    if algorithm == 'bibfs' and engine != 'flat':
+        raise ValueError("bibfs only runs on the 'flat' engine")
+    start, goal = get_endpoints(grid)
+    if algorithm == 'bibfs':
+        return solve_maze_bidirectional(grid, start, goal)
+    if engine == 'flat':
+        return solve_maze_flat(grid, algorithm, start, goal)
     if not start or not goal:
         return None, None, 0, 0
     
@@ -130,7 +134,14 @@ maze_cmap = colors.ListedColormap(['white', 'black', 'orange', 'red', 'green', '
 maze_norm = colors.BoundaryNorm([-0.5, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5], maze_cmap.N)
 
 # Animate search process with final frame hold
-def animate_search(grid, start, goal, visit_order, path, algorithm):
+# (save_path='run.gif'/'run.mp4' renders headless in batched frames instead of showing a window)
+def animate_search(grid, start, goal, visit_order, path, algorithm, save_path=None, duration=10.0,
+                   background=False):
+    if save_path:
+        from render import render_in_background, render_search
+        render = render_in_background if background else render_search
+        return render(grid, start, goal, visit_order, path, save_path, duration=duration,
+                      title=f"Maze Solving with {algorithm.upper()}")
     fig, ax = plt.subplots(figsize=(10, 10))
     vis_grid = np.copy(grid)
     
@@ -178,24 +189,38 @@ def animate_search(grid, start, goal, visit_order, path, algorithm):
     anim = FuncAnimation(fig, update, frames=total_frames, interval=50, blit=True)
     plt.show()
 
+# Command-line options; with --algorithm and --no-plots nothing blocks on input or a window
+def parse_args():
+    import argparse
+    p = argparse.ArgumentParser(description="BFS/DFS maze solving (Lab 6)")
+    p.add_argument("maze_file", nargs="?", help="Maze as text, .png or .npy (default: the lab maze)")
+    p.add_argument("--algorithm", choices=['bfs', 'dfs', 'bibfs'], help="Skip the interactive prompt")
+    p.add_argument("--no-plots", dest="plots", action="store_false", help="Do not open plot windows")
+    p.add_argument("--save", help="Write the search animation to this .gif/.mp4 instead of showing it")
+    p.add_argument("--mmap", action="store_true", help="Memory-map .npy mazes instead of loading them")
+    return p.parse_args()
+
 # Main program
 if __name__ == "__main__":
-    # Convert maze to numerical grid
-    grid = to_numeric_grid(maze)
-    start = find_pos(grid, 2)
-    goal = find_pos(grid, 3)
+    args = parse_args()
+    # Convert maze to numerical grid (or load one: text, .png or .npy path as first argument)
+    grid = load_maze(args.maze_file, mmap=args.mmap) if args.maze_file else to_numeric_grid(maze)
+    start, goal = get_endpoints(grid)
     
     # Visualize initial maze
-    plt.figure(figsize=(10, 10))
-    plt.imshow(grid, cmap=maze_cmap, norm=maze_norm)
-    plt.title("Initial Maze")
-    plt.show()
+    if args.plots and not args.save:
+        plt.figure(figsize=(10, 10))
+        plt.imshow(grid, cmap=maze_cmap, norm=maze_norm)
+        plt.title("Initial Maze")
+        plt.show()
     
     # Prompt user for algorithm choice
-    algorithm = input("Choose algorithm (BFS or DFS): ").strip().lower()
-    while algorithm not in ['bfs', 'dfs']:
-        print("Invalid choice. Please enter 'bfs' or 'dfs'.")
-        algorithm = input("Choose algorithm (BFS or DFS): ").strip().lower()
+    algorithm = args.algorithm
+    if algorithm is None:
+        algorithm = input("Choose algorithm (BFS, DFS or BIBFS): ").strip().lower()
+        while algorithm not in ['bfs', 'dfs', 'bibfs']:
+            print("Invalid choice. Please enter 'bfs', 'dfs' or 'bibfs'.")
+            algorithm = input("Choose algorithm (BFS, DFS or BIBFS): ").strip().lower()
     
     # Solve maze and get results
     path, visit_order, path_length, exec_time = solve_maze(grid, algorithm)
@@ -210,5 +235,5 @@ if __name__ == "__main__":
         print("No path found!")
     
     # Animate search process with final frame hold
-    if path:
-        animate_search(grid, start, goal, visit_order, path, algorithm)
\ No newline at end of file
+    if path and (args.plots or args.save):
+        animate_search(grid, start, goal, visit_order, path, algorithm, save_path=args.save)
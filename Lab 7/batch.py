@@ -0,0 +1,112 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from bucket_astar import GridAStar
+from padded_grid import pad_passable
+
+# Many (start, goal) queries on one maze. The padded passability grid is written to shared
+# memory once; every worker attaches to it and keeps a single GridAStar whose scratch arrays
+# are reused by all of its queries. Queries are sorted by goal so a chunk mostly reuses the
+# same heuristic table, shipped as index chunks, and the results are put back in query order.
+
+_worker = None  # (GridAStar, SharedMemory) for this worker process
+
+
+def _attach(name, rows, cols):
+    global _worker
+    shm = shared_memory.SharedMemory(name=name)
+    _worker = (GridAStar.from_padded(shm.buf, rows, cols), shm)
+
+
+def _detach():
+    global _worker
+    astar, shm = _worker
+    _worker = None
+    del astar
+    shm.close()
+
+
+def _solve_chunk(chunk, lengths_only):
+    astar = _worker[0]
+    out = []
+    for sr, sc, gr, gc in chunk.tolist():
+        path, _ = astar.search((sr, sc), (gr, gc), record_visits=False)
+        if lengths_only:
+            out.append(-1 if path is None else len(path) - 1)
+        else:
+            out.append(path)
+    return out
+
+
+# queries: (N, 4) array-like of start_row, start_col, goal_row, goal_col.
+# Returns paths (lists of (row, col) or None) in query order, or with lengths_only=True an
+# int32 array of path lengths in steps (-1 = unreachable).
+def batch_astar(maze, queries, workers=None, chunksize=256, lengths_only=False):
+    maze = np.asarray(maze)
+    queries = np.asarray(queries, dtype=np.int64).reshape(-1, 4)
+    rows, cols = maze.shape
+    workers = workers or os.cpu_count() or 1
+
+    order = np.lexsort((queries[:, 3], queries[:, 2]))
+    chunks = [queries[order[i:i + chunksize]] for i in range(0, len(order), chunksize)]
+
+    shm = shared_memory.SharedMemory(create=True, size=(rows + 2) * (cols + 2))
+    try:
+        pad_passable(maze, out=np.ndarray((rows + 2, cols + 2), dtype=np.uint8, buffer=shm.buf))
+        if workers == 1:
+            _attach(shm.name, rows, cols)
+            try:
+                parts = [_solve_chunk(c, lengths_only) for c in chunks]
+            finally:
+                _detach()
+        else:
+            with ProcessPoolExecutor(workers, initializer=_attach,
+                                     initargs=(shm.name, rows, cols)) as pool:
+                parts = list(pool.map(_solve_chunk, chunks, [lengths_only] * len(chunks)))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    flat = [r for part in parts for r in part]
+    if lengths_only:
+        result = np.empty(len(queries), dtype=np.int32)
+        result[order] = flat
+        return result
+    result = [None] * len(queries)
+    for i, r in zip(order.tolist(), flat):
+        result[i] = r
+    return result
+
+
+# Throughput check: python batch.py --size 501 --queries 20000 --workers 1 2 4 8
+if __name__ == "__main__":
+    import argparse
+    import time
+    from maze_gen import make_maze
+
+    p = argparse.ArgumentParser(description="Batch A* throughput on a generated maze")
+    p.add_argument("--size", type=int, default=501)
+    p.add_argument("--queries", type=int, default=20000)
+    p.add_argument("--goals", type=int, default=64, help="distinct goal cells among the queries")
+    p.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    p.add_argument("--chunksize", type=int, default=256)
+    p.add_argument("--seed", type=int, default=0)
+    args = p.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    maze = make_maze(args.size, args.size, 'kruskal', rng)
+    maze[rng.random(maze.shape) < 0.15] = 0  # add loops so paths are not unique
+    free = np.argwhere(maze != 1)
+    starts = free[rng.integers(len(free), size=args.queries)]
+    goals = free[rng.integers(len(free), size=args.goals)][rng.integers(args.goals, size=args.queries)]
+    queries = np.hstack([starts, goals])
+
+    base = None
+    for w in args.workers:
+        t0 = time.perf_counter()
+        lengths = batch_astar(maze, queries, workers=w, chunksize=args.chunksize, lengths_only=True)
+        dt = time.perf_counter() - t0
+        base = base or dt
+        print(f"workers={w:<3} {args.queries / dt:10.0f} queries/s  speedup {base / dt:5.2f}x"
+              f"  (mean length {lengths[lengths >= 0].mean():.1f})")
@@ -0,0 +1,151 @@
+from array import array
+from heapq import heappop, heappush
+import numpy as np
+from padded_grid import flat_cell, flat_index, pad_passable, steps4
+
+# A* for unit-cost 4-connected grids (same grids as lab7.astar: any value != 1 is passable).
+# g-scores, parents and the closed set are flat arrays sized once per maze and reset only
+# where a query touched them; the open list is a bucket (Dial) queue indexed by f, and within
+# an f bucket the entry with the highest g is popped first, which cuts ties short near the goal.
+# Build one GridAStar per maze and call search() for every query; update_cells() applies edits
+# in place, so the scratch arrays and the last goal's heuristic table outlive changes to the maze.
+class GridAStar:
+    def __init__(self, maze):
+        self.rows, self.cols = np.shape(maze)
+        self.width = self.cols + 2
+        # Walls around the border remove every bounds check from the inner loop
+        self._setup(bytearray(pad_passable(maze)))
+
+    # Build on an existing padded passability buffer (e.g. a shared-memory block) without copying it
+    @classmethod
+    def from_padded(cls, passable, rows, cols):
+        self = cls.__new__(cls)
+        self.rows, self.cols = rows, cols
+        self.width = cols + 2
+        self._setup(passable)
+        return self
+
+    # Per-maze scratch arrays, reused by every query and reset only where a query touched them
+    def _setup(self, passable):
+        self.passable = passable
+        n = (self.rows + 2) * self.width
+        self.g = array('i', [-1]) * n
+        self.parent = array('i', [-1]) * n
+        self.closed = bytearray(n)
+        self._h_goal = None
+        self._h = None
+
+    def _index(self, cell):
+        return flat_index(cell, self.width)
+
+    # Apply cell edits (value 1 = wall, anything else = passage); the next search() sees them
+    def update_cells(self, cells, values):
+        P = self.passable
+        for (r, c), v in zip(cells, np.broadcast_to(values, (len(cells),))):
+            if not (0 <= r < self.rows and 0 <= c < self.cols):
+                raise IndexError(f"cell {(r, c)} is outside the {self.rows}x{self.cols} maze")
+            P[self._index((r, c))] = int(v != 1)
+
+    def _cell(self, i):
+        return flat_cell(i, self.width)
+
+    # Manhattan distance to goal for every cell, computed once per goal with NumPy
+    def _heuristic(self, goal_index):
+        if self._h_goal != goal_index:
+            gr, gc = divmod(goal_index, self.width)
+            rows = np.abs(np.arange(self.rows + 2, dtype=np.int32) - gr)
+            cols = np.abs(np.arange(self.width, dtype=np.int32) - gc)
+            self._h_array = np.add.outer(rows, cols).astype(np.int32)
+            self._h = memoryview(self._h_array).cast('B').cast('i')
+            self._h_goal = goal_index
+        return self._h
+
+    # Same (path, visited) result as lab7.astar; record_visits=False skips building visited
+    def search(self, start, goal, record_visits=True):
+        P = self.passable
+        S, G = self._index(start), self._index(goal)
+        if not P[S] or not P[G]:
+            return None, []
+        h = self._heuristic(G)
+        g, parent, closed = self.g, self.parent, self.closed
+        steps = steps4(self.width)
+
+        touched = [S]
+        g[S] = 0
+        cur_f = fmax = h[S]
+        # f -> (stacks keyed by g, max-heap of those g values as negatives)
+        buckets = {cur_f: ({0: [S]}, [0])}
+        stacks, keys = buckets[cur_f]
+        visited = []
+        found = False
+        try:
+            while True:
+                if not keys:
+                    del buckets[cur_f]
+                    cur_f += 1
+                    while cur_f <= fmax and cur_f not in buckets:
+                        cur_f += 1
+                    if cur_f > fmax:
+                        break
+                    stacks, keys = buckets[cur_f]
+                    continue
+                cur_g = -keys[0]
+                stack = stacks[cur_g]
+                if not stack:
+                    heappop(keys)
+                    del stacks[cur_g]
+                    continue
+
+                i = stack.pop()
+                if closed[i] or g[i] != cur_g:
+                    continue  # stale entry, a cheaper one was pushed later
+                closed[i] = 1
+                if record_visits:
+                    visited.append(i)
+                if i == G:
+                    found = True
+                    break
+
+                ng = cur_g + 1
+                for d in steps:
+                    j = i + d
+                    if P[j] and not closed[j]:
+                        gj = g[j]
+                        if gj < 0 or ng < gj:
+                            if gj < 0:
+                                touched.append(j)
+                            g[j] = ng
+                            parent[j] = i
+                            fj = ng + h[j]
+                            b = buckets.get(fj)
+                            if b is None:
+                                b = buckets[fj] = ({}, [])
+                                if fj > fmax:
+                                    fmax = fj
+                            s = b[0].get(ng)
+                            if s is None:
+                                b[0][ng] = [j]
+                                heappush(b[1], -ng)
+                            else:
+                                s.append(j)
+
+            path = None
+            if found:
+                path = []
+                node = G
+                while node != S:
+                    path.append(self._cell(node))
+                    node = parent[node]
+                path.append(self._cell(S))
+                path.reverse()
+            return path, [self._cell(i) for i in visited]
+        finally:
+            for t in touched:
+                g[t] = -1
+                parent[t] = -1
+                closed[t] = 0
+
+# One-shot convenience with the lab7.astar signature. It sizes the scratch arrays and the
+# heuristic table for the whole maze on every call; for several queries keep a GridAStar.
+def bucket_astar(maze, start, goal):
+    return GridAStar(maze).search(start, goal)
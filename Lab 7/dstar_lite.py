@@ -0,0 +1,147 @@
+from array import array
+import heapq
+import numpy as np
+from padded_grid import flat_cell, flat_index, pad_passable, steps4
+
+INF = 1 << 30
+
+# D* Lite (Koenig & Likhachev) on the same grids as lab7.astar (any value != 1 is passable).
+# The search runs backwards from the goal, so g/rhs describe distance-to-goal and survive
+# both cell edits and the agent moving. After update_cells() only vertices whose distance
+# actually changed are re-expanded; path() then walks downhill in g from the current start.
+# g, rhs and the wall map are flat arrays over the wall-padded layout of padded_grid, like bucket_astar.
+class DStarLite:
+    def __init__(self, maze, start, goal):
+        self.rows, self.cols = np.shape(maze)
+        self.width = self.cols + 2
+        self.passable = bytearray(pad_passable(maze).tobytes())
+        n = len(self.passable)
+        self.g = array('i', [INF]) * n
+        self.rhs = array('i', [INF]) * n
+        self.steps = steps4(self.width)
+        self.start = self._index(start)
+        self.goal = self._index(goal)
+        self._last = self.start
+        self.km = 0
+        self.open = []        # heap of (k1, k2, vertex), stale entries skipped on pop
+        self.open_key = {}    # vertex -> its current key while it is in the open list
+        self.expanded = []    # cells expanded by the most recent repair
+        self.rhs[self.goal] = 0
+        self._push(self.goal)
+
+    def _index(self, cell):
+        return flat_index(cell, self.width)
+
+    def _cell(self, i):
+        return flat_cell(i, self.width)
+
+    def _key(self, u):
+        m = min(self.g[u], self.rhs[u])
+        ur, uc = divmod(u, self.width)
+        sr, sc = divmod(self.start, self.width)
+        return (m + abs(ur - sr) + abs(uc - sc) + self.km, m)
+
+    def _push(self, u):
+        key = self._key(u)
+        self.open_key[u] = key
+        heapq.heappush(self.open, (key[0], key[1], u))
+
+    # Recompute rhs(u) from its neighbours and put u in the open list iff it is inconsistent
+    def _update_vertex(self, u):
+        if u != self.goal:
+            best = INF
+            if self.passable[u]:
+                P, g = self.passable, self.g
+                for d in self.steps:
+                    v = u + d
+                    if P[v] and g[v] + 1 < best:
+                        best = g[v] + 1
+            self.rhs[u] = best
+        self.open_key.pop(u, None)
+        if self.g[u] != self.rhs[u]:
+            self._push(u)
+
+    def _top(self):
+        while self.open:
+            k1, k2, u = self.open[0]
+            if self.open_key.get(u) == (k1, k2):
+                return (k1, k2), u
+            heapq.heappop(self.open)
+        return (INF, INF), -1
+
+    def _compute(self):
+        g, rhs, P = self.g, self.rhs, self.passable
+        s = self.start
+        expanded = []
+        while True:
+            k_old, u = self._top()
+            if u < 0 or (k_old >= self._key(s) and rhs[s] == g[s]):
+                break
+            k_new = self._key(u)
+            if k_old < k_new:
+                self._push(u)
+                continue
+            heapq.heappop(self.open)
+            del self.open_key[u]
+            expanded.append(u)
+            if g[u] > rhs[u]:
+                g[u] = rhs[u]
+            else:
+                g[u] = INF
+                self._update_vertex(u)
+            for d in self.steps:
+                v = u + d
+                if P[v]:
+                    self._update_vertex(v)
+        self.expanded = [self._cell(i) for i in expanded]
+
+    # Apply cell edits (value 1 = wall, anything else = passage); repair happens lazily in path()
+    def update_cells(self, cells, values):
+        changed = []
+        for (r, c), v in zip(cells, np.broadcast_to(values, (len(cells),))):
+            i = self._index((r, c))
+            open_now = int(v != 1)
+            if self.passable[i] != open_now:
+                self.passable[i] = open_now
+                changed.append(i)
+        if not changed:
+            return
+        self.km += abs(self._last // self.width - self.start // self.width) + \
+            abs(self._last % self.width - self.start % self.width)
+        self._last = self.start
+        for i in changed:
+            self._update_vertex(i)
+            for d in self.steps:
+                if self.passable[i + d]:
+                    self._update_vertex(i + d)
+
+    # Move the agent; g/rhs are kept and only the heuristic offset km grows
+    def move_to(self, cell):
+        self.start = self._index(cell)
+
+    # Current shortest start -> goal path as a list of (row, col), or None when cut off
+    def path(self):
+        if not self.passable[self.start] or not self.passable[self.goal]:
+            return None
+        self._compute()
+        g, P = self.g, self.passable
+        u = self.start
+        if g[u] >= INF:
+            return None
+        path = [self._cell(u)]
+        while u != self.goal:
+            u = min((u + d for d in self.steps if P[u + d]), key=g.__getitem__)
+            path.append(self._cell(u))
+        return path
+
+    # Drive the planner from a stream of update batches: yields (path, expanded) after each
+    def replan(self, updates):
+        for cells, values in updates:
+            self.update_cells(cells, values)
+            yield self.path(), self.expanded
+
+
+# One-shot convenience with the lab7.astar signature
+def dstar_lite(maze, start, goal):
+    planner = DStarLite(maze, start, goal)
+    return planner.path(), planner.expanded
@@ -0,0 +1,252 @@
+from array import array
+import heapq
+import itertools
+from collections import defaultdict
+import numpy as np
+from padded_grid import padded_bytes, steps4
+
+# Hierarchical path-finding (HPA*) on the same grids as lab7.astar (any value != 1 is passable).
+# The grid is cut into cluster_size x cluster_size clusters. Each maximal open stretch of a
+# cluster border becomes one entrance (two for stretches of 6+ cells), i.e. a pair of abstract
+# nodes joined by a unit edge. Distances between the abstract nodes inside a cluster are found by a
+# BFS confined to that cluster, computed the first time a query reaches it (or all at
+# once with precompute()) and cached. A query connects start/goal to their cluster's nodes,
+# runs A* on the small abstract graph, then refines each hop with a local BFS. Paths are
+# near-optimal; edits rebuild only the touched clusters and their direct neighbours.
+class HPAStar:
+    def __init__(self, maze, cluster_size=16):
+        self.maze = np.array(maze, copy=True)
+        self.rows, self.cols = self.maze.shape
+        self.k = cluster_size
+        self.crows = -(-self.rows // self.k)
+        self.ccols = -(-self.cols // self.k)
+        self.cross = defaultdict(set)   # abstract node -> partner nodes across a border
+        self.borders = {}               # (cluster, neighbour to the right/below) -> [(a, b), ...]
+        self.intra = {}                 # cluster -> {node: {node: distance}}
+        self._refined = {}              # (a, b) -> cell path inside one cluster
+        self._blocks = {}               # cluster -> padded interior for the local BFS
+        for ci in range(self.crows):
+            for cj in range(self.ccols):
+                if cj + 1 < self.ccols:
+                    self._build_border((ci, cj), (ci, cj + 1))
+                if ci + 1 < self.crows:
+                    self._build_border((ci, cj), (ci + 1, cj))
+
+    def cluster_of(self, cell):
+        return (cell[0] // self.k, cell[1] // self.k)
+
+    def _bounds(self, cluster):
+        r0, c0 = cluster[0] * self.k, cluster[1] * self.k
+        return r0, min(r0 + self.k, self.rows), c0, min(c0 + self.k, self.cols)
+
+    def _open(self, r, c):
+        return self.maze[r, c] != 1
+
+    # Entrances on the border between cluster a and its right/lower neighbour b
+    def _build_border(self, a, b):
+        for x, y in self.borders.pop((a, b), []):
+            self.cross[x].discard(y)
+            self.cross[y].discard(x)
+            if not self.cross[x]: del self.cross[x]
+            if not self.cross[y]: del self.cross[y]
+        r0, r1, c0, c1 = self._bounds(a)
+        if b[1] > a[1]:  # vertical border: a's last column against b's first
+            pairs = [((r, c1 - 1), (r, c1)) for r in range(r0, r1)]
+        else:            # horizontal border: a's last row against b's first
+            pairs = [((r1 - 1, c), (r1, c)) for c in range(c0, c1)]
+        transitions = []
+        run = []
+        for x, y in pairs + [(None, None)]:
+            if x is not None and self._open(*x) and self._open(*y):
+                run.append((x, y))
+                continue
+            if run:
+                picks = [run[len(run) // 2]] if len(run) < 6 else [run[0], run[-1]]
+                transitions.extend(picks)
+                run = []
+        for x, y in transitions:
+            self.cross[x].add(y)
+            self.cross[y].add(x)
+        self.borders[(a, b)] = transitions
+
+    def _nodes(self, cluster):
+        ci, cj = cluster
+        nodes = set()
+        for key in (((ci, cj - 1), cluster), ((ci - 1, cj), cluster)):
+            nodes.update(y for _, y in self.borders.get(key, ()))
+        for key in ((cluster, (ci, cj + 1)), (cluster, (ci + 1, cj))):
+            nodes.update(x for x, _ in self.borders.get(key, ()))
+        return nodes
+
+    # Cluster interior as padded flat bytes (1 = open), cached until the cluster is edited
+    def _block(self, cluster):
+        blk = self._blocks.get(cluster)
+        if blk is None:
+            r0, r1, c0, c1 = self._bounds(cluster)
+            P, W = padded_bytes(self.maze[r0:r1, c0:c1])
+            blk = self._blocks[cluster] = (P, W, r0 - 1, c0 - 1)
+        return blk
+
+    # BFS from src that never leaves the cluster; returns {cell: distance} for the cells in
+    # `targets` (all reached cells when None) and the parent array for _local_path
+    def _local_bfs(self, src, cluster, targets=None, stop=None):
+        P, W, ro, co = self._block(cluster)
+        n = len(P)
+        dist = array('i', [-1]) * n
+        parent = array('i', [-1]) * n
+        queue = array('i', bytes(4 * n))
+        s = (src[0] - ro) * W + src[1] - co
+        t = -1 if stop is None else (stop[0] - ro) * W + stop[1] - co
+        dist[s] = 0
+        queue[0] = s
+        head, tail = 0, 1
+        steps = steps4(W)
+        while head < tail:
+            cur = queue[head]
+            head += 1
+            if cur == t:
+                break
+            d = dist[cur] + 1
+            for step in steps:
+                nxt = cur + step
+                if P[nxt] and dist[nxt] < 0:
+                    dist[nxt] = d
+                    parent[nxt] = cur
+                    queue[tail] = nxt
+                    tail += 1
+        if targets is None:
+            targets = [divmod(i, W) for i in queue[:tail]]
+            targets = [(r + ro, c + co) for r, c in targets]
+        out = {}
+        for cell in targets:
+            d = dist[(cell[0] - ro) * W + cell[1] - co]
+            if d >= 0:
+                out[cell] = d
+        return out, parent
+
+    def _intra(self, cluster):
+        table = self.intra.get(cluster)
+        if table is None:
+            nodes = self._nodes(cluster)
+            table = {}
+            for n in nodes:
+                dist, _ = self._local_bfs(n, cluster, targets=nodes)
+                del dist[n]
+                table[n] = dist
+            self.intra[cluster] = table
+        return table
+
+    # Fill every cluster's intra-distance table up front instead of lazily
+    def precompute(self):
+        for ci in range(self.crows):
+            for cj in range(self.ccols):
+                self._intra((ci, cj))
+
+    # Apply cell edits (value 1 = wall, 0 = passage) and rebuild only what they touch
+    def update_cells(self, cells, values):
+        touched = set()
+        for (r, c), v in zip(cells, np.broadcast_to(values, (len(cells),))):
+            self.maze[r, c] = v
+            touched.add(self.cluster_of((r, c)))
+        stale = set(touched)
+        for ci, cj in touched:
+            for nb in ((ci, cj - 1), (ci, cj + 1), (ci - 1, cj), (ci + 1, cj)):
+                if 0 <= nb[0] < self.crows and 0 <= nb[1] < self.ccols:
+                    a, b = min((ci, cj), nb), max((ci, cj), nb)
+                    self._build_border(a, b)
+                    stale.add(nb)
+        for cl in touched:
+            self._blocks.pop(cl, None)
+        for cl in stale:
+            self.intra.pop(cl, None)
+        self._refined = {key: p for key, p in self._refined.items()
+                         if self.cluster_of(key[0]) not in stale}
+
+    # Cell path from a to b without leaving `cluster`
+    def _local_path(self, a, b, cluster):
+        _, W, ro, co = self._block(cluster)
+        _, parent = self._local_bfs(a, cluster, targets=(), stop=b)
+        path = []
+        node = (b[0] - ro) * W + b[1] - co
+        while node >= 0:
+            r, c = divmod(node, W)
+            path.append((r + ro, c + co))
+            node = parent[node]
+        path.reverse()
+        return path
+
+    # Refinement of an intra-cluster abstract edge, cached until its cluster is rebuilt
+    def _refine(self, a, b):
+        path = self._refined.get((a, b))
+        if path is None:
+            path = self._refined[(a, b)] = self._local_path(a, b, self.cluster_of(a))
+        return path
+
+    # Same (path, visited) shape as lab7.astar; visited lists the abstract nodes expanded
+    def search(self, start, goal):
+        start, goal = tuple(map(int, start)), tuple(map(int, goal))
+        if not self._open(*start) or not self._open(*goal):
+            return None, []
+        cs, cg = self.cluster_of(start), self.cluster_of(goal)
+        s_nodes = self._nodes(cs)
+        s_links, _ = self._local_bfs(start, cs, targets=s_nodes | ({goal} if cs == cg else set()))
+        g_links, _ = self._local_bfs(goal, cg, targets=self._nodes(cg))
+        direct = s_links.pop(goal, None) if cs == cg else None
+        if direct is not None and goal in s_nodes:
+            s_links[goal] = direct
+
+        def h(cell):
+            return abs(cell[0] - goal[0]) + abs(cell[1] - goal[1])
+
+        START, GOAL = ('start',), ('goal',)
+        tie = itertools.count()  # keeps the heap from comparing cells with the START/GOAL markers
+        open_set = [(h(start), 0, next(tie), START)]
+        g_score = {START: 0}
+        came_from = {START: None}
+        closed = set()
+        visited = []
+        best = None
+        while open_set:
+            f, g, _, cur = heapq.heappop(open_set)
+            if cur in closed:
+                continue
+            if direct is not None and f >= direct:
+                break
+            closed.add(cur)
+            if cur == GOAL:
+                best = g
+                break
+            if cur == START:
+                edges = s_links.items()
+            else:
+                visited.append(cur)
+                edges = list(self._intra(self.cluster_of(cur)).get(cur, {}).items())
+                edges += [(p, 1) for p in self.cross.get(cur, ())]
+                if cur in g_links:
+                    edges.append((GOAL, g_links[cur]))
+            for nxt, w in edges:
+                tg = g + w
+                if nxt not in g_score or tg < g_score[nxt]:
+                    g_score[nxt] = tg
+                    came_from[nxt] = cur
+                    heapq.heappush(open_set, (tg + (0 if nxt == GOAL else h(nxt)), tg, next(tie), nxt))
+
+        if direct is not None and (best is None or direct <= best):
+            return self._local_path(start, goal, cs), visited
+        if best is None:
+            return None, visited
+
+        hops = []
+        node = came_from[GOAL]
+        while node != START:
+            hops.append(node)
+            node = came_from[node]
+        hops.reverse()
+        path = self._local_path(start, hops[0], cs)
+        for a, b in zip(hops, hops[1:]):
+            if b in self.cross.get(a, ()):
+                path.append(b)
+            else:
+                path.extend(self._refine(a, b)[1:])
+        path.extend(self._local_path(hops[-1], goal, cg)[1:])
+        return path, visited
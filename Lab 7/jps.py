@@ -0,0 +1,146 @@
+import heapq
+import math
+from padded_grid import flat_cell, flat_index, padded_bytes
+
+SQRT2 = math.sqrt(2)
+
+# Jump Point Search on the same grids as lab7.astar (any value != 1 is passable).
+# Same (path, visited) return shape: path is the full cell-by-cell route, visited lists the
+# expanded jump points in expansion order. diagonal=True allows 8-connected moves without
+# cutting corners (both orthogonal cells must be open) at cost sqrt(2).
+def jps(maze, start, goal, diagonal=False):
+    # Walls around the border remove every bounds check from the inner loops
+    P, width = padded_bytes(maze)
+    S, G = flat_index(start, width), flat_index(goal, width)
+    if not P[S] or not P[G]:
+        return None, []
+    gr, gc = divmod(G, width)
+
+    if diagonal:
+        def h(i):
+            r, c = divmod(i, width)
+            dr, dc = abs(r - gr), abs(c - gc)
+            return max(dr, dc) + (SQRT2 - 1) * min(dr, dc)
+    else:
+        def h(i):
+            r, c = divmod(i, width)
+            return abs(r - gr) + abs(c - gc)
+
+    # 4-connected jump: stop at the goal, at forced neighbours, and (moving vertically)
+    # wherever a horizontal jump from the cell would find something
+    def jump4(i, d):
+        perp = width if d in (1, -1) else 1
+        while True:
+            if not P[i]:
+                return -1
+            if i == G:
+                return i
+            if (P[i + perp] and not P[i + perp - d]) or (P[i - perp] and not P[i - perp - d]):
+                return i
+            if perp == 1 and (jump4(i + 1, 1) >= 0 or jump4(i - 1, -1) >= 0):
+                return i
+            i += d
+
+    def jump8(i, dr, dc):
+        dv = dr * width
+        while True:
+            if not P[i]:
+                return -1
+            if i == G:
+                return i
+            if dr and dc:
+                if jump8(i + dc, 0, dc) >= 0 or jump8(i + dv, dr, 0) >= 0:
+                    return i
+            elif dc:
+                if (P[i + width] and not P[i + width - dc]) or (P[i - width] and not P[i - width - dc]):
+                    return i
+            else:
+                if (P[i + 1] and not P[i + 1 - dv]) or (P[i - 1] and not P[i - 1 - dv]):
+                    return i
+            if not (P[i + dc] and P[i + dv]):
+                return -1
+            i += dv + dc
+
+    # Directions (dr, dc) worth jumping in from i, given the direction we arrived from
+    def successors(i, parent):
+        if parent is None:
+            if not diagonal:
+                return [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            dirs += [(dr, dc) for dr in (-1, 1) for dc in (-1, 1)
+                     if P[i + dr * width] and P[i + dc]]
+            return dirs
+        r, c = divmod(i, width)
+        pr, pc = divmod(parent, width)
+        dr = (r > pr) - (r < pr)
+        dc = (c > pc) - (c < pc)
+        if not diagonal:
+            return [(dr, dc), (dc, dr), (-dc, -dr)]
+        if dr and dc:
+            dirs = [(dr, 0), (0, dc)]
+            if P[i + dr * width] and P[i + dc]:
+                dirs.append((dr, dc))
+            return dirs
+        if dc:
+            dirs = [(0, dc), (1, 0), (-1, 0)]
+            if P[i + dc]:
+                dirs += [(s, dc) for s in (1, -1) if P[i + s * width]]
+            return dirs
+        dirs = [(dr, 0), (0, 1), (0, -1)]
+        if P[i + dr * width]:
+            dirs += [(dr, s) for s in (1, -1) if P[i + s]]
+        return dirs
+
+    def step_cost(a, b):
+        ar, ac = divmod(a, width)
+        br, bc = divmod(b, width)
+        dr, dc = abs(ar - br), abs(ac - bc)
+        return max(dr, dc) + (SQRT2 - 1) * min(dr, dc) if diagonal else dr + dc
+
+    open_set = [(h(S), 0, S)]
+    came_from = {S: None}
+    g_score = {S: 0}
+    closed = set()
+    visited = []
+    while open_set:
+        _, g, cur = heapq.heappop(open_set)
+        if cur in closed:
+            continue
+        closed.add(cur)
+        visited.append(flat_cell(cur, width))
+        if cur == G:
+            return _expand(came_from, cur, width), visited
+        for dr, dc in successors(cur, came_from[cur]):
+            if diagonal:
+                jp = jump8(cur + dr * width + dc, dr, dc)
+            else:
+                jp = jump4(cur + dr * width + dc, dr * width + dc)
+            if jp < 0 or jp in closed:
+                continue
+            tg = g + step_cost(cur, jp)
+            if jp not in g_score or tg < g_score[jp]:
+                g_score[jp] = tg
+                came_from[jp] = cur
+                heapq.heappush(open_set, (tg + h(jp), tg, jp))
+    return None, visited
+
+# Jump points back to the start, then fill in the straight/diagonal runs between them
+def _expand(came_from, end, width):
+    points = []
+    node = end
+    while node is not None:
+        points.append(node)
+        node = came_from[node]
+    points.reverse()
+    path = [flat_cell(points[0], width)]
+    for a, b in zip(points, points[1:]):
+        ar, ac = divmod(a, width)
+        br, bc = divmod(b, width)
+        dr = (br > ar) - (br < ar)
+        dc = (bc > ac) - (bc < ac)
+        r, c = ar, ac
+        while (r, c) != (br, bc):
+            r += dr
+            c += dc
+            path.append((r - 1, c - 1))
+    return path
@@ -1,3 +1,5 @@
+import sys
+from pathlib import Path
 import numpy as np
 import heapq
 import matplotlib.pyplot as plt
@@ -99,7 +101,9 @@ def astar(maze, start, goal):
                 heapq.heappush(open_set, (f, tg, nbr))
     return None, visited
 
-def animate_search(maze, start, goal, visit_order, path):
+def animate_search(maze, start, goal, visit_order, path, save_path=None, duration=10.0, background=False):
+    if save_path:
+        return export_search(maze, start, goal, visit_order, path, save_path, duration, background)
     fig, ax = plt.subplots(figsize=(6,6))
     vis = maze.copy()
     vis[start]=4
@@ -140,6 +144,17 @@ def animate_search(maze, start, goal, visit_order, path):
     plt.show()
     return anim 
 
+def export_search(maze, start, goal, visit_order, path, save_path, duration=10.0, background=False):
+    # headless, frame-batched GIF/MP4 export shared with Lab 6
+    lab6 = str(Path(__file__).resolve().parent.parent / "Lab 6")
+    if lab6 not in sys.path:
+        sys.path.append(lab6)
+    from render import render_in_background, render_search
+    render = render_in_background if background else render_search
+    codes = {"visited": 2, "path": 3, "start": 4, "goal": 5}
+    return render(maze, start, goal, visit_order, path, save_path, duration=duration,
+                  title="A* Search", codes=codes, cmap=maze_cmap, norm=maze_norm)
+
 if __name__ == "__main__":
     np.random.seed(42)
     maze = generate_maze(21,21)
@@ -147,9 +162,9 @@ if __name__ == "__main__":
     plot_maze(maze, start, goal, "Generated Maze")
 
     print("Running A*...")
-    t0 = time.time()
+    t0 = time.perf_counter()
     path, visited = astar(maze, start, goal)
-    t1 = time.time()
+    t1 = time.perf_counter()
     if path is None:
         print("No path found")
     else:
@@ -0,0 +1,231 @@
+from array import array
+import numpy as np
+
+# Perfect-maze generators for large grids. Same output convention as lab7.generate_maze
+# (odd dimensions, 1 = wall, 0 = passage) with rooms on odd coordinates, so
+# lab7.place_start_goal's (1, 1) and (rows-2, cols-2) are always rooms.
+# Every generator takes a seeded numpy Generator and records the carved passages as
+# "right of room k" / "below room k" ids, which are written into the grid in one vectorized step.
+
+RIGHT, DOWN, LEFT, UP = 0, 1, 2, 3
+
+
+# Refill-on-demand block of uniform floats, so hot loops do not call into NumPy per draw
+class _Uniform:
+    def __init__(self, rng, block=1 << 16):
+        self.rng = rng
+        self.block = block
+        self.buf = []
+
+    def __call__(self):
+        if not self.buf:
+            self.buf = self.rng.random(self.block).tolist()
+        return self.buf.pop()
+
+
+def _room_shape(rows, cols):
+    if rows % 2 == 0: rows += 1
+    if cols % 2 == 0: cols += 1
+    return rows, cols, (rows - 1) // 2, (cols - 1) // 2
+
+
+# A single row or column has no rooms; give the grid lab7.generate_maze does there, a corridor
+# through the centre cell over the cells of its parity ([[0]] for 1x1)
+def _corridor(rows, cols):
+    maze = np.ones((rows, cols), dtype=np.uint8)
+    n = maze.size
+    lo = (n // 2) % 2
+    maze.reshape(-1)[lo:n - lo] = 0
+    return maze
+
+
+# Turn carved room/edge ids into the final wall grid
+def _carve(rows, cols, R, C, right, down):
+    maze = np.ones((rows, cols), dtype=np.uint8)
+    maze[1:2 * R:2, 1:2 * C:2] = 0
+    right = np.frombuffer(right, dtype=np.int32) if len(right) else np.empty(0, np.int32)
+    down = np.frombuffer(down, dtype=np.int32) if len(down) else np.empty(0, np.int32)
+    maze[2 * (right // C) + 1, 2 * (right % C) + 2] = 0
+    maze[2 * (down // C) + 2, 2 * (down % C) + 1] = 0
+    return maze
+
+
+# Record the passage between room a and its neighbour in direction d
+def _record(right, down, a, d, C):
+    if d == RIGHT:
+        right.append(a)
+    elif d == LEFT:
+        right.append(a - 1)
+    elif d == DOWN:
+        down.append(a)
+    else:
+        down.append(a - C)
+
+
+# Neighbouring rooms of a as (room, direction) pairs
+def _neighbors(a, R, C):
+    i, j = divmod(a, C)
+    out = []
+    if j + 1 < C: out.append((a + 1, RIGHT))
+    if i + 1 < R: out.append((a + C, DOWN))
+    if j > 0: out.append((a - 1, LEFT))
+    if i > 0: out.append((a - C, UP))
+    return out
+
+
+# Randomized Prim's, like lab7.generate_maze but with O(1) swap-remove on the frontier
+def prim(rows, cols, rng):
+    rows, cols, R, C = _room_shape(rows, cols)
+    if R == 0 or C == 0:
+        return _corridor(rows, cols)
+    uniform = _Uniform(rng)
+    in_tree = bytearray(R * C)
+    right, down = array('i'), array('i')
+    start = (R // 2) * C + C // 2
+    in_tree[start] = 1
+    frontier = [(b << 2) | d for b, d in _neighbors(start, R, C)]  # (target room, direction)
+    while frontier:
+        k = int(uniform() * len(frontier))
+        frontier[k], frontier[-1] = frontier[-1], frontier[k]
+        edge = frontier.pop()
+        b, d = edge >> 2, edge & 3
+        if in_tree[b]:
+            continue
+        in_tree[b] = 1
+        _record(right, down, b, (d + 2) & 3, C)  # carve from b back towards the tree
+        for nb, nd in _neighbors(b, R, C):
+            if not in_tree[nb]:
+                frontier.append((nb << 2) | nd)
+    return _carve(rows, cols, R, C, right, down)
+
+
+# Iterative recursive-backtracker (long, winding corridors; no recursion limit)
+def backtracker(rows, cols, rng):
+    rows, cols, R, C = _room_shape(rows, cols)
+    if R == 0 or C == 0:
+        return _corridor(rows, cols)
+    uniform = _Uniform(rng)
+    visited = bytearray(R * C)
+    right, down = array('i'), array('i')
+    start = int(uniform() * R * C)
+    visited[start] = 1
+    stack = [start]
+    while stack:
+        a = stack[-1]
+        options = [(b, d) for b, d in _neighbors(a, R, C) if not visited[b]]
+        if not options:
+            stack.pop()
+            continue
+        b, d = options[int(uniform() * len(options))]
+        visited[b] = 1
+        _record(right, down, a, d, C)
+        stack.append(b)
+    return _carve(rows, cols, R, C, right, down)
+
+
+# Wilson's algorithm: loop-erased random walks give a uniform spanning tree (unbiased mazes);
+# slower than the others on huge grids because early walks wander a long time
+def wilson(rows, cols, rng):
+    rows, cols, R, C = _room_shape(rows, cols)
+    if R == 0 or C == 0:
+        return _corridor(rows, cols)
+    uniform = _Uniform(rng)
+    n = R * C
+    in_tree = bytearray(n)
+    go = bytearray(n)  # last direction taken out of each room during the current walk
+    right, down = array('i'), array('i')
+    in_tree[int(uniform() * n)] = 1
+    order = rng.permutation(n).tolist()
+    for s in order:
+        if in_tree[s]:
+            continue
+        a = s
+        while not in_tree[a]:  # overwrite on revisits = implicit loop erasure
+            nbrs = _neighbors(a, R, C)
+            b, d = nbrs[int(uniform() * len(nbrs))]
+            go[a] = d
+            a = b
+        a = s
+        while not in_tree[a]:
+            in_tree[a] = 1
+            d = go[a]
+            _record(right, down, a, d, C)
+            a += (1, C, -1, -C)[d]
+    return _carve(rows, cols, R, C, right, down)
+
+
+# Randomized Kruskal, vectorized: the spanning tree Kruskal builds from a random edge order is
+# the minimum spanning tree under those ranks, computed here with Boruvka rounds (each
+# component takes its lowest-rank outgoing edge) in O(log n) NumPy passes.
+def kruskal(rows, cols, rng):
+    rows, cols, R, C = _room_shape(rows, cols)
+    if R == 0 or C == 0:
+        return _corridor(rows, cols)
+    ids = np.arange(R * C, dtype=np.int32).reshape(R, C)
+    room = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])  # edge = right of / below room
+    kind = np.concatenate([np.zeros(R * (C - 1), np.int8), np.ones((R - 1) * C, np.int8)])
+    rank = rng.permutation(len(room)).astype(np.int32)
+    cu = room
+    cv = room + np.where(kind == 0, np.int32(1), np.int32(C))
+
+    m = R * C  # number of components; labels are kept compact in 0..m-1
+    chosen = []
+    while len(cu):
+        best = np.full(m, np.iinfo(np.int32).max, dtype=np.int32)
+        np.minimum.at(best, cu, rank)
+        np.minimum.at(best, cv, rank)
+        mine = best[cu] == rank
+        theirs = best[cv] == rank
+        take = mine | theirs
+        chosen.append((room[take], kind[take]))
+        # hook every component onto the one across its chosen edge (pairs that picked the
+        # same edge keep the smaller label as root), flatten, then relabel compactly
+        idx = np.arange(m, dtype=np.int32)
+        parent = idx.copy()
+        parent[cu[mine]] = cv[mine]
+        parent[cv[theirs]] = cu[theirs]
+        fix = (parent[parent] == idx) & (idx < parent)
+        parent[fix] = idx[fix]
+        while True:
+            nxt = parent[parent]
+            if np.array_equal(nxt, parent):
+                break
+            parent = nxt
+        is_root = parent == idx
+        label = (np.cumsum(is_root, dtype=np.int32) - 1)[parent]
+        m = int(is_root.sum())
+        cu, cv = label[cu], label[cv]
+        live = cu != cv
+        cu, cv, rank, room, kind = cu[live], cv[live], rank[live], room[live], kind[live]
+
+    rooms = np.concatenate([c[0] for c in chosen]) if chosen else np.empty(0, np.int32)
+    kinds = np.concatenate([c[1] for c in chosen]) if chosen else np.empty(0, np.int8)
+    return _carve(rows, cols, R, C, rooms[kinds == 0].tobytes(), rooms[kinds == 1].tobytes())
+
+
+ALGORITHMS = {'prim': prim, 'backtracker': backtracker, 'kruskal': kruskal, 'wilson': wilson}
+
+
+# Seeded entry point: make_maze(10001, 10001, 'kruskal', seed=0)
+def make_maze(rows, cols, algorithm='kruskal', seed=None):
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    return ALGORITHMS[algorithm](rows, cols, rng)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    p = argparse.ArgumentParser(description="Generate a large perfect maze as a uint8 .npy file")
+    p.add_argument("rows", type=int)
+    p.add_argument("cols", type=int)
+    p.add_argument("--algorithm", choices=sorted(ALGORITHMS), default='kruskal')
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out", default="maze.npy")
+    args = p.parse_args()
+
+    t0 = time.perf_counter()
+    maze = make_maze(args.rows, args.cols, args.algorithm, args.seed)
+    t1 = time.perf_counter()
+    np.save(args.out, maze)
+    print(f"{args.algorithm} {maze.shape[0]}x{maze.shape[1]} in {t1 - t0:.2f}s -> {args.out}")
@@ -0,0 +1,38 @@
+import numpy as np
+
+# Wall-padded flat layout shared by the grid engines (jps, bucket_astar, hpa, dstar_lite, batch).
+# The maze gets a one-cell border of walls, so cell (r, c) is flat index (r + 1) * width + c + 1,
+# its 4 neighbours are index + step for step in steps4(width), and inner loops need no bounds checks.
+
+# Passability (1 = open, i.e. any value != 1 in maze) with a wall border, shape (rows + 2, cols + 2).
+# `out` fills an existing buffer of that shape instead (e.g. a shared-memory block).
+def pad_passable(maze, out=None):
+    maze = np.asarray(maze)
+    rows, cols = maze.shape
+    if out is None:
+        out = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    else:
+        out[0] = out[-1] = 0
+        out[:, 0] = out[:, -1] = 0
+    out[1:-1, 1:-1] = maze != 1
+    return out
+
+
+# Padded passability as flat bytes (indexing gives plain ints) and its row width
+def padded_bytes(maze):
+    padded = pad_passable(maze)
+    return padded.tobytes(), padded.shape[1]
+
+
+# Flat offsets of the 4 neighbours: up, down, left, right, as in lab7.get_neighbors
+def steps4(width):
+    return (-width, width, -1, 1)
+
+
+def flat_index(cell, width):
+    return (int(cell[0]) + 1) * width + int(cell[1]) + 1
+
+
+def flat_cell(i, width):
+    r, c = divmod(i, width)
+    return (r - 1, c - 1)
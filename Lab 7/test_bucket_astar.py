@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+from bucket_astar import GridAStar, bucket_astar
+from lab7 import astar
+from maze_gen import make_maze
+
+
+def _open_cells(maze, rng, n):
+    cells = np.argwhere(maze != 1)
+    return [tuple(map(int, cells[k])) for k in rng.integers(len(cells), size=n)]
+
+
+# One searcher answers many queries and keeps agreeing with lab7.astar while the maze is edited
+@pytest.mark.parametrize("seed", range(6))
+def test_reused_searcher_matches_astar_across_edits(seed):
+    rng = np.random.default_rng(seed)
+    maze = make_maze(31, 41, "kruskal", seed)
+    searcher = GridAStar(maze)
+    for _ in range(15):
+        cells = [tuple(map(int, c)) for c in rng.integers((31, 41), size=(4, 2))]
+        values = rng.integers(2, size=4)
+        searcher.update_cells(cells, values)
+        for (r, c), v in zip(cells, values):
+            maze[r, c] = v
+        start, goal = _open_cells(maze, rng, 2)
+        path, _ = searcher.search(start, goal)
+        expected, _ = astar(maze, start, goal)
+        assert (path is None) == (expected is None)
+        if path is not None:
+            assert len(path) == len(expected)
+            assert path[0] == start and path[-1] == goal
+            assert all(maze[cell] != 1 for cell in path)
+        assert bucket_astar(maze, start, goal)[0] == path
+
+
+def test_update_cells_rejects_cells_outside_the_maze():
+    searcher = GridAStar(make_maze(5, 5, "prim", 0))
+    with pytest.raises(IndexError):
+        searcher.update_cells([(-1, 0)], 0)
+    with pytest.raises(IndexError):
+        searcher.update_cells([(2, 5)], 0)
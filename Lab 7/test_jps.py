@@ -0,0 +1,96 @@
+import heapq
+import math
+import numpy as np
+import pytest
+from lab7 import astar
+from jps import jps
+from maze_gen import ALGORITHMS, make_maze
+
+SQRT2 = math.sqrt(2)
+SEEDS = range(12)
+SIZES = (15, 31, 61)
+OPENINGS = (0.0, 0.1, 0.3)
+
+
+# Seeded maze_gen maze with a fraction of its walls knocked out, so there are loops,
+# several equal-cost routes and open 2x2 blocks that diagonal moves can use
+def _maze(algorithm, size, opening, seed):
+    maze = make_maze(size, size, algorithm, seed)
+    rng = np.random.default_rng(seed + 1000)
+    inner = maze[1:-1, 1:-1]
+    inner[(inner == 1) & (rng.random(inner.shape) < opening)] = 0
+    rows, cols = maze.shape
+    return maze, (1, 1), (rows - 2, cols - 2)
+
+
+# 8-connected Dijkstra reference: diagonal steps cost sqrt(2) and need both orthogonal cells open
+def _dijkstra8(maze, start, goal):
+    rows, cols = maze.shape
+    dist = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, (r, c) = heapq.heappop(heap)
+        if (r, c) == goal:
+            return d
+        if d > dist[(r, c)]:
+            continue
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                nr, nc = r + dr, c + dc
+                if (dr, dc) == (0, 0) or not (0 <= nr < rows and 0 <= nc < cols) or maze[nr, nc] == 1:
+                    continue
+                if dr and dc and (maze[r + dr, c] == 1 or maze[r, c + dc] == 1):
+                    continue
+                nd = d + (SQRT2 if dr and dc else 1.0)
+                if nd < dist.get((nr, nc), math.inf):
+                    dist[(nr, nc)] = nd
+                    heapq.heappush(heap, (nd, (nr, nc)))
+    return None
+
+
+# Check every step is a legal move and return the path's cost
+def _path_cost(maze, path, start, goal, diagonal):
+    assert path[0] == start and path[-1] == goal
+    cost = 0.0
+    for (r, c), (nr, nc) in zip(path, path[1:]):
+        assert maze[nr, nc] != 1, f"step onto wall at {(nr, nc)}"
+        dr, dc = nr - r, nc - c
+        assert max(abs(dr), abs(dc)) == 1, f"non-adjacent step {(r, c)} -> {(nr, nc)}"
+        if dr and dc:
+            assert diagonal, f"diagonal step {(r, c)} -> {(nr, nc)} in 4-connected mode"
+            assert maze[r + dr, c] != 1 and maze[r, c + dc] != 1, f"corner cut at {(r, c)} -> {(nr, nc)}"
+            cost += SQRT2
+        else:
+            cost += 1.0
+    return cost
+
+
+CASES = [(alg, size, opening, seed) for alg in sorted(ALGORITHMS) for size in SIZES
+         for opening in OPENINGS for seed in SEEDS]
+
+
+@pytest.mark.parametrize("algorithm,size,opening,seed", CASES)
+def test_jps_matches_astar(algorithm, size, opening, seed):
+    maze, start, goal = _maze(algorithm, size, opening, seed)
+    expected, _ = astar(maze, start, goal)
+    path, _ = jps(maze, start, goal)
+    assert expected is not None and path is not None
+    assert _path_cost(maze, path, start, goal, diagonal=False) == len(expected) - 1
+
+
+@pytest.mark.parametrize("algorithm,size,opening,seed", CASES)
+def test_jps_diagonal_matches_dijkstra(algorithm, size, opening, seed):
+    maze, start, goal = _maze(algorithm, size, opening, seed)
+    expected = _dijkstra8(maze, start, goal)
+    path, _ = jps(maze, start, goal, diagonal=True)
+    assert expected is not None and path is not None
+    assert _path_cost(maze, path, start, goal, diagonal=True) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_jps_unreachable_goal(diagonal):
+    maze, start, goal = _maze('kruskal', 15, 0.0, 0)
+    maze[goal[0] - 1, goal[1]] = maze[goal[0], goal[1] - 1] = 1
+    maze[goal[0] - 1, goal[1] - 1] = 1
+    path, _ = jps(maze, start, goal, diagonal=diagonal)
+    assert path is None
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+from lab7 import generate_maze
+from maze_gen import ALGORITHMS, make_maze
+
+# Sizes with a single row or column after rounding up to odd: no rooms at all
+THIN = [(r, c) for n in range(12) for r, c in ((n, 0), (n, 1), (0, n), (1, n))]
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+@pytest.mark.parametrize("rows,cols", THIN)
+def test_thin_sizes_match_generate_maze(algorithm, rows, cols):
+    maze = make_maze(rows, cols, algorithm, seed=0)
+    assert np.array_equal(maze, generate_maze(rows, cols))
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+@pytest.mark.parametrize("rows,cols", [(2, 2), (3, 3), (2, 3)])
+def test_single_room(algorithm, rows, cols):
+    maze = make_maze(rows, cols, algorithm, seed=0)
+    assert maze.shape == (3, 3)
+    assert maze.tolist() == [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+
+
+# Perfect maze: every room is reachable and passages form a tree (one fewer link than rooms)
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+@pytest.mark.parametrize("rows,cols", [(3, 9), (9, 3), (5, 5), (21, 31)])
+def test_small_mazes_are_spanning_trees(algorithm, rows, cols):
+    maze = make_maze(rows, cols, algorithm, seed=1)
+    rooms = maze[1::2, 1::2]
+    links = (maze[1::2, 2:-1:2] == 0).sum() + (maze[2:-1:2, 1::2] == 0).sum()
+    assert (rooms == 0).all()
+    assert links == rooms.size - 1
+    seen = {(1, 1)}
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack.pop()
+        for nr, nc in ((r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)):
+            if maze[nr, nc] == 0 and (nr, nc) not in seen:
+                seen.add((nr, nc))
+                stack.append((nr, nc))
+    assert len(seen) == (maze == 0).sum()
@@ -0,0 +1,310 @@
+from collections import OrderedDict
+import numpy as np
+from bdd import BDD, FALSE, TRUE
+from bitparallel import ALL, popcount, variable_words
+from logic_parser import ParseError, operands, parse
+
+BACKENDS = ("auto", "bdd", "bits")
+BITS_MAX_VARS = 20
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_CACHE_BYTES = 64 << 20
+BDD_COMPUTED_LIMIT = 1 << 20
+BDD_NODE_LIMIT = 1 << 21
+BDD_NODE_BYTES = 32
+
+
+class Interner:
+    def __init__(self):
+        self.table = {}
+        self.uid = {}
+        self.names = []
+        self.seen_names = set()
+
+    def __len__(self):
+        return len(self.table)
+
+    def _make(self, key, node):
+        canon = self.table.get(key)
+        if canon is None:
+            canon = node
+            self.table[key] = canon
+            self.uid[id(canon)] = len(self.uid)
+        return canon
+
+    def intern(self, tree):
+        memo = {}
+        stack = [(tree, False)]
+        while stack:
+            node, done = stack.pop()
+            if id(node) in memo:
+                continue
+            op = node[0]
+            if op in ("var", "const"):
+                if op == "var" and node[1] not in self.seen_names:
+                    self.seen_names.add(node[1])
+                    self.names.append(node[1])
+                memo[id(node)] = self._make(node, node)
+                continue
+            kids = operands(node)
+            if not done:
+                stack.append((node, True))
+                stack.extend((kid, False) for kid in kids if id(kid) not in memo)
+                continue
+            canon = [memo[id(kid)] for kid in kids]
+            if op in ("and", "or"):
+                canon = sorted({self.uid[id(c)]: c for c in canon}.items())
+                canon = [c for _, c in canon]
+                if len(canon) == 1:
+                    memo[id(node)] = canon[0]
+                    continue
+            key = (op,) + tuple(self.uid[id(c)] for c in canon)
+            memo[id(node)] = self._make(key, (op, *canon))
+        return memo[id(tree)]
+
+    def variables(self, node):
+        names = set()
+        stack = [node]
+        seen = set()
+        while stack:
+            n = stack.pop()
+            if id(n) in seen:
+                continue
+            seen.add(id(n))
+            if n[0] == "var":
+                names.add(n[1])
+            elif n[0] != "const":
+                stack.extend(n[1:])
+        return names
+
+
+class LRUCache:
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE, maxbytes=DEFAULT_CACHE_BYTES, sizeof=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof or (lambda value: getattr(value, "nbytes", BDD_NODE_BYTES))
+        self.data = OrderedDict()
+        self.sizes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.data.move_to_end(key)
+        return value
+
+    def clear(self):
+        self.data.clear()
+        self.sizes.clear()
+        self.nbytes = 0
+
+    def put(self, key, value):
+        size = self.sizeof(value)
+        if size > self.maxbytes:
+            return
+        if key in self.data:
+            self.nbytes -= self.sizes[key]
+        self.data[key] = value
+        self.sizes[key] = size
+        self.nbytes += size
+        self.data.move_to_end(key)
+        while len(self.data) > self.maxsize or self.nbytes > self.maxbytes:
+            old, _ = self.data.popitem(last=False)
+            self.nbytes -= self.sizes.pop(old)
+
+
+class BDDBackend:
+    name = "bdd"
+
+    def __init__(self, names, computed_limit=BDD_COMPUTED_LIMIT):
+        self.bdd = BDD(names)
+        self.nvars = len(self.bdd.names)
+        self.computed_limit = computed_limit
+
+    def var(self, name):
+        return self.bdd.var(name)
+
+    def const(self, value):
+        return TRUE if value else FALSE
+
+    def combine(self, op, args):
+        if len(self.bdd.computed) > self.computed_limit:
+            self.bdd.clear_cache()
+        if op == "not":
+            return self.bdd.neg(args[0])
+        r = args[0]
+        for arg in args[1:]:
+            r = self.bdd.apply(op, r, arg)
+        return r
+
+    def count(self, r):
+        return self.bdd.count(r)
+
+    def model(self, r):
+        return self.bdd.pick(r)
+
+
+class BitsBackend:
+    name = "bits"
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.nvars = n = len(self.names)
+        self.position = {name: n - 1 - i for i, name in enumerate(self.names)}
+        self.nwords = -(-(1 << n) // 64)
+        self.mask = np.full(self.nwords, ALL, dtype=np.uint64)
+        if n < 6:
+            self.mask[-1] = np.uint64((1 << (1 << n)) - 1)
+
+    def var(self, name):
+        words = variable_words(self.position[name], 0, self.nwords)
+        return np.broadcast_to(words, (self.nwords,)).copy() & self.mask
+
+    def const(self, value):
+        return self.mask.copy() if value else np.zeros(self.nwords, dtype=np.uint64)
+
+    def combine(self, op, args):
+        if op == "not":
+            return np.invert(args[0]) & self.mask
+        if op in ("and", "or"):
+            ufunc = np.bitwise_and if op == "and" else np.bitwise_or
+            out = ufunc(args[0], args[1])
+            for arg in args[2:]:
+                ufunc(out, arg, out=out)
+            return out
+        if op == "imp":
+            return (np.invert(args[0]) | args[1]) & self.mask
+        return np.invert(args[0] ^ args[1]) & self.mask
+
+    def count(self, r):
+        return popcount(r)
+
+    def model(self, r):
+        nonzero = np.flatnonzero(r)
+        if not len(nonzero):
+            return None
+        word = int(nonzero[0])
+        bits = int(r[word])
+        row = word * 64 + (bits & -bits).bit_length() - 1
+        n = len(self.names)
+        return {name: bool((row >> (n - 1 - i)) & 1) for i, name in enumerate(self.names)}
+
+
+# Bits tables are built per formula over that formula's own variables (so "a & b" costs 4 rows
+# however many names the file has) and cached under that variable set. BDD results share one
+# manager over every name; once it holds more than node_limit nodes it is replaced between
+# formulas, and results cached against the old one are no longer looked up.
+class BatchEvaluator:
+    def __init__(self, names, backend="auto", cache_size=DEFAULT_CACHE_SIZE, interner=None,
+                 cache_bytes=DEFAULT_CACHE_BYTES, node_limit=BDD_NODE_LIMIT):
+        if backend not in BACKENDS:
+            raise ValueError(f"unknown backend {backend!r}")
+        self.names = list(names)
+        self.mode = backend
+        self.node_limit = node_limit
+        self.bdd = None
+        self.bdd_resets = 0
+        self.interner = interner or Interner()
+        self.cache = LRUCache(cache_size, cache_bytes)
+
+    def backend_for(self, own):
+        if self.mode == "bits" or (self.mode == "auto" and len(own) <= BITS_MAX_VARS):
+            if len(own) > BITS_MAX_VARS:
+                raise ValueError(f"bits backend supports at most {BITS_MAX_VARS} variables, got {len(own)}")
+            names = tuple(name for name in self.names if name in own)
+            return BitsBackend(names), names
+        if self.bdd is None or len(self.bdd.bdd) > self.node_limit:
+            if self.bdd is not None:
+                self.bdd_resets += 1
+            self.bdd = BDDBackend(self.names)
+        return self.bdd, self.bdd_resets
+
+    def evaluate(self, node, backend, tag):
+        uid = self.interner.uid
+        local = {}
+        stack = [(node, False)]
+        while stack:
+            n, done = stack.pop()
+            key = uid[id(n)]
+            if key in local:
+                continue
+            if not done:
+                cached = self.cache.get((tag, key))
+                if cached is not None:
+                    local[key] = cached
+                    continue
+            op = n[0]
+            if op == "var":
+                r = backend.var(n[1])
+            elif op == "const":
+                r = backend.const(n[1])
+            elif not done:
+                stack.append((n, True))
+                stack.extend((kid, False) for kid in n[1:] if uid[id(kid)] not in local)
+                continue
+            else:
+                r = backend.combine(op, [local[uid[id(kid)]] for kid in n[1:]])
+            local[key] = r
+            self.cache.put((tag, key), r)
+        return local[uid[id(node)]]
+
+    def summarize(self, node):
+        own = self.interner.variables(node)
+        backend, tag = self.backend_for(own)
+        r = self.evaluate(node, backend, tag)
+        models = backend.count(r) >> (backend.nvars - len(own))
+        total = 1 << len(own)
+        model = backend.model(r)
+        if model is not None:
+            model = {name: value for name, value in model.items() if name in own}
+        status = "tautology" if models == total else "unsatisfiable" if models == 0 else "satisfiable"
+        return {"status": status, "models": models, "rows": total, "model": model}
+
+
+def read_formulas(source):
+    if isinstance(source, str):
+        with open(source, encoding="utf-8") as f:
+            yield from read_formulas(f)
+        return
+    for lineno, line in enumerate(source, 1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield lineno, text
+
+
+def load_batch(source, backend="auto", cache_size=DEFAULT_CACHE_SIZE, cache_bytes=DEFAULT_CACHE_BYTES):
+    interner = Interner()
+    formulas = []
+    for lineno, text in read_formulas(source):
+        try:
+            formulas.append((lineno, text, interner.intern(parse(text))))
+        except ParseError as e:
+            formulas.append((lineno, text, e))
+    return BatchEvaluator(interner.names, backend, cache_size, interner, cache_bytes), formulas
+
+
+def run_batch(evaluator, formulas):
+    for lineno, text, node in formulas:
+        if isinstance(node, ParseError):
+            yield lineno, text, {"status": "error", "error": str(node)}
+            continue
+        try:
+            yield lineno, text, evaluator.summarize(node)
+        except ValueError as e:
+            yield lineno, text, {"status": "error", "error": str(e)}
+
+
+def format_result(lineno, text, result):
+    if result["status"] == "error":
+        return f"{lineno}\terror\t-\t{text}\t{result['error']}"
+    return f"{lineno}\t{result['status']}\t{result['models']}/{result['rows']}\t{text}"
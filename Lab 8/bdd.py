@@ -0,0 +1,222 @@
+from logic_parser import parse, postorder
+
+FALSE, TRUE = 0, 1
+
+
+def _tree(expr):
+    return parse(expr) if isinstance(expr, str) else expr
+
+
+def appearance_order(*trees):
+    names = []
+    seen = set()
+    for tree in trees:
+        order, _, _ = postorder(tree)
+        for node in order:
+            if node[0] == "var" and node[1] not in seen:
+                seen.add(node[1])
+                names.append(node[1])
+    return names
+
+
+class BDD:
+    def __init__(self, names):
+        self.names = list(names)
+        self.level_of = {name: i for i, name in enumerate(self.names)}
+        n = len(self.names)
+        self.level = [n, n]
+        self.low = [FALSE, TRUE]
+        self.high = [FALSE, TRUE]
+        self.unique = {}
+        self.computed = {}
+
+    def __len__(self):
+        return len(self.level)
+
+    def node(self, level, low, high):
+        if low == high:
+            return low
+        key = (level, low, high)
+        u = self.unique.get(key)
+        if u is None:
+            u = len(self.level)
+            self.level.append(level)
+            self.low.append(low)
+            self.high.append(high)
+            self.unique[key] = u
+        return u
+
+    def var(self, name):
+        if name not in self.level_of:
+            self.level_of[name] = len(self.names)
+            self.names.append(name)
+            self.level[FALSE] = self.level[TRUE] = len(self.names)
+        return self.node(self.level_of[name], FALSE, TRUE)
+
+    def neg(self, u):
+        if u <= TRUE:
+            return 1 - u
+        key = ("not", u, u)
+        r = self.computed.get(key)
+        if r is None:
+            r = self.node(self.level[u], self.neg(self.low[u]), self.neg(self.high[u]))
+            self.computed[key] = r
+        return r
+
+    def apply(self, op, u, v):
+        if op == "and":
+            if u == FALSE or v == FALSE:
+                return FALSE
+            if u == TRUE or u == v:
+                return v
+            if v == TRUE:
+                return u
+        elif op == "or":
+            if u == TRUE or v == TRUE:
+                return TRUE
+            if u == FALSE or u == v:
+                return v
+            if v == FALSE:
+                return u
+        elif op == "xor":
+            if u == v:
+                return FALSE
+            if u == FALSE:
+                return v
+            if v == FALSE:
+                return u
+            if u == TRUE:
+                return self.neg(v)
+            if v == TRUE:
+                return self.neg(u)
+        elif op == "imp":
+            return self.apply("or", self.neg(u), v)
+        elif op == "iff":
+            return self.neg(self.apply("xor", u, v))
+        else:
+            raise ValueError(f"unknown operator {op!r}")
+        if u > v:
+            u, v = v, u
+        key = (op, u, v)
+        r = self.computed.get(key)
+        if r is not None:
+            return r
+        lu, lv = self.level[u], self.level[v]
+        top = min(lu, lv)
+        u0, u1 = (self.low[u], self.high[u]) if lu == top else (u, u)
+        v0, v1 = (self.low[v], self.high[v]) if lv == top else (v, v)
+        r = self.node(top, self.apply(op, u0, v0), self.apply(op, u1, v1))
+        self.computed[key] = r
+        return r
+
+    def build(self, expr):
+        tree = _tree(expr)
+        order, children, _ = postorder(tree)
+        result = {}
+        for node in order:
+            key = id(node)
+            if key in result:
+                continue
+            op = node[0]
+            if op == "var":
+                r = self.var(node[1])
+            elif op == "const":
+                r = TRUE if node[1] else FALSE
+            elif op == "not":
+                r = self.neg(result[id(children[key][0])])
+            else:
+                args = [result[id(kid)] for kid in children[key]]
+                r = args[0]
+                for arg in args[1:]:
+                    r = self.apply(op, r, arg)
+            result[key] = r
+        return result[id(tree)]
+
+    def clear_cache(self):
+        self.computed.clear()
+
+    def size(self, u):
+        seen = set()
+        stack = [u]
+        while stack:
+            x = stack.pop()
+            if x <= TRUE or x in seen:
+                continue
+            seen.add(x)
+            stack.append(self.low[x])
+            stack.append(self.high[x])
+        return len(seen)
+
+    def count(self, u, nvars=None):
+        n = len(self.names) if nvars is None else nvars
+        memo = {FALSE: 0, TRUE: 1}
+
+        def weighted(x, parent_level):
+            return memo[x] << (min(self.level[x], n) - parent_level - 1)
+
+        stack = [u]
+        while stack:
+            x = stack[-1]
+            if x in memo:
+                stack.pop()
+                continue
+            lo, hi = self.low[x], self.high[x]
+            if lo in memo and hi in memo:
+                stack.pop()
+                memo[x] = weighted(lo, self.level[x]) + weighted(hi, self.level[x])
+            else:
+                stack.extend(c for c in (lo, hi) if c not in memo)
+        return memo[u] << min(self.level[u], n)
+
+    def pick(self, u):
+        if u == FALSE:
+            return None
+        assignment = {}
+        while u > TRUE:
+            name = self.names[self.level[u]]
+            if self.low[u] != FALSE:
+                assignment[name] = False
+                u = self.low[u]
+            else:
+                assignment[name] = True
+                u = self.high[u]
+        return assignment
+
+    def cubes(self, u):
+        stack = [(u, {})]
+        while stack:
+            x, cube = stack.pop()
+            if x == FALSE:
+                continue
+            if x == TRUE:
+                yield cube
+                continue
+            name = self.names[self.level[x]]
+            stack.append((self.high[x], {**cube, name: True}))
+            stack.append((self.low[x], {**cube, name: False}))
+
+
+def _manager(*exprs):
+    trees = [_tree(e) for e in exprs]
+    bdd = BDD(appearance_order(*trees))
+    return bdd, [bdd.build(t) for t in trees]
+
+
+def satisfiable(expr):
+    bdd, (u,) = _manager(expr)
+    return bdd.pick(u)
+
+
+def tautology(expr):
+    _, (u,) = _manager(expr)
+    return u == TRUE
+
+
+def equivalent(a, b):
+    _, (u, v) = _manager(a, b)
+    return u == v
+
+
+def count_models(expr):
+    bdd, (u,) = _manager(expr)
+    return bdd.count(u)
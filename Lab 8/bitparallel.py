@@ -0,0 +1,118 @@
+import numpy as np
+from logic_parser import parse, postorder, variables
+
+ALL = np.uint64(0xFFFFFFFFFFFFFFFF)
+LOW_PATTERNS = [np.uint64(sum(1 << b for b in range(64) if (b >> k) & 1)) for k in range(6)]
+DEFAULT_CHUNK_ROWS = 1 << 22
+
+
+def _tree(expr):
+    return parse(expr) if isinstance(expr, str) else expr
+
+
+def variable_words(k, first_word, nwords):
+    if k < 6:
+        return np.full(nwords, LOW_PATTERNS[k], dtype=np.uint64)
+    if (first_word >> (k - 6)) == ((first_word + nwords - 1) >> (k - 6)):
+        return ALL if (first_word >> (k - 6)) & 1 else np.uint64(0)
+    words = np.arange(first_word, first_word + nwords, dtype=np.uint64)
+    bits = (words >> np.uint64(k - 6)) & np.uint64(1)
+    return np.where(bits.astype(bool), ALL, np.uint64(0))
+
+
+def eval_words(tree, names, first_word, nwords):
+    n = len(names)
+    position = {name: n - 1 - i for i, name in enumerate(names)}
+    order, children, parents = postorder(tree)
+
+    values = {}
+    owned = set()
+    var_cache = {}
+    for node in order:
+        key = id(node)
+        if key in values:
+            continue
+        op = node[0]
+        if op == "var":
+            name = node[1]
+            if name not in var_cache:
+                var_cache[name] = variable_words(position[name], first_word, nwords)
+            values[key] = var_cache[name]
+            continue
+        if op == "const":
+            values[key] = ALL if node[1] else np.uint64(0)
+            continue
+        kids = children[key]
+        args = [values[id(kid)] for kid in kids]
+        for kid in kids:
+            parents[id(kid)] -= 1
+        spare = [id(kid) for kid in kids if id(kid) in owned and parents[id(kid)] == 0]
+        out = values[spare[0]] if spare else None
+        if op == "not":
+            out = np.invert(args[0], out=out)
+        elif op in ("and", "or"):
+            ufunc = np.bitwise_and if op == "and" else np.bitwise_or
+            args.sort(key=lambda a: (a is out, np.ndim(a)), reverse=True)
+            acc = ufunc(args[0], args[1], out=out)
+            for arg in args[2:]:
+                acc = ufunc(acc, arg, out=acc if np.ndim(acc) else None)
+            out = acc
+        elif op == "imp":
+            out = np.bitwise_or(np.invert(args[0]), args[1], out=out)
+        else:
+            out = np.invert(np.bitwise_xor(args[0], args[1], out=out), out=out)
+        for kid in kids:
+            kid_key = id(kid)
+            if parents[kid_key] == 0:
+                values.pop(kid_key, None)
+                owned.discard(kid_key)
+        values[key] = out
+        if np.ndim(out):
+            owned.add(key)
+    result = values[id(tree)]
+    if np.ndim(result) and id(tree) in owned:
+        return result
+    return np.broadcast_to(np.asarray(result, dtype=np.uint64), (nwords,)).copy()
+
+
+def iter_chunks(expr, names=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    tree = _tree(expr)
+    if names is None:
+        names = variables(tree)
+    total = 1 << len(names)
+    chunk_words = max(1, chunk_rows // 64)
+    total_words = -(-total // 64)
+    for first_word in range(0, total_words, chunk_words):
+        nwords = min(chunk_words, total_words - first_word)
+        words = eval_words(tree, names, first_word, nwords)
+        first_row = first_word * 64
+        nrows = min(nwords * 64, total - first_row)
+        if nrows % 64:
+            words[-1] &= np.uint64((1 << (nrows % 64)) - 1)
+        yield first_row, words, nrows
+
+
+def popcount(words):
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    return int(np.unpackbits(words.view(np.uint8)).sum(dtype=np.int64))
+
+
+def unpack(words, nrows):
+    bits = np.unpackbits(words.astype("<u8").view(np.uint8), bitorder="little")
+    return bits[:nrows].astype(bool)
+
+
+def result_column(expr, names=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    parts = []
+    count = 0
+    nrows = 0
+    for _, words, rows in iter_chunks(expr, names, chunk_rows):
+        parts.append(words)
+        count += popcount(words)
+        nrows += rows
+    return np.concatenate(parts), nrows, count
+
+
+def count_true(expr, names=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    return sum(popcount(words) for _, words, _ in iter_chunks(expr, names, chunk_rows))
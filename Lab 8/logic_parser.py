@@ -0,0 +1,210 @@
+import re
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<iff><=>|<->|↔|⇔)
+  | (?P<imp>=>|->|→|⇒)
+  | (?P<lpar>\()
+  | (?P<rpar>\))
+  | (?P<not>¬|~|!)
+  | (?P<and>∧|&)
+  | (?P<or>∨|\|)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+""", re.VERBOSE)
+
+KEYWORDS = {"and": "and", "or": "or", "not": "not", "True": "const", "False": "const"}
+
+BINARY = {"iff": 1, "imp": 2, "or": 3, "and": 4}
+RIGHT_ASSOC = {"imp"}
+
+
+class ParseError(ValueError):
+    pass
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        m = TOKEN_RE.match(text, pos)
+        if not m:
+            raise ParseError(f"unexpected character {text[pos]!r} at position {pos}")
+        kind = m.lastgroup
+        value = m.group()
+        pos = m.end()
+        if kind == "ws":
+            continue
+        if kind == "name":
+            kind = KEYWORDS.get(value, "name")
+        tokens.append((kind, value, m.start()))
+    tokens.append(("end", "", len(text)))
+    return tokens
+
+
+class Parser:
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos]
+
+    def take(self, kind):
+        tok = self.tokens[self.pos]
+        if tok[0] != kind:
+            what = "end of expression" if tok[0] == "end" else repr(tok[1])
+            expected = {"rpar": "')'", "end": "end of expression"}.get(kind, kind)
+            raise ParseError(f"expected {expected} but found {what} at position {tok[2]}")
+        self.pos += 1
+        return tok
+
+    def parse(self):
+        node = self.binary(1)
+        self.take("end")
+        return node
+
+    def binary(self, min_prec):
+        left = self.unary()
+        while True:
+            kind = self.peek()[0]
+            prec = BINARY.get(kind)
+            if prec is None or prec < min_prec:
+                return left
+            self.pos += 1
+            right = self.binary(prec if kind in RIGHT_ASSOC else prec + 1)
+            left = (kind, left, right)
+
+    def unary(self):
+        depth = 0
+        while self.peek()[0] == "not":
+            self.pos += 1
+            depth += 1
+        node = self.atom()
+        for _ in range(depth):
+            node = ("not", node)
+        return node
+
+    def atom(self):
+        kind, value, pos = self.peek()
+        if kind == "name":
+            self.pos += 1
+            return ("var", value)
+        if kind == "const":
+            self.pos += 1
+            return ("const", value == "True")
+        if kind == "lpar":
+            self.pos += 1
+            node = self.binary(1)
+            self.take("rpar")
+            return node
+        what = "end of expression" if kind == "end" else repr(value)
+        raise ParseError(f"expected a variable, constant or '(' but found {what} at position {pos}")
+
+
+def parse(text):
+    return Parser(text).parse()
+
+
+def variables(node):
+    names = set()
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n[0] == "var":
+            names.add(n[1])
+        elif n[0] != "const":
+            stack.extend(n[1:])
+    return sorted(names)
+
+
+def _chain(node, op):
+    items = []
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n[0] == op:
+            stack.extend(reversed(n[1:]))
+        else:
+            items.append(n)
+    return items
+
+
+def operands(node):
+    op = node[0]
+    if op in ("and", "or"):
+        return _chain(node, op)
+    if op in ("var", "const"):
+        return []
+    return list(node[1:])
+
+
+def postorder(tree):
+    children = {}
+    parents = {}
+    order = []
+    stack = [(tree, False)]
+    while stack:
+        node, done = stack.pop()
+        if done:
+            order.append(node)
+            continue
+        key = id(node)
+        if key in children:
+            continue
+        kids = operands(node)
+        children[key] = kids
+        stack.append((node, True))
+        for kid in kids:
+            parents[id(kid)] = parents.get(id(kid), 0) + 1
+            stack.append((kid, False))
+    return order, children, parents
+
+
+def to_python(node, index=None):
+    op = node[0]
+    if op == "var":
+        return f"v[{index[node[1]]}]" if index is not None else node[1]
+    if op == "const":
+        return str(node[1])
+    if op == "not":
+        return f"(not {to_python(node[1], index)})"
+    if op in ("and", "or"):
+        return "(" + f" {op} ".join(to_python(n, index) for n in _chain(node, op)) + ")"
+    left, right = to_python(node[1], index), to_python(node[2], index)
+    if op == "imp":
+        return f"((not {left}) or {right})"
+    return f"({left} == {right})"
+
+
+def _closure(node, index):
+    op = node[0]
+    if op == "var":
+        i = index[node[1]]
+        return lambda v: v[i]
+    if op == "const":
+        c = node[1]
+        return lambda v: c
+    if op == "not":
+        f = _closure(node[1], index)
+        return lambda v: not f(v)
+    if op in ("and", "or"):
+        parts = [_closure(n, index) for n in _chain(node, op)]
+        if op == "and":
+            return lambda v: all(f(v) for f in parts)
+        return lambda v: any(f(v) for f in parts)
+    a, b = _closure(node[1], index), _closure(node[2], index)
+    if op == "imp":
+        return lambda v: (not a(v)) or b(v)
+    return lambda v: a(v) == b(v)
+
+
+def compile_expr(node, names=None):
+    if names is None:
+        names = variables(node)
+    index = {name: i for i, name in enumerate(names)}
+    try:
+        source = f"lambda v: bool({to_python(node, index)})"
+        return eval(compile(source, "<expr>", "eval"))
+    except (SyntaxError, RecursionError, MemoryError):
+        f = _closure(node, index)
+        return lambda v: bool(f(v))
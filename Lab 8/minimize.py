@@ -0,0 +1,149 @@
+import warnings
+import numpy as np
+from bitparallel import result_column, unpack
+from logic_parser import parse, variables
+
+MAX_VARS = 16
+SEARCH_BUDGET = 200_000
+
+
+def prime_implicants(minterms, n):
+    full = (1 << n) - 1
+    current = {(m, full) for m in minterms}
+    primes = set()
+    while current:
+        groups = {}
+        for value, mask in current:
+            groups.setdefault((mask, bin(value).count("1")), []).append(value)
+        merged = set()
+        combined = set()
+        for (mask, ones), values in groups.items():
+            partners = groups.get((mask, ones + 1))
+            if not partners:
+                continue
+            partner_set = set(partners)
+            for value in values:
+                for bit in range(n):
+                    b = 1 << bit
+                    if mask & b and not value & b and value | b in partner_set:
+                        merged.add((value, mask & ~b))
+                        combined.add((value, mask))
+                        combined.add((value | b, mask))
+        primes |= current - combined
+        current = merged
+    return sorted(primes, key=lambda p: (bin(p[1]).count("1"), p))
+
+
+def _covers(implicant, minterm):
+    value, mask = implicant
+    return minterm & mask == value
+
+
+def _greedy_cover(left, primes, covering, covered):
+    left = set(left)
+    picked = []
+    while left:
+        candidates = {i for m in left for i in covering[m]}
+        i = max(candidates, key=lambda i: (len(covered[i] & left), -bin(primes[i][1]).count("1"), -i))
+        picked.append(i)
+        left -= covered[i]
+    return picked
+
+
+def minimal_covers(minterms, n, limit=16, budget=SEARCH_BUDGET):
+    minterms = sorted(set(minterms))
+    if not minterms:
+        return [[]]
+    primes = prime_implicants(minterms, n)
+    covering = {m: [i for i, p in enumerate(primes) if _covers(p, m)] for m in minterms}
+
+    chosen = set()
+    for m, options in covering.items():
+        if len(options) == 1:
+            chosen.add(options[0])
+    remaining = [m for m in minterms if not any(_covers(primes[i], m) for i in chosen)]
+
+    cost = [bin(mask).count("1") for _, mask in primes]
+
+    # Petrick branch and bound: the greedy cover is the first upper bound, and a branch is cut
+    # once even the largest prime could not cover what is left in fewer picks than the best
+    covered = {}
+    for m in remaining:
+        for i in covering[m]:
+            covered.setdefault(i, set()).add(m)
+    widest = max(map(len, covered.values()), default=1)
+    greedy = _greedy_cover(remaining, primes, covering, covered)
+    best = [sorted(greedy)]
+    best_key = (len(greedy), sum(cost[i] for i in greedy))
+    nodes = 0
+    exhausted = False
+    # Depth-first over an explicit stack, since a large cover would outgrow the recursion limit
+    stack = [(remaining, frozenset(), 0)]
+    while stack:
+        nodes += 1
+        if nodes > budget:
+            exhausted = True
+            break
+        left, picked, lits = stack.pop()
+        if len(picked) + -(-len(left) // widest) > best_key[0]:
+            continue
+        if not left:
+            key = (len(picked), lits)
+            if key < best_key:
+                best, best_key = [sorted(picked)], key
+            elif key == best_key and len(best) < limit and sorted(picked) not in best:
+                best.append(sorted(picked))
+            continue
+        m = min(left, key=lambda x: len(covering[x]))
+        for i in reversed(covering[m]):
+            if i not in picked:
+                stack.append(([x for x in left if x not in covered[i]], picked | {i}, lits + cost[i]))
+
+    if exhausted:
+        warnings.warn(f"cover search stopped after {budget} nodes; the result may not be minimal",
+                      RuntimeWarning, stacklevel=2)
+    covers = []
+    seen = set()
+    for extra in best:
+        cover = tuple(sorted(chosen | set(extra)))
+        if cover not in seen:
+            seen.add(cover)
+            covers.append([primes[i] for i in cover])
+    return covers
+
+
+def implicant_to_expr(implicant, names):
+    value, mask = implicant
+    n = len(names)
+    terms = []
+    for i, name in enumerate(names):
+        b = 1 << (n - 1 - i)
+        if mask & b:
+            terms.append(name if value & b else f"not {name}")
+    if not terms:
+        return "True"
+    return " and ".join(terms)
+
+
+def cover_to_expr(cover, names):
+    if not cover:
+        return "False"
+    parts = [implicant_to_expr(p, names) for p in cover]
+    if len(parts) == 1:
+        return parts[0]
+    return " or ".join(f"({p})" if " and " in p else p for p in parts)
+
+
+def minterms_of(expr, names=None):
+    tree = parse(expr) if isinstance(expr, str) else expr
+    if names is None:
+        names = variables(tree)
+    if len(names) > MAX_VARS:
+        raise ValueError(f"Quine-McCluskey is limited to {MAX_VARS} variables, got {len(names)}")
+    words, nrows, _ = result_column(tree, names)
+    return np.flatnonzero(unpack(words, nrows)).tolist(), names
+
+
+def minimize(expr, limit=16, budget=SEARCH_BUDGET):
+    minterms, names = minterms_of(expr)
+    return [cover_to_expr(cover, names) for cover in minimal_covers(minterms, len(names), limit, budget)]
@@ -0,0 +1,136 @@
+import io
+import struct
+import numpy as np
+from bitparallel import DEFAULT_CHUNK_ROWS, iter_chunks, popcount, unpack
+from logic_parser import parse, variables
+
+FORMATS = ("text", "csv", "bits", "minterms")
+ROW_FILTERS = ("all", "true", "false")
+BITS_MAGIC = b"TTB1"
+BLOCK_BYTES = 1 << 22
+
+
+def _layout(names, fmt):
+    if fmt == "text":
+        widths = [max(len(name), 5) for name in names] + [len("Result")]
+        header = " | ".join(f"{name:<{w}}" for name, w in zip(names + ["Result"], widths))
+        separator = "-|-".join("-" * w for w in widths)
+        head = f"{header}\n{separator}\n"
+        cells = [(f"{'False':<{w}}".encode(), f"{'True':<{w}}".encode()) for w in widths]
+        joiner = b" | "
+    else:
+        widths = [1] * (len(names) + 1)
+        head = ",".join(names + ["Result"]) + "\n"
+        cells = [(b"0", b"1")] * len(widths)
+        joiner = b","
+    template = bytearray()
+    offsets = []
+    for i, w in enumerate(widths):
+        if i:
+            template += joiner
+        offsets.append(len(template))
+        template += b" " * w
+    template += b"\n"
+    return head.encode(), np.frombuffer(bytes(template), dtype=np.uint8), offsets, cells
+
+
+def _format_rows(rows, results, n, layout):
+    _, template, offsets, cells = layout
+    block = np.tile(template, (len(rows), 1))
+    columns = [(rows >> (n - 1 - i)) & 1 for i in range(n)] + [results]
+    for bits, off, (false_cell, true_cell) in zip(columns, offsets, cells):
+        w = len(false_cell)
+        f = np.frombuffer(false_cell, dtype=np.uint8)
+        t = np.frombuffer(true_cell, dtype=np.uint8)
+        block[:, off:off + w] = np.where(bits.astype(bool)[:, None], t, f)
+    return block.tobytes()
+
+
+class _TextSink:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, data):
+        self.stream.write(data.decode())
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _open(out):
+    if isinstance(out, io.TextIOBase):
+        out.flush()
+        buffer = getattr(out, "buffer", None)
+        return (buffer if buffer is not None else _TextSink(out)), False
+    if hasattr(out, "write"):
+        return out, False
+    return open(out, "wb", buffering=BLOCK_BYTES), True
+
+
+def write_table(expr, out, fmt="text", rows="all", chunk_rows=DEFAULT_CHUNK_ROWS):
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    if rows not in ROW_FILTERS:
+        raise ValueError(f"unknown row filter {rows!r}; expected one of {', '.join(ROW_FILTERS)}")
+    if fmt == "bits" and rows != "all":
+        raise ValueError("the bits format stores the whole result column; use rows='all'")
+    tree = parse(expr) if isinstance(expr, str) else expr
+    names = variables(tree)
+    n = len(names)
+    stream, owned = _open(out)
+    written = 0
+    true_rows = 0
+    try:
+        if fmt == "bits":
+            encoded = "\n".join(names).encode()
+            stream.write(BITS_MAGIC + struct.pack("<IQI", n, 1 << n, len(encoded)) + encoded)
+        elif fmt != "minterms":
+            layout = _layout(names, fmt)
+            stream.write(layout[0])
+            block_rows = max(64, BLOCK_BYTES // len(layout[1]))
+
+        for first_row, words, nrows in iter_chunks(tree, names, chunk_rows):
+            true_rows += popcount(words)
+            if fmt == "bits":
+                stream.write(words.astype("<u8").tobytes())
+                written += nrows
+                continue
+            results = unpack(words, nrows)
+            if rows == "all":
+                selected = None
+                count = nrows
+            else:
+                selected = np.flatnonzero(results if rows == "true" else ~results) + first_row
+                count = len(selected)
+            written += count
+            if fmt == "minterms":
+                if count:
+                    if selected is None:
+                        selected = np.arange(first_row, first_row + nrows)
+                    stream.write(("\n".join(map(str, selected.tolist())) + "\n").encode())
+                continue
+            for start in range(0, count, block_rows):
+                stop = min(start + block_rows, count)
+                if selected is None:
+                    idx = np.arange(first_row + start, first_row + stop, dtype=np.int64)
+                    res = results[start:stop]
+                else:
+                    idx = selected[start:stop].astype(np.int64)
+                    res = np.full(stop - start, rows == "true")
+                stream.write(_format_rows(idx, res, n, layout))
+    finally:
+        if owned:
+            stream.close()
+        else:
+            stream.flush()
+    return written, true_rows
+
+
+def read_bits(path):
+    with open(path, "rb") as f:
+        if f.read(4) != BITS_MAGIC:
+            raise ValueError(f"{path} is not a bit-packed truth table")
+        n, nrows, name_len = struct.unpack("<IQI", f.read(16))
+        names = f.read(name_len).decode().split("\n") if name_len else []
+        words = np.frombuffer(f.read(), dtype="<u8").astype(np.uint64)
+    return names, words, nrows
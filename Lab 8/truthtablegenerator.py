@@ -1,92 +1,120 @@
-from itertools import product
+import argparse
+import sys
+from batch import BACKENDS, DEFAULT_CACHE_BYTES, DEFAULT_CACHE_SIZE, format_result, load_batch, run_batch
+from bdd import BDD, FALSE, TRUE, appearance_order
+from logic_parser import ParseError, compile_expr, parse, to_python, variables as extract_vars
+from minimize import MAX_VARS, minimize
+from table_writer import FORMATS, ROW_FILTERS, write_table
 
 def extract_var(expr):
-    keywords = {"and", "or", "not", "True", "False"}
-    spaced_symbols = ["(", ")", "⇒", "→", "↔", "<=>"]
-    
-    for symbol in spaced_symbols:
-        expr = expr.replace(symbol, " ")
-    tokens = expr.split()
-    variables = []
-
-    for token in tokens:
-        if token.isalpha() and token not in keywords and token not in variables:
-            variables.append(token)
-    return sorted(variables)
+    return extract_vars(parse(expr))
 
 def process(expr):
-    expr = expr.replace("¬", "not ")
-    expr = expr.replace("∧", "and")
-    expr = expr.replace("∨", "or")
-    expr = expr.replace("→", "=>").replace("⇒", "=>")
-    expr = expr.replace("↔", "<=>")
-
-    expr = expr.replace("<=>", " <=> ")  
-    expr = expr.replace("=>", " => ")
-
-    tokens = expr.split()
-    while "=>" in tokens:
-        idx = tokens.index("=>")
-        left = tokens[idx - 1]
-        right = tokens[idx + 1]
-        tokens[idx - 1:idx + 2] = [f"(not {left} or {right})"]
-    while "<=>" in tokens:
-        idx = tokens.index("<=>")
-        left = tokens[idx - 1]
-        right = tokens[idx + 1]
-        tokens[idx - 1:idx + 2] = [f"(({left} and {right}) or (not {left} and not {right}))"]
-    return " ".join(tokens)
+    return to_python(parse(expr))
 
 def evaluate(expr, values):
-    for var in values:
-        expr = expr.replace(var, str(values[var]))
     try:
-        return eval(expr)
-    except:
+        tree = parse(expr)
+        names = extract_vars(tree)
+        return compile_expr(tree, names)([values[name] for name in names])
+    except (ParseError, KeyError):
         return "Error"
     
 def generate_truth_table(expr):
-    original_expr = expr
-    processed_expr = process(original_expr)
-    variables = extract_var(original_expr)
+    try:
+        tree = parse(expr)
+    except ParseError as e:
+        print(f"Error parsing expression: {e}")
+        return
+    variables = extract_vars(tree)
 
     if not variables:
         print("No variables found in the expression.")
-        try:
-            result = eval(processed_expr)
-            print(f"Result: {result}")
-        except:
-            print("Error evaluating expression.")
+        print(f"Result: {compile_expr(tree)(())}")
         return
 
-    col_widths = [max(len(var), 5) for var in variables]
-    result_col_width = len("Result")
+    print("\nTruth Table:", flush=True)
+    _, true_rows = write_table(tree, sys.stdout)
+    print(f"\n{true_rows} of {1 << len(variables)} rows are true")
 
-    header_parts = [f"{var:<{col_widths[i]}}" for i, var in enumerate(variables)]
-    header = " | ".join(header_parts) + f" | {'Result':<{result_col_width}}"
-    
-    separator_parts = ["-" * width for width in col_widths]
-    separator = "-|-".join(separator_parts) + f"-|-{'-' * result_col_width}"
-
-    print("\nTruth Table:")
-    print(header)
-    print(separator)
+def analyze(expr):
+    try:
+        tree = parse(expr)
+    except ParseError as e:
+        print(f"Error parsing expression: {e}")
+        return
+    bdd = BDD(appearance_order(tree))
+    root = bdd.build(tree)
+    n = len(bdd.names)
+    models = bdd.count(root)
+    print(f"Variables: {n}, BDD nodes: {bdd.size(root)}")
+    print(f"Satisfying assignments: {models} of {1 << n}")
+    if root == TRUE:
+        print("The expression is a tautology.")
+    elif root == FALSE:
+        print("The expression is unsatisfiable.")
+    else:
+        witness = bdd.pick(root)
+        print("Example model: " + ", ".join(f"{k}={v}" for k, v in witness.items()))
+    if n <= MAX_VARS:
+        for cover in minimize(tree):
+            print(f"Minimal form: {cover}")
 
-    for combo in product([False, True], repeat=len(variables)):
-        values = dict(zip(variables, combo))
-        result = evaluate(processed_expr, values)
-        
-        row_parts = [f"{str(values[v]):<{col_widths[i]}}" for i, v in enumerate(variables)]
-        row = " | ".join(row_parts) + f" | {str(result):<{result_col_width}}"
-        print(row)
+def batch(path, out=None, backend="auto", cache_size=DEFAULT_CACHE_SIZE, cache_bytes=DEFAULT_CACHE_BYTES):
+    evaluator, formulas = load_batch(path, backend, cache_size, cache_bytes)
+    stream = open(out, "w", encoding="utf-8") if out else sys.stdout
+    try:
+        for result in run_batch(evaluator, formulas):
+            stream.write(format_result(*result) + "\n")
+    finally:
+        if out:
+            stream.close()
+    cache = evaluator.cache
+    print(f"{len(formulas)} formulas, {len(evaluator.interner)} distinct subformulas, "
+          f"{evaluator.mode} backend, cache {cache.hits} hits / {cache.misses} misses, "
+          f"{cache.nbytes / 2**20:.1f} MiB held, {evaluator.bdd_resets} BDD resets", file=sys.stderr)
 
 def main():
-    print("Enter a logical expression using: and, or, not, parentheses")
-    print("Example: (A and B) or not C\n")
+    parser = argparse.ArgumentParser(description="Print or export the truth table of a logical expression")
+    parser.add_argument("expression", nargs="?", help="expression to tabulate (prompted for when omitted)")
+    parser.add_argument("--out", help="write the table to this file instead of the terminal")
+    parser.add_argument("--format", choices=FORMATS, default="text")
+    parser.add_argument("--rows", choices=ROW_FILTERS, default="all", help="keep all rows, or only true/false ones")
+    parser.add_argument("--analyze", action="store_true", help="check satisfiability, count models and minimize instead of enumerating")
+    parser.add_argument("--batch", metavar="FILE", help="evaluate every formula in FILE (one per line) with shared subformulas")
+    parser.add_argument("--backend", choices=BACKENDS, default="auto", help="batch evaluation backend")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE, help="subformula results kept in the batch LRU cache")
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_CACHE_BYTES / 2**20, help="memory bound of the batch LRU cache in MiB")
+    args = parser.parse_args()
+
+    if args.batch:
+        try:
+            batch(args.batch, args.out, args.backend, args.cache_size, int(args.cache_mb * 2**20))
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
 
-    user_expr = input("Your expression: ")
+    user_expr = args.expression
+    if user_expr is None:
+        print("Enter a logical expression using: and, or, not, =>, <=>, parentheses")
+        print("Example: (A and B) or not C\n")
 
-    generate_truth_table(user_expr)
+        user_expr = input("Your expression: ")
+
+    if args.analyze:
+        analyze(user_expr)
+        return
+    if args.out is None and args.format == "text" and args.rows == "all":
+        generate_truth_table(user_expr)
+        return
+    try:
+        written, true_rows = write_table(user_expr, args.out or sys.stdout, args.format, args.rows)
+    except (ParseError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.out:
+        print(f"Wrote {written} rows to {args.out} ({true_rows} true)")
 
 if __name__== "__main__":
     main()
\ No newline at end of file
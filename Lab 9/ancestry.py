@@ -0,0 +1,229 @@
+ORDINALS = ["first", "second", "third", "fourth", "fifth", "sixth", "seventh", "eighth", "ninth", "tenth"]
+REMOVED = {1: "once", 2: "twice", 3: "thrice"}
+
+
+def _ordinal(n):
+    return ORDINALS[n - 1] if n <= len(ORDINALS) else f"{n}th"
+
+
+def _greats(n):
+    return "great-" * n if n <= 2 else f"{n}x great-"
+
+
+def relationship_label(dx, dy):
+    if dx == 0 and dy == 0:
+        return "self"
+    if dx == 0:
+        return "parent" if dy == 1 else _greats(dy - 2) + "grandparent"
+    if dy == 0:
+        return "child" if dx == 1 else _greats(dx - 2) + "grandchild"
+    if dx == 1 and dy == 1:
+        return "sibling"
+    if dx == 1:
+        return _greats(dy - 2) + "uncle or aunt"
+    if dy == 1:
+        return ("nephew or niece" if dx == 2 else _greats(dx - 3) + "grandnephew or grandniece")
+    label = f"{_ordinal(min(dx, dy) - 1)} cousin"
+    removed = abs(dx - dy)
+    if removed:
+        label += f" {REMOVED.get(removed, f'{removed} times')} removed"
+    return label
+
+
+class AncestryIndex:
+    def __init__(self, parent):
+        self.parent = parent
+        self.labels = None
+        self.levels = None
+        self.next_rank = 0
+
+    def invalidate(self):
+        self.labels = None
+        self.levels = None
+
+    # Labels are built by walking the parent relation through targets()/sources() and streamed
+    # roots()/nodes(), so only per-person labels are held, never the edge list
+    def build(self):
+        first = self._postorder(reverse=False)
+        second = self._postorder(reverse=True)
+        self.labels = {v: first[v] + second[v] for v in first}
+        self.levels = self._levels()
+        self.next_rank = len(first)
+
+    def _starts(self):
+        yield from self.parent.roots()
+        yield from self.parent.nodes()
+
+    def _levels(self):
+        targets, sources = self.parent.targets, self.parent.sources
+        levels = {}
+        indegree = {}
+        queue = list(self.parent.roots())
+        for v in queue:
+            levels[v] = 0
+        while queue:
+            v = queue.pop()
+            for c in targets(v):
+                levels[c] = max(levels.get(c, 0), levels[v] + 1)
+                left = indegree.pop(c, None)
+                left = (len(sources(c)) if left is None else left) - 1
+                if left:
+                    indegree[c] = left
+                else:
+                    queue.append(c)
+        for v in self.parent.nodes():
+            levels.setdefault(v, 0)
+        return levels
+
+    def _postorder(self, reverse):
+        targets = self.parent.targets
+        labels = {}
+        visited = set()
+        rank = 0
+
+        def kids(v):
+            found = list(targets(v))
+            return found[::-1] if reverse else found
+
+        for root in self._starts():
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, kids(root), 0)]
+            while stack:
+                v, children, i = stack[-1]
+                while i < len(children) and children[i] in visited:
+                    i += 1
+                if i < len(children):
+                    c = children[i]
+                    stack[-1] = (v, children, i + 1)
+                    visited.add(c)
+                    stack.append((c, kids(c), 0))
+                    continue
+                stack.pop()
+                lo = rank
+                for c in children:
+                    if c in labels:
+                        lo = min(lo, labels[c][0])
+                labels[v] = (lo, rank)
+                rank += 1
+        return labels
+
+    def _ensure(self):
+        if self.labels is None:
+            self.build()
+        return self.labels
+
+    def add(self, p, c):
+        labels = self.labels
+        if labels is None:
+            return
+        levels = self.levels
+        for v in (p, c):
+            if v not in labels:
+                labels[v] = (self.next_rank,) * 4
+                levels[v] = 0
+                self.next_rank += 1
+        stack = [c] if levels[c] <= levels[p] else []
+        levels[c] = max(levels[c], levels[p] + 1)
+        while stack:
+            v = stack.pop()
+            for d in self.parent.targets(v):
+                if levels[d] <= levels[v]:
+                    levels[d] = levels[v] + 1
+                    stack.append(d)
+        lc = labels[c]
+        stack = [p]
+        while stack:
+            v = stack.pop()
+            lv = labels[v]
+            widened = (min(lv[0], lc[0]), max(lv[1], lc[1]), min(lv[2], lc[2]), max(lv[3], lc[3]))
+            if widened != lv:
+                labels[v] = widened
+                stack.extend(self.parent.sources(v))
+
+    def _may_reach(self, a, b):
+        la, lb = self.labels.get(a), self.labels.get(b)
+        return (la is not None and lb is not None
+                and la[0] <= lb[0] and lb[1] <= la[1] and la[2] <= lb[2] and lb[3] <= la[3])
+
+    def is_ancestor(self, a, b):
+        self._ensure()
+        if a == b or not self._may_reach(a, b):
+            return False
+        level = self.levels[a]
+        if level >= self.levels[b]:
+            return False
+        seen = set()
+        stack = [b]
+        while stack:
+            for p in self.parent.sources(stack.pop()):
+                if p == a:
+                    return True
+                if p not in seen and self.levels[p] > level and self._may_reach(a, p):
+                    seen.add(p)
+                    stack.append(p)
+        return False
+
+    def generations(self, person):
+        dist = {person: 0}
+        frontier = [person]
+        while frontier:
+            nxt = []
+            for v in frontier:
+                for p in self.parent.sources(v):
+                    if p not in dist:
+                        dist[p] = dist[v] + 1
+                        nxt.append(p)
+            frontier = nxt
+        return dist
+
+    def ancestors(self, person):
+        dist = self.generations(person)
+        del dist[person]
+        return set(dist)
+
+    def descendants(self, person):
+        seen = set()
+        stack = [person]
+        while stack:
+            for c in self.parent.targets(stack.pop()):
+                if c not in seen:
+                    seen.add(c)
+                    stack.append(c)
+        return seen
+
+    def lowest_common_ancestors(self, x, y):
+        up_x = self.generations(x)
+        best = None
+        found = set()
+        dist = {y: 0}
+        frontier = [y]
+        depth = 0
+        while frontier:
+            nxt = []
+            for v in frontier:
+                if v in up_x:
+                    dx = up_x[v]
+                    key = (min(dx, depth), abs(dx - depth), dx, depth)
+                    if best is None or key < best:
+                        best, found = key, {v}
+                    elif key == best:
+                        found.add(v)
+                    continue
+                for p in self.parent.sources(v):
+                    if p not in dist:
+                        dist[p] = depth + 1
+                        nxt.append(p)
+            frontier = nxt
+            depth += 1
+        if best is None:
+            return None
+        return best[2], best[3], found
+
+    def relationship(self, x, y):
+        lca = self.lowest_common_ancestors(x, y)
+        if lca is None:
+            return None
+        dx, dy, found = lca
+        return relationship_label(dx, dy), found
@@ -0,0 +1,81 @@
+import csv
+import re
+
+GEDCOM_LINE_RE = re.compile(r"\s*(\d+)\s+(?:(@[^@]+@)\s+)?(\S+)(?:\s(.*))?")
+
+
+def person_key(name):
+    return '_'.join(name.replace('/', ' ').split()).lower()
+
+
+def read_pairs(path):
+    if str(path).lower().endswith(('.ged', '.gedcom')):
+        return read_gedcom(path)
+    return read_csv(path)
+
+
+def read_csv(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.reader(f):
+            row = [cell.strip() for cell in row]
+            if not row or not row[0] or row[0].startswith('#'):
+                continue
+            if len(row) >= 3:
+                relation, person1, person2 = (cell.lower() for cell in row[:3])
+                if relation == 'child':
+                    person1, person2 = person2, person1
+                elif relation != 'parent':
+                    continue
+            elif len(row) == 2:
+                person1, person2 = row
+                if person1.lower() == 'parent' and person2.lower() == 'child':
+                    continue
+            else:
+                continue
+            yield person_key(person1), person_key(person2)
+
+
+def read_gedcom(path):
+    keys = {}
+    taken = set()
+    unresolved = []
+    xref = tag = name = None
+    parents, children = [], []
+
+    def close_record():
+        if tag == 'INDI' and xref:
+            key = person_key(name) if name else ''
+            if not key or key in taken:
+                key = f"{key}_{xref.strip('@').lower()}" if key else xref.strip('@').lower()
+            taken.add(key)
+            keys[xref] = key
+        elif tag == 'FAM' and parents and children:
+            if all(ref in keys for ref in parents + children):
+                return [(keys[p], keys[c]) for p in parents for c in children]
+            unresolved.append((parents, children))
+        return []
+
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        for line in f:
+            m = GEDCOM_LINE_RE.match(line)
+            if not m:
+                continue
+            level, ref, field, value = m.groups()
+            value = (value or '').strip()
+            if level == '0':
+                yield from close_record()
+                xref, tag, name = ref, field.upper(), None
+                parents, children = [], []
+            elif level == '1' and tag == 'INDI' and field.upper() == 'NAME' and name is None:
+                name = value
+            elif level == '1' and tag == 'FAM' and field.upper() in ('HUSB', 'WIFE'):
+                parents.append(value)
+            elif level == '1' and tag == 'FAM' and field.upper() == 'CHIL':
+                children.append(value)
+        yield from close_record()
+
+    for parents, children in unresolved:
+        for p in parents:
+            for c in children:
+                if p in keys and c in keys:
+                    yield keys[p], keys[c]
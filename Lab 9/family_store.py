@@ -0,0 +1,172 @@
+import sqlite3
+from pathlib import Path
+
+
+class StoredRelation:
+    def __init__(self, conn, name='parent'):
+        self.conn = conn
+        self.name = name
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM parent").fetchone()[0]
+
+    def __contains__(self, pair):
+        row = self.conn.execute("SELECT 1 FROM parent WHERE parent = ? AND child = ?", pair).fetchone()
+        return row is not None
+
+    def __iter__(self):
+        return iter(self.conn.cursor().execute("SELECT parent, child FROM parent"))
+
+    def nodes(self):
+        return (r[0] for r in self.conn.cursor().execute("SELECT parent FROM parent UNION SELECT child FROM parent"))
+
+    def roots(self):
+        return (r[0] for r in self.conn.cursor().execute(
+            "SELECT DISTINCT p.parent FROM parent p "
+            "WHERE NOT EXISTS (SELECT 1 FROM parent q WHERE q.child = p.parent)"))
+
+    def add(self, a, b):
+        cur = self.conn.execute("INSERT OR IGNORE INTO parent (parent, child) VALUES (?, ?)", (a, b))
+        return cur.rowcount == 1
+
+    def targets(self, a):
+        return frozenset(r[0] for r in self.conn.execute("SELECT child FROM parent WHERE parent = ?", (a,)))
+
+    def sources(self, b):
+        return frozenset(r[0] for r in self.conn.execute("SELECT parent FROM parent WHERE child = ?", (b,)))
+
+
+class ClosureView:
+    UP = ("WITH RECURSIVE up(id) AS (SELECT parent FROM parent WHERE child = ? "
+          "UNION SELECT parent.parent FROM parent JOIN up ON parent.child = up.id) ")
+    DOWN = ("WITH RECURSIVE down(id) AS (SELECT child FROM parent WHERE parent = ? "
+            "UNION SELECT parent.child FROM parent JOIN down ON parent.parent = down.id) ")
+    ALL = ("WITH RECURSIVE closure(a, b) AS (SELECT parent, child FROM parent "
+           "UNION SELECT closure.a, parent.child FROM closure JOIN parent ON parent.parent = closure.b) "
+           "SELECT a, b FROM closure")
+
+    def __init__(self, conn, name='ancestor', reverse=False):
+        self.conn = conn
+        self.name = name
+        self.reverse = reverse
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, pair):
+        a, b = pair[::-1] if self.reverse else pair
+        row = self.conn.execute(self.UP + "SELECT 1 FROM up WHERE id = ? LIMIT 1", (b, a)).fetchone()
+        return row is not None
+
+    def __iter__(self):
+        for a, b in self.conn.cursor().execute(self.ALL):
+            yield (b, a) if self.reverse else (a, b)
+
+    def add(self, a, b):
+        raise ValueError(f"{self.name} is derived from parent facts")
+
+    def _up(self, b):
+        return frozenset(r[0] for r in self.conn.execute(self.UP + "SELECT id FROM up", (b,)))
+
+    def _down(self, a):
+        return frozenset(r[0] for r in self.conn.execute(self.DOWN + "SELECT id FROM down", (a,)))
+
+    def targets(self, a):
+        return self._up(a) if self.reverse else self._down(a)
+
+    def sources(self, b):
+        return self._down(b) if self.reverse else self._up(b)
+
+
+class FamilyStore:
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS people (
+            id   INTEGER PRIMARY KEY,
+            name TEXT    NOT NULL UNIQUE
+        );
+        CREATE TABLE IF NOT EXISTS parent (
+            parent INTEGER NOT NULL,
+            child  INTEGER NOT NULL,
+            PRIMARY KEY (parent, child)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS idx_parent_child ON parent (child, parent);
+    """
+
+    def __init__(self, path, batch_size=50000):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self.batch_size = batch_size
+        self.relation = StoredRelation(self.conn)
+        self.views = {'ancestor': ClosureView(self.conn), 'descendant': ClosureView(self.conn, 'descendant', True)}
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def id_of(self, name):
+        row = self.conn.execute("SELECT id FROM people WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def intern(self, name):
+        pid = self.id_of(name)
+        if pid is None:
+            pid = self.conn.execute("INSERT INTO people (name) VALUES (?)", (name,)).lastrowid
+        return pid
+
+    def names_of(self, ids):
+        ids = list(ids)
+        names = set()
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ','.join('?' * len(chunk))
+            names.update(r[0] for r in self.conn.execute(f"SELECT name FROM people WHERE id IN ({marks})", chunk))
+        return names
+
+    def all_names(self):
+        return {r[0] for r in self.conn.execute("SELECT name FROM people")}
+
+    def pairs(self):
+        return self.conn.execute(
+            "SELECT p.name, c.name FROM parent "
+            "JOIN people p ON p.id = parent.parent JOIN people c ON c.id = parent.child"
+        )
+
+    def bulk_insert(self, pairs):
+        before = len(self.relation)
+        seen = 0
+        with self.conn:
+            self.conn.execute("CREATE TEMP TABLE IF NOT EXISTS staging (parent TEXT NOT NULL, child TEXT NOT NULL)")
+            self.conn.execute("DELETE FROM staging")
+            batch = []
+            for pair in pairs:
+                batch.append(pair)
+                if len(batch) >= self.batch_size:
+                    self.conn.executemany("INSERT INTO staging VALUES (?, ?)", batch)
+                    seen += len(batch)
+                    batch = []
+            self.conn.executemany("INSERT INTO staging VALUES (?, ?)", batch)
+            seen += len(batch)
+            self.conn.execute(
+                "INSERT OR IGNORE INTO people (name) "
+                "SELECT parent FROM staging UNION SELECT child FROM staging"
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO parent (parent, child) "
+                "SELECT p.id, c.id FROM staging "
+                "JOIN people p ON p.name = staging.parent JOIN people c ON c.name = staging.child"
+            )
+            self.conn.execute("DROP TABLE staging")
+        return seen, len(self.relation) - before
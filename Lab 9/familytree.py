@@ -1,6 +1,65 @@
+import argparse
+
+from rules import EMPTY, RuleEngine, FAMILY_RULES
+from family_io import read_pairs
+from family_store import FamilyStore
+from ancestry import AncestryIndex
+
+
 class FamilyTree:
-    def __init__(self):
-        self.facts = set()
+    def __init__(self, rules=None, store=None):
+        self.ids = {}
+        self.names = []
+        self.store = store
+        base = {'parent': store.relation} if store is not None else None
+        # The default ancestor/descendant rules are answered by recursive SQL in store mode
+        views = store.views if store is not None and rules is None else None
+        self.engine = RuleEngine(FAMILY_RULES if rules is None else rules, relations=base,
+                                 materialize=store is None, views=views)
+        self.parent = self.engine.relations['parent']
+        self.ancestry = AncestryIndex(self.parent)
+
+    @property
+    def facts(self):
+        return {('parent', p1, p2) for p1, p2 in self._pairs()}
+
+    def _pairs(self):
+        if self.store is not None:
+            return self.store.pairs()
+        return ((self.names[a], self.names[b]) for a, b in self.parent)
+
+    def _id(self, person):
+        if self.store is not None:
+            return self.store.id_of(person)
+        return self.ids.get(person)
+
+    def _intern(self, person):
+        if self.store is not None:
+            return self.store.intern(person)
+        pid = self.ids.get(person)
+        if pid is None:
+            pid = len(self.names)
+            self.ids[person] = pid
+            self.names.append(person)
+        return pid
+
+    def _names(self, ids):
+        if self.store is not None:
+            return self.store.names_of(ids)
+        return {self.names[i] for i in ids}
+
+    def _parent_ids(self, pid):
+        return self.parent.sources(pid) if pid is not None else EMPTY
+
+    def _child_ids(self, pid):
+        return self.parent.targets(pid) if pid is not None else EMPTY
+
+    def _sibling_ids(self, pid):
+        siblings = set()
+        for parent in self._parent_ids(pid):
+            siblings |= self._child_ids(parent)
+        siblings.discard(pid)
+        return siblings
 
     def add_fact(self, relation, person1, person2):
         relation = relation.strip().lower()
@@ -15,80 +74,148 @@ class FamilyTree:
             print("❌ Only 'parent' or 'child' relationships allowed.")
             return
 
-        fact = (relation, person1, person2)
-        if fact not in self.facts:
-            self.facts.add(fact)
+        id1, id2 = self._intern(person1), self._intern(person2)
+        added = self.engine.add_fact('parent', id1, id2)
+        if added:
+            self.ancestry.add(id1, id2)
+        if self.store is not None:
+            self.store.commit()
+        if added:
             print(f"✅ Added: {person1.capitalize()} is parent of {person2.capitalize()}")
         else:
             print(f"⚠️ Fact already exists.")
 
+    def bulk_load(self, pairs):
+        pairs = ((p1.strip().lower(), p2.strip().lower()) for p1, p2 in pairs)
+        if self.store is not None:
+            seen, added = self.store.bulk_insert(pairs)
+            self.engine.invalidate()
+        else:
+            counter = [0]
+
+            def interned():
+                intern = self._intern
+                for p1, p2 in pairs:
+                    counter[0] += 1
+                    yield intern(p1), intern(p2)
+            added = self.engine.add_facts('parent', interned())
+            seen = counter[0]
+        self.ancestry.invalidate()
+        print(f"📥 Loaded {added} new fact(s), skipped {seen - added} duplicate(s).")
+        return added
+
+    def load_file(self, path):
+        try:
+            return self.bulk_load(read_pairs(path))
+        except OSError as e:
+            print(f"❌ Cannot read {path}: {e}")
+            return 0
+
     def get_children(self, person):
-        return {child for (rel, p, child) in self.facts if rel == 'parent' and p == person}
+        return self._names(self._child_ids(self._id(person)))
 
     def get_parents(self, person):
-        return {p for (rel, p, c) in self.facts if rel == 'parent' and c == person}
+        return self._names(self._parent_ids(self._id(person)))
 
     def is_sibling(self, person1, person2):
         if person1 == person2:
             return False
-        parents1 = self.get_parents(person1)
-        parents2 = self.get_parents(person2)
-        return len(parents1 & parents2) > 0
+        parents1 = self._parent_ids(self._id(person1))
+        parents2 = self._parent_ids(self._id(person2))
+        return not parents1.isdisjoint(parents2)
 
     def get_siblings(self, person):
-        all_people = self.get_all_people()
-        return {p for p in all_people if self.is_sibling(person, p)}
+        return self._names(self._sibling_ids(self._id(person)))
 
     def is_grandparent(self, grandparent, person):
-        parents = self.get_parents(person)
-        for parent in parents:
-            if grandparent in self.get_parents(parent):
-                return True
-        return False
+        gid = self._id(grandparent)
+        return any(gid in self._parent_ids(parent) for parent in self._parent_ids(self._id(person)))
+
+    def get_grandparents(self, person):
+        grandparents = set()
+        for parent in self._parent_ids(self._id(person)):
+            grandparents |= self._parent_ids(parent)
+        return self._names(grandparents)
 
     def get_grandchildren(self, person):
-        children = self.get_children(person)
         grandchildren = set()
-        for child in children:
-            grandchildren |= self.get_children(child)
-        return grandchildren
+        for child in self._child_ids(self._id(person)):
+            grandchildren |= self._child_ids(child)
+        return self._names(grandchildren)
 
     def is_uncle_or_aunt(self, uncle_or_aunt, person):
-        parents = self.get_parents(person)
-        for parent in parents:
-            if self.is_sibling(uncle_or_aunt, parent):
-                return True
-        return False
+        parents = self._parent_ids(self._id(person))
+        return not parents.isdisjoint(self._sibling_ids(self._id(uncle_or_aunt)))
+
+    def get_uncles_or_aunts(self, person):
+        result = set()
+        for parent in self._parent_ids(self._id(person)):
+            result |= self._sibling_ids(parent)
+        return self._names(result)
+
+    def get_nephews_or_nieces(self, person):
+        result = set()
+        for sibling in self._sibling_ids(self._id(person)):
+            result |= self._child_ids(sibling)
+        return self._names(result)
+
+    def is_ancestor(self, ancestor, person):
+        id1, id2 = self._id(ancestor), self._id(person)
+        return id1 is not None and id2 is not None and self.ancestry.is_ancestor(id1, id2)
+
+    def relationship(self, person1, person2):
+        person1, person2 = person1.strip().lower(), person2.strip().lower()
+        id1, id2 = self._id(person1), self._id(person2)
+        found = self.ancestry.relationship(id1, id2) if id1 is not None and id2 is not None else None
+        if found is None:
+            print(f"❌ {person1.capitalize()} and {person2.capitalize()} share no known ancestor.")
+            return None
+        label, ancestors = found
+        via = ', '.join(sorted(p.capitalize() for p in self._names(ancestors)))
+        print(f"Relationship: {person1.capitalize()} is {label} of {person2.capitalize()} (common ancestor: {via})")
+        return label
+
+    def _holds(self, relation, id1, id2):
+        if relation == 'ancestor':
+            return self.ancestry.is_ancestor(id1, id2)
+        if relation == 'descendant':
+            return self.ancestry.is_ancestor(id2, id1)
+        return self.engine.holds(relation, id1, id2)
+
+    def _sources(self, relation, pid):
+        if relation == 'ancestor':
+            return self.ancestry.ancestors(pid)
+        if relation == 'descendant':
+            return self.ancestry.descendants(pid)
+        return self.engine.sources(relation, pid)
 
     def get_all_people(self):
-        people = set()
-        for (_, p1, p2) in self.facts:
-            people.add(p1)
-            people.add(p2)
-        return people
+        if self.store is not None:
+            return self.store.all_names()
+        return set(self.names)
+
+    def relation_names(self):
+        return sorted(self.engine.relations)
+
+    def add_rule(self, text):
+        try:
+            rule = self.engine.add_rule(text)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return None
+        print(f"✅ Added rule: {rule}")
+        return rule
 
     def query(self, relation, person1, person2=None):
         person1 = person1.strip().lower()
         if person2:
             person2 = person2.strip().lower()
 
-        if relation == 'parent':
-            result = person2 in self.get_children(person1)
-        elif relation == 'child':
-            result = person2 in self.get_parents(person1)
-        elif relation == 'sibling':
-            result = self.is_sibling(person1, person2)
-        elif relation == 'grandparent':
-            result = self.is_grandparent(person1, person2)
-        elif relation == 'grandchild':
-            result = self.is_grandparent(person2, person1)
-        elif relation == 'uncle_or_aunt':
-            result = self.is_uncle_or_aunt(person1, person2)
-        elif relation == 'nephew_or_niece':
-            result = self.is_uncle_or_aunt(person2, person1)
-        else:
+        if relation not in self.engine.relations:
             print("❌ Unknown relation.")
             return False
+        id1, id2 = self._id(person1), self._id(person2)
+        result = id1 is not None and id2 is not None and self._holds(relation, id1, id2)
 
         print(f"Query: Is {person1.capitalize()} {relation.replace('_', ' ')} of {person2.capitalize()}?")
         print(f"Answer: {'✅ Yes' if result else '❌ No'}")
@@ -96,23 +223,11 @@ class FamilyTree:
 
     def list_relation(self, relation, person):
         person = person.strip().lower()
-        if relation == 'parent':
-            result = self.get_parents(person)
-        elif relation == 'child':
-            result = self.get_children(person)
-        elif relation == 'sibling':
-            result = self.get_siblings(person)
-        elif relation == 'grandparent':
-            result = {gp for gp in self.get_all_people() if self.is_grandparent(gp, person)}
-        elif relation == 'grandchild':
-            result = self.get_grandchildren(person)
-        elif relation == 'uncle_or_aunt':
-            result = {ua for ua in self.get_all_people() if self.is_uncle_or_aunt(ua, person)}
-        elif relation == 'nephew_or_niece':
-            result = {n for n in self.get_all_people() if self.is_uncle_or_aunt(person, n)}
-        else:
+        if relation not in self.engine.relations:
             print("❌ Unknown relation.")
             return
+        pid = self._id(person)
+        result = self._names(self._sources(relation, pid)) if pid is not None else set()
 
         formatted = ', '.join(sorted(p.capitalize() for p in result)) if result else "None"
         print(f"{relation.replace('_', ' ').capitalize()}(s) of {person.capitalize()}: {formatted}")
@@ -123,14 +238,15 @@ class FamilyTree:
         for (rel, p1, p2) in sorted(self.facts):
             print(f"  {p1.capitalize()} is {rel} of {p2.capitalize()}")
 
-def run_family_tree():
-    ft = FamilyTree()
+def run_family_tree(ft=None):
+    ft = ft if ft is not None else FamilyTree()
 
     print("👨‍👩‍👧 Family Tree Inference System")
     print("Type 'help' for available commands.")
 
     while True:
-        command = input("\n>>> ").strip().lower()
+        raw = input("\n>>> ").strip()
+        command = raw.lower()
 
         if command == 'exit':
             print("👋 Exiting.")
@@ -143,12 +259,15 @@ Available commands:
   add child [A] [B]      → A is child of B
   query [rel] [A] [B]    → Is A [rel] of B?
   list [rel] [A]         → List all [rel]s of A
+  relate [A] [B]         → Name the relationship of A to B, e.g. second cousin once removed
+  load [file]            → Bulk-import parent facts from a .csv or .ged file
+  rule [R(X, Y) :- ...]  → Declare a derived relation, e.g.
+                           rule second_cousin(X, Y) :- parent(A, X), cousin(A, B), parent(B, Y)
   show                   → Show all known facts
   exit                   → Quit the program
 
 Valid relations:
-  parent, child, sibling, grandparent, grandchild, uncle_or_aunt, nephew_or_niece
-""")
+  """ + ", ".join(ft.relation_names()) + "\n")
 
         elif command.startswith('add'):
             parts = command.split()
@@ -174,6 +293,28 @@ Valid relations:
             _, rel, p = parts
             ft.list_relation(rel, p)
 
+        elif command.startswith('relate'):
+            parts = command.split()
+            if len(parts) != 3:
+                print("⚠️ Usage: relate person1 person2")
+                continue
+            _, p1, p2 = parts
+            ft.relationship(p1, p2)
+
+        elif command.startswith('load'):
+            path = raw[len('load'):].strip()
+            if not path:
+                print("⚠️ Usage: load file.csv|file.ged")
+                continue
+            ft.load_file(path)
+
+        elif command.startswith('rule'):
+            text = raw[len('rule'):].strip()
+            if not text:
+                print("⚠️ Usage: rule head(X, Y) :- body(X, Z), ...")
+                continue
+            ft.add_rule(text)
+
         elif command == 'show':
             ft.print_all_facts()
 
@@ -182,7 +323,22 @@ Valid relations:
 
 
 def main():
-    run_family_tree()
+    parser = argparse.ArgumentParser(description="Family tree inference REPL")
+    parser.add_argument("--db", type=str, default=None,
+                        help="SQLite file to keep facts in across runs (default: in memory only)")
+    parser.add_argument("--load", type=str, nargs="*", default=[],
+                        help="CSV or GEDCOM files to bulk-import before starting")
+    args = parser.parse_args()
+
+    store = FamilyStore(args.db) if args.db else None
+    ft = FamilyTree(store=store)
+    for path in args.load:
+        ft.load_file(path)
+    try:
+        run_family_tree(ft)
+    finally:
+        if store is not None:
+            store.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
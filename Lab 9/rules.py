@@ -0,0 +1,320 @@
+import re
+
+ATOM_RE = re.compile(r"\s*([a-z_][a-z0-9_]*)\s*\(\s*([A-Z][A-Za-z0-9_]*)\s*,\s*([A-Z][A-Za-z0-9_]*)\s*\)\s*")
+NEQ_RE = re.compile(r"\s*([A-Z][A-Za-z0-9_]*)\s*!=\s*([A-Z][A-Za-z0-9_]*)\s*")
+EMPTY = frozenset()
+
+FAMILY_RULES = [
+    "child(X, Y) :- parent(Y, X)",
+    "sibling(X, Y) :- parent(P, X), parent(P, Y), X != Y",
+    "grandparent(X, Z) :- parent(X, Y), parent(Y, Z)",
+    "grandchild(X, Y) :- grandparent(Y, X)",
+    "uncle_or_aunt(X, Y) :- sibling(X, P), parent(P, Y)",
+    "nephew_or_niece(X, Y) :- uncle_or_aunt(Y, X)",
+    "cousin(X, Y) :- parent(A, X), sibling(A, B), parent(B, Y)",
+    "ancestor(X, Y) :- parent(X, Y)",
+    "ancestor(X, Z) :- parent(X, Y), ancestor(Y, Z)",
+    "descendant(X, Y) :- ancestor(Y, X)",
+]
+
+
+class Relation:
+    def __init__(self, name):
+        self.name = name
+        self.fwd = {}
+        self.bwd = {}
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, pair):
+        return pair[1] in self.fwd.get(pair[0], EMPTY)
+
+    def __iter__(self):
+        for a, bs in self.fwd.items():
+            for b in bs:
+                yield a, b
+
+    def add_many(self, pairs):
+        fwd, bwd = self.fwd, self.bwd
+        before = self.size
+        for a, b in pairs:
+            fwd.setdefault(a, set()).add(b)
+            bwd.setdefault(b, set()).add(a)
+        self.size = sum(len(targets) for targets in fwd.values())
+        return self.size - before
+
+    def add(self, a, b):
+        targets = self.fwd.setdefault(a, set())
+        if b in targets:
+            return False
+        targets.add(b)
+        self.bwd.setdefault(b, set()).add(a)
+        self.size += 1
+        return True
+
+    def nodes(self):
+        yield from self.fwd
+        yield from (b for b in self.bwd if b not in self.fwd)
+
+    def roots(self):
+        return (a for a in self.fwd if a not in self.bwd)
+
+    def targets(self, a):
+        return self.fwd.get(a, EMPTY)
+
+    def sources(self, b):
+        return self.bwd.get(b, EMPTY)
+
+
+class Rule:
+    def __init__(self, head, args, body, distinct=()):
+        self.head = head
+        self.args = args
+        self.body = body
+        self.distinct = distinct
+
+    def __repr__(self):
+        atoms = [f"{rel}({a}, {b})" for rel, a, b in self.body] + [f"{a} != {b}" for a, b in self.distinct]
+        return f"{self.head}({self.args[0]}, {self.args[1]}) :- {', '.join(atoms)}"
+
+
+def parse_rule(text):
+    head, sep, body = text.partition(":-")
+    m = ATOM_RE.fullmatch(head)
+    if not sep or not m:
+        raise ValueError(f"expected 'head(X, Y) :- body' but got {text!r}")
+    atoms = []
+    distinct = []
+    for part in re.split(r",(?![^(]*\))", body):
+        atom, neq = ATOM_RE.fullmatch(part), NEQ_RE.fullmatch(part)
+        if atom:
+            atoms.append(atom.groups())
+        elif neq:
+            distinct.append(neq.groups())
+        else:
+            raise ValueError(f"cannot parse {part.strip()!r} in rule {text!r}")
+    if not atoms:
+        raise ValueError(f"rule {text!r} has no body atoms")
+    bound = {v for _, a, b in atoms for v in (a, b)}
+    unbound = [v for v in m.groups()[1:] + tuple(v for pair in distinct for v in pair) if v not in bound]
+    if unbound:
+        raise ValueError(f"variable {unbound[0]} in rule {text!r} does not appear in the body")
+    return Rule(m.group(1), m.groups()[1:], atoms, distinct)
+
+
+class RuleEngine:
+    def __init__(self, rules=FAMILY_RULES, base=("parent",), relations=None, materialize=True, views=None):
+        relations = relations or {}
+        self.materialize = materialize
+        self.relations = {name: relations[name] if name in relations else Relation(name) for name in base}
+        self.base = set(base)
+        self.views = dict(views or {})
+        self.relations.update(self.views)
+        self.rules = []
+        self.active = self.base | set(self.views)
+        self.pending = {}
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule):
+        if isinstance(rule, str):
+            rule = parse_rule(rule)
+        if rule.head in self.base:
+            raise ValueError(f"cannot derive base relation {rule.head!r}")
+        self.rules.append(rule)
+        self.relations.setdefault(rule.head, Relation(rule.head))
+        for rel, _, _ in rule.body:
+            self.relations.setdefault(rel, Relation(rel))
+        if rule.head in self.active and rule.head not in self.views:
+            self._settle()
+            for rel, _, _ in rule.body:
+                if rel not in self.active:
+                    self._activate(rel)
+            self._saturate(self._fire_all([rule]))
+        return rule
+
+    def add_fact(self, relation, a, b):
+        if relation not in self.base:
+            raise ValueError(f"{relation!r} is not a base relation")
+        if not self.relations[relation].add(a, b):
+            return False
+        if self._reads_views():
+            self.invalidate()
+        else:
+            self.pending.setdefault(relation, set()).add((a, b))
+        return True
+
+    def add_facts(self, relation, pairs):
+        if relation not in self.base:
+            raise ValueError(f"{relation!r} is not a base relation")
+        added = self.relations[relation].add_many(pairs)
+        self.invalidate()
+        return added
+
+    def _reads_views(self):
+        return any(rel in self.views for rule in self.rules
+                   if rule.head in self.active and rule.head not in self.views for rel, _, _ in rule.body)
+
+    def invalidate(self):
+        self.pending = {}
+        for name in self.active - self.base - set(self.views):
+            self.relations[name] = Relation(name)
+        self.active = self.base | set(self.views)
+
+    def relation(self, name):
+        if name not in self.relations:
+            raise KeyError(name)
+        if name not in self.active:
+            self._activate(name)
+        self._settle()
+        return self.relations[name]
+
+    def holds(self, name, a, b):
+        if self._materialized(name):
+            return (a, b) in self.relation(name)
+        return bool(self._lookup(name, a, b))
+
+    def sources(self, name, b):
+        if self._materialized(name):
+            return self.relation(name).sources(b)
+        return {a for a, _ in self._lookup(name, None, b)}
+
+    def _materialized(self, name):
+        return self.materialize or name in self.active or self._recursive(name)
+
+    def _recursive(self, name):
+        seen = set()
+        stack = [rel for rule in self.rules if rule.head == name for rel, _, _ in rule.body]
+        while stack:
+            rel = stack.pop()
+            if rel == name:
+                return True
+            if rel in seen:
+                continue
+            seen.add(rel)
+            stack.extend(body_rel for rule in self.rules if rule.head == rel for body_rel, _, _ in rule.body)
+        return False
+
+    def _lookup(self, name, a, b):
+        if a is None and b is None or self._materialized(name):
+            relation = self.relation(name)
+            if a is not None and b is not None:
+                return [(a, b)] if (a, b) in relation else []
+            if a is not None:
+                return [(a, y) for y in relation.targets(a)]
+            if b is not None:
+                return [(x, b) for x in relation.sources(b)]
+            return relation
+        found = set()
+        for rule in self.rules:
+            if rule.head != name:
+                continue
+            x, y = rule.args
+            binding = {} if a is None else {x: a}
+            if b is not None:
+                if binding.get(y, b) != b:
+                    continue
+                binding[y] = b
+            for solution in self._solve(rule, rule.body, binding):
+                found.add((solution[x], solution[y]))
+        return found
+
+    def _solve(self, rule, atoms, binding):
+        if not atoms:
+            if all(binding[u] != binding[v] for u, v in rule.distinct):
+                yield binding
+            return
+        k = max(range(len(atoms)), key=lambda j: (atoms[j][1] in binding) + (atoms[j][2] in binding))
+        rel, x, y = atoms[k]
+        rest = atoms[:k] + atoms[k + 1:]
+        for a, b in self._lookup(rel, binding.get(x), binding.get(y)):
+            if x == y and a != b:
+                continue
+            yield from self._solve(rule, rest, {**binding, x: a, y: b})
+
+    def _dependencies(self, name):
+        needed = set()
+        stack = [name]
+        while stack:
+            rel = stack.pop()
+            if rel in needed or rel in self.active:
+                continue
+            needed.add(rel)
+            for rule in self.rules:
+                if rule.head == rel:
+                    stack.extend(body_rel for body_rel, _, _ in rule.body)
+        return needed
+
+    def _activate(self, name):
+        self._settle()
+        needed = self._dependencies(name)
+        self.active |= needed
+        self._saturate(self._fire_all([rule for rule in self.rules if rule.head in needed]))
+
+    def _settle(self):
+        if self.pending:
+            delta, self.pending = self.pending, {}
+            self._saturate(delta)
+
+    def _fire_all(self, rules):
+        derived = {}
+        for rule in rules:
+            rel, _, _ = rule.body[0]
+            self._fire(rule, 0, self.relations[rel], derived.setdefault(rule.head, set()))
+        return self._commit(derived)
+
+    def _saturate(self, delta):
+        while delta:
+            derived = {}
+            for rule in self.rules:
+                if rule.head not in self.active or rule.head in self.views:
+                    continue
+                for i, (rel, _, _) in enumerate(rule.body):
+                    if delta.get(rel):
+                        self._fire(rule, i, delta[rel], derived.setdefault(rule.head, set()))
+            delta = self._commit(derived)
+
+    def _commit(self, derived):
+        delta = {}
+        for name, pairs in derived.items():
+            relation = self.relations[name]
+            added = {pair for pair in pairs if relation.add(*pair)}
+            if added:
+                delta[name] = added
+        return delta
+
+    def _fire(self, rule, i, pairs, out):
+        _, x, y = rule.body[i]
+        rest = rule.body[:i] + rule.body[i + 1:]
+        head = self.relations[rule.head]
+        for a, b in pairs:
+            if x == y and a != b:
+                continue
+            self._join(rule, rest, {x: a, y: b}, head, out)
+
+    def _join(self, rule, atoms, binding, head, out):
+        if not atoms:
+            if all(binding[u] != binding[v] for u, v in rule.distinct):
+                pair = (binding[rule.args[0]], binding[rule.args[1]])
+                if pair not in head:
+                    out.add(pair)
+            return
+        k = max(range(len(atoms)), key=lambda j: (atoms[j][1] in binding) + (atoms[j][2] in binding))
+        rel, x, y = atoms[k]
+        rest = atoms[:k] + atoms[k + 1:]
+        relation = self.relations[rel]
+        if x in binding and y in binding:
+            if (binding[x], binding[y]) in relation:
+                self._join(rule, rest, binding, head, out)
+        elif x in binding:
+            for b in relation.targets(binding[x]):
+                self._join(rule, rest, {**binding, y: b}, head, out)
+        elif y in binding:
+            for a in relation.sources(binding[y]):
+                self._join(rule, rest, {**binding, x: a}, head, out)
+        else:
+            for a, b in relation:
+                if x != y or a == b:
+                    self._join(rule, rest, {**binding, x: a, y: b}, head, out)